@@ -10,7 +10,7 @@ import json
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 
-from models import db
+from models import db, get_resource_type
 from lib.resource_connectors.postgresql import PostgreSQLConnector
 from lib.resource_connectors.mariadb import MariaDBConnector
 from lib.resource_connectors.redis import RedisConnector
@@ -84,7 +84,7 @@ class ExternalOpsController:
         Raises:
             InvalidResourceError: If resource type not found
         """
-        resource_type = db.resource_types[resource_type_id]
+        resource_type = get_resource_type(db, resource_type_id)
         if not resource_type:
             raise InvalidResourceError(f"Resource type {resource_type_id} not found")
         return resource_type
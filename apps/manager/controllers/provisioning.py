@@ -24,7 +24,7 @@ import yaml
 from jinja2 import Environment, FileSystemLoader, TemplateNotFound
 from cryptography.fernet import Fernet
 
-from models import db
+from models import db, get_resource_type
 from lib.k8s_client import K8sClient, K8sException
 
 
@@ -285,8 +285,10 @@ class ProvisioningController:
 
             logger.info(f"Starting provisioning for resource: {resource.name} (ID: {resource_id})")
 
-            # Get resource type info
-            resource_type = db.resource_types[resource.resource_type_id]
+            # Get resource type info from the in-process cache
+            resource_type = get_resource_type(db, resource.resource_type_id)
+            if not resource_type:
+                raise ValueError(f"Resource type not found: {resource.resource_type_id}")
             resource_type_name = resource_type.name
 
             # Step 2: Validate resource type supports full lifecycle
@@ -20,13 +20,16 @@ DB_PASSWORD = os.getenv('DB_PASSWORD', 'nest')
 # Construct PostgreSQL connection string
 DB_URI = f'postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}'
 
-# Initialize DAL instance
+# Initialize DAL instance; tables are materialized on first access so
+# workers only pay for the tables they touch. Raw DDL never runs on
+# materialization; it is run once per deploy by models.migrations
 db = DAL(
     DB_URI,
     pool_size=10,
     migrate=True,
     fake_migrate=False,
     auto_import=False,
+    lazy_tables=True,
     check_reserved=['all']
 )
 
@@ -35,11 +38,30 @@ from .teams import define_teams
 from .users import define_users, define_team_memberships
 from .resources import (
     define_resource_types,
+    define_resource_types_cache,
+    get_resource_type,
     define_resources,
+    CAN_MODIFY_USERS,
+    CAN_MODIFY_CONFIG,
+    CAN_BACKUP,
+    CAN_SCALE,
+    TLS_ENABLED,
+    has_flag,
+    set_flag,
     define_resource_users,
+    RESOURCE_USERS_CHANNEL,
+    define_resource_user_roles,
+    set_resource_user_roles,
+    resource_users_with_role,
     define_resource_stats,
+    insert_resource_stats_batch,
+    copy_resource_stats,
+    copy_provisioning_jobs,
     define_backup_jobs,
-    define_provisioning_jobs
+    define_provisioning_jobs,
+    resources_by_team,
+    fetch_resources_expanded,
+    ExpandedResource,
 )
 from .certificates import define_certificate_authorities, define_certificates
 from .audit import define_audit_logs
@@ -51,6 +73,7 @@ define_team_memberships(db)
 define_resource_types(db)
 define_resources(db)
 define_resource_users(db)
+define_resource_user_roles(db)
 define_resource_stats(db)
 define_backup_jobs(db)
 define_provisioning_jobs(db)
@@ -61,6 +84,20 @@ define_audit_logs(db)
 # Commit schema if needed
 db.commit()
 
+# Load the resource type catalog into memory
+define_resource_types_cache(db)
+
+
+def preload_tables():
+    """Materialize every lazily defined table.
+
+    Used by models.migrations so PyDAL's table migrations run before the
+    raw DDL.
+    """
+    for tablename in db.tables:
+        db[tablename]
+    db.commit()
+
 __all__ = [
     'db',
     'DB_URI',
@@ -68,4 +105,22 @@ __all__ = [
     'DB_PORT',
     'DB_NAME',
     'DB_USER',
+    'preload_tables',
+    'get_resource_type',
+    'CAN_MODIFY_USERS',
+    'CAN_MODIFY_CONFIG',
+    'CAN_BACKUP',
+    'CAN_SCALE',
+    'TLS_ENABLED',
+    'has_flag',
+    'set_flag',
+    'resources_by_team',
+    'RESOURCE_USERS_CHANNEL',
+    'set_resource_user_roles',
+    'resource_users_with_role',
+    'insert_resource_stats_batch',
+    'copy_resource_stats',
+    'copy_provisioning_jobs',
+    'fetch_resources_expanded',
+    'ExpandedResource',
 ]
@@ -4,7 +4,7 @@ Audit Log Model
 Defines audit logging for compliance and security monitoring.
 """
 
-from pydal.validators import IS_NOT_EMPTY
+from .validators import NOT_EMPTY
 
 
 def define_audit_logs(db):
@@ -19,7 +19,7 @@ def define_audit_logs(db):
                  comment='User who performed the action'),
         db.Field('action', 'string',
                  length=100,
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='Action performed'),
         db.Field('resource_type', 'string',
                  length=100,
@@ -40,10 +40,8 @@ def define_audit_logs(db):
                  comment='Action timestamp'),
 
         indexes=[
-            ['user_id'],
             ['timestamp'],
             ['action'],
-            ['resource_type'],
             ['team_id'],
             ['user_id', 'timestamp'],
             ['resource_type', 'resource_id'],
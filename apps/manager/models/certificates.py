@@ -4,7 +4,16 @@ Certificates Models
 Defines certificate authorities and certificates for TLS/encryption.
 """
 
-from pydal.validators import IS_NOT_EMPTY, IS_IN_SET
+from .validators import NOT_EMPTY, VALID_CA_TYPE
+
+from .ddl import is_postgres, recency_index
+
+
+# PostgreSQL indexes the indexes= option cannot express, built by
+# models.migrations
+CERTIFICATE_AUTHORITIES_INDEX_DDL = (
+    recency_index('certificate_authorities', live=True),
+)
 
 
 def define_certificate_authorities(db):
@@ -13,18 +22,22 @@ def define_certificate_authorities(db):
     Args:
         db: PyDAL DAL instance
     """
+    # Newest-first lists skip soft-deleted rows; PostgreSQL gets a partial
+    # descending index from models.migrations, other dialects keep a full index
+    live_indexes = [] if is_postgres(db) else [['created_at']]
+
     db.define_table(
         'certificate_authorities',
         db.Field('name', 'string',
                  length=255,
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='CA name'),
         db.Field('type', 'string',
                  length=50,
-                 requires=IS_IN_SET(['root', 'intermediate', 'self_signed']),
+                 requires=VALID_CA_TYPE,
                  comment='Certificate Authority type'),
         db.Field('certificate', 'text',
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='PEM-encoded certificate'),
         db.Field('private_key', 'text',
                  comment='PEM-encoded private key'),
@@ -56,43 +69,56 @@ def define_certificate_authorities(db):
         db.Field('deleted_at', 'datetime',
                  comment='Soft delete timestamp'),
 
-        indexes=[
+        indexes=live_indexes + [
             ['name'],
             ['type'],
             ['serial_number'],
-            ['created_at'],
             ['is_nest_managed'],
         ],
 
         migrate=True,
         fake_migrate=False,
-        format='%(name)s'
+        format='%(name)s',
     )
 
 
+# PostgreSQL indexes the indexes= option cannot express, built by
+# models.migrations
+CERTIFICATES_INDEX_DDL = (
+    recency_index('certificates', live=True),
+    # Expiry window scan of the certificate rotation worker
+    "CREATE INDEX IF NOT EXISTS ix_certificates_valid_until_live "
+    "ON certificates (valid_until) WHERE deleted_at IS NULL",
+)
+
+
 def define_certificates(db):
     """Define the certificates table.
 
     Args:
         db: PyDAL DAL instance
     """
+    # Newest-first lists and expiry scans skip soft-deleted rows; PostgreSQL
+    # gets partial indexes from models.migrations, other dialects keep full indexes
+    live_indexes = [] if is_postgres(db) else [['created_at'], ['valid_until']]
+
     db.define_table(
         'certificates',
         db.Field('resource_id', 'reference resources',
                  ondelete='CASCADE',
                  comment='Resource reference'),
         db.Field('ca_id', 'reference certificate_authorities',
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='Issuing CA reference'),
         db.Field('certificate', 'text',
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='PEM-encoded certificate'),
         db.Field('private_key', 'text',
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='PEM-encoded private key'),
         db.Field('common_name', 'string',
                  length=255,
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='Certificate common name (CN)'),
         db.Field('san_dns', 'json',
                  comment='Subject Alternative Names (DNS)'),
@@ -111,6 +137,11 @@ def define_certificates(db):
         db.Field('renewal_threshold_days', 'integer',
                  default=30,
                  comment='Days before expiry to trigger renewal'),
+        db.Field('renewal_attempts', 'integer',
+                 default=0,
+                 comment='Consecutive failed renewal attempts'),
+        db.Field('next_renewal_attempt_at', 'datetime',
+                 comment='Earliest retry after a failed renewal'),
         db.Field('created_at', 'datetime',
                  default=db.current_timestamp,
                  comment='Creation timestamp'),
@@ -121,17 +152,15 @@ def define_certificates(db):
         db.Field('deleted_at', 'datetime',
                  comment='Soft delete timestamp'),
 
-        indexes=[
+        indexes=live_indexes + [
             ['resource_id'],
             ['ca_id'],
             ['common_name'],
             ['serial_number'],
-            ['valid_until'],
-            ['created_at'],
             ['auto_renew'],
         ],
 
         migrate=True,
         fake_migrate=False,
-        format='%(common_name)s'
+        format='%(common_name)s',
     )
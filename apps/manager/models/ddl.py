@@ -0,0 +1,152 @@
+"""
+Raw DDL Helpers
+
+Emits PostgreSQL-specific index DDL that the PyDAL ``indexes`` option cannot
+express, such as partial indexes, and picks dialect-specific field types.
+Index DDL is run ``CONCURRENTLY`` so deploy migrations do not lock writes.
+"""
+
+import re
+
+# Index DDL that PostgreSQL can run without blocking writes
+CONCURRENT_INDEX_DDL = re.compile(r'^(CREATE (?:UNIQUE )?INDEX|DROP INDEX) ', re.IGNORECASE)
+
+
+def is_postgres(db):
+    """Check whether the DAL instance is backed by PostgreSQL.
+
+    Args:
+        db: PyDAL DAL instance
+
+    Returns:
+        True if the adapter engine is PostgreSQL
+    """
+    return db._adapter.dbengine == 'postgres'
+
+
+def json_type(db):
+    """Get the JSON field type for the connected dialect.
+
+    PostgreSQL stores JSON as ``jsonb`` so containment queries can use GIN
+    indexes; other dialects fall back to PyDAL's ``json`` type.
+
+    Args:
+        db: PyDAL DAL instance
+
+    Returns:
+        PyDAL field type name
+    """
+    return 'jsonb' if is_postgres(db) else 'json'
+
+
+def binary_collation(table, column, sql_type):
+    """Build DDL switching a text column to the byte-wise "C" collation.
+
+    Meant for opaque ASCII values such as hashes and ciphertext, where
+    locale-aware collation only adds comparison cost. The change is skipped
+    when the column already uses "C", so the statement is safe to rerun.
+
+    Args:
+        table: Table name
+        column: Column name
+        sql_type: Current SQL type of the column, e.g. ``varchar(255)``
+
+    Returns:
+        DDL statement string
+    """
+    return (
+        "DO $$ BEGIN "
+        "IF NOT EXISTS (SELECT 1 FROM information_schema.columns "
+        f"WHERE table_name = '{table}' AND column_name = '{column}' "
+        "AND collation_name = 'C') THEN "
+        f'ALTER TABLE {table} ALTER COLUMN {column} TYPE {sql_type} COLLATE "C"; '
+        "END IF; END $$"
+    )
+
+
+def bigint_id(table):
+    """Build DDL widening a table's serial ``id`` primary key to bigint.
+
+    PyDAL creates ``id`` as a 32-bit ``SERIAL``; append-heavy tables outgrow
+    it. The column and its sequence are widened once, while the column is
+    still ``integer``, so the statement is safe to rerun.
+
+    Args:
+        table: Table name
+
+    Returns:
+        DDL statement string
+    """
+    return (
+        "DO $$ BEGIN "
+        "IF EXISTS (SELECT 1 FROM information_schema.columns "
+        f"WHERE table_name = '{table}' AND column_name = 'id' "
+        "AND data_type = 'integer') THEN "
+        f"ALTER TABLE {table} ALTER COLUMN id TYPE bigint; "
+        f"ALTER SEQUENCE {table}_id_seq AS bigint; "
+        "END IF; END $$"
+    )
+
+
+def recency_index(table, include=(), live=False):
+    """Build DDL for a ``created_at DESC`` index serving newest-first lists.
+
+    Args:
+        table: Table name
+        include: Extra columns stored in the index for index-only scans
+        live: Whether to index only rows that are not soft-deleted
+
+    Returns:
+        DDL statement string
+    """
+    statement = (
+        f"CREATE INDEX IF NOT EXISTS ix_{table}_created_at_desc "
+        f"ON {table} (created_at DESC)"
+    )
+    if include:
+        statement += f" INCLUDE ({', '.join(include)})"
+    if live:
+        statement += " WHERE deleted_at IS NULL"
+    return statement
+
+
+def execute_ddl(db, *statements):
+    """Execute raw DDL statements on PostgreSQL.
+
+    Statements run on every deploy, so they must be idempotent
+    (``IF NOT EXISTS``). CREATE/DROP INDEX statements are rewritten to their
+    ``CONCURRENTLY`` form and run outside a transaction. Other dialects are
+    skipped.
+
+    Args:
+        db: PyDAL DAL instance
+        *statements: DDL statements to execute
+    """
+    if not is_postgres(db):
+        return
+
+    for statement in statements:
+        concurrent, count = CONCURRENT_INDEX_DDL.subn(r'\1 CONCURRENTLY ', statement)
+        if count:
+            _execute_autocommit(db, concurrent)
+        else:
+            db.executesql(statement)
+
+
+def _execute_autocommit(db, statement):
+    """Execute a statement outside a transaction block.
+
+    Required for ``CONCURRENTLY`` index DDL. Any open transaction is
+    committed first.
+
+    Args:
+        db: PyDAL DAL instance
+        statement: SQL statement to execute
+    """
+    db.commit()
+    connection = db._adapter.connection
+    connection.autocommit = True
+    try:
+        db.executesql(statement)
+    finally:
+        connection.autocommit = False
@@ -0,0 +1,130 @@
+"""
+Schema Migrations
+
+Raw DDL and data backfills that PyDAL's table migrations cannot express.
+None of it runs when a table is defined, so application processes never
+build indexes or lock tables. Run once per deploy:
+
+    python -m models.migrations
+
+Every statement is idempotent, so rerunning a deploy is safe.
+"""
+
+import logging
+
+from .ddl import bigint_id, binary_collation, execute_ddl, is_postgres
+from .teams import TEAMS_INDEX_DDL
+from .users import USERS_INDEX_DDL
+from .resources import (
+    RESOURCE_FLAG_FIELDS,
+    RESOURCE_USERS_CHANNEL,
+    RESOURCES_INDEX_DDL,
+    RESOURCE_USERS_INDEX_DDL,
+    RESOURCE_STATS_INDEX_DDL,
+    BACKUP_JOBS_INDEX_DDL,
+    PROVISIONING_JOBS_INDEX_DDL,
+)
+from .certificates import (
+    CERTIFICATE_AUTHORITIES_INDEX_DDL,
+    CERTIFICATES_INDEX_DDL,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def migrate(db):
+    """Run the migrations against the connected database.
+
+    Args:
+        db: PyDAL DAL instance with every table materialized
+    """
+    # A failed concurrent build leaves an invalid index that IF NOT EXISTS
+    # would then skip forever
+    if is_postgres(db):
+        _drop_invalid_indexes(db)
+
+    execute_ddl(
+        db,
+        *TEAMS_INDEX_DDL,
+        *USERS_INDEX_DDL,
+        *RESOURCES_INDEX_DDL,
+        *RESOURCE_USERS_INDEX_DDL,
+        *RESOURCE_STATS_INDEX_DDL,
+        *BACKUP_JOBS_INDEX_DDL,
+        *PROVISIONING_JOBS_INDEX_DDL,
+        *CERTIFICATE_AUTHORITIES_INDEX_DDL,
+        *CERTIFICATES_INDEX_DDL,
+        # Keep the oldest of duplicate memberships so the unique index builds
+        "DELETE FROM team_memberships dup USING team_memberships kept "
+        "WHERE dup.user_id = kept.user_id AND dup.team_id = kept.team_id "
+        "AND dup.id > kept.id",
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_team_memberships_user_team "
+        "ON team_memberships (user_id, team_id)",
+        # Pack the boolean capability columns into flags for existing rows
+        "UPDATE resources SET flags = "
+        + " | ".join(
+            f"(CASE WHEN {name} THEN {mask} ELSE 0 END)"
+            for name, mask in RESOURCE_FLAG_FIELDS.items()
+        )
+        + " WHERE flags IS NULL",
+        # Hash of the normalized jsonb config for equality lookups; adding
+        # the stored column rewrites resources
+        "ALTER TABLE resources ADD COLUMN IF NOT EXISTS config_hash text "
+        "GENERATED ALWAYS AS (md5(config::text)) STORED",
+        "CREATE INDEX IF NOT EXISTS ix_resources_config_hash "
+        "ON resources (config_hash)",
+        # Append-heavy tables outgrow 32-bit serial ids; widening rewrites
+        # each table under an exclusive lock
+        bigint_id('resource_stats'),
+        bigint_id('backup_jobs'),
+        bigint_id('provisioning_jobs'),
+        # Copy roles from the deprecated JSON column that are missing from
+        # resource_user_roles
+        "INSERT INTO resource_user_roles (resource_user_id, role) "
+        "SELECT DISTINCT ru.id, r.role FROM resource_users ru "
+        "CROSS JOIN LATERAL jsonb_array_elements_text(ru.roles) AS r(role) "
+        "WHERE jsonb_typeof(ru.roles) = 'array' "
+        "AND NOT EXISTS (SELECT 1 FROM resource_user_roles rur "
+        "WHERE rur.resource_user_id = ru.id AND rur.role = r.role)",
+        # Password hashes are compared byte-wise; changing the collation
+        # rewrites the column
+        binary_collation('users', 'password_hash', 'varchar(255)'),
+        binary_collation('resource_users', 'password_hash', 'varchar(255)'),
+        # Wake the user sync worker when a user becomes pending; replaced in
+        # place so there is no window without the trigger
+        "CREATE OR REPLACE FUNCTION notify_resource_users_pending() "
+        "RETURNS trigger AS $$ BEGIN "
+        f"PERFORM pg_notify('{RESOURCE_USERS_CHANNEL}', ''); RETURN NULL; "
+        "END $$ LANGUAGE plpgsql",
+        "CREATE OR REPLACE TRIGGER resource_users_pending "
+        "AFTER INSERT OR UPDATE OF sync_status ON resource_users "
+        "FOR EACH ROW WHEN (NEW.sync_status = 'pending') "
+        "EXECUTE FUNCTION notify_resource_users_pending()",
+    )
+    db.commit()
+
+
+def _drop_invalid_indexes(db):
+    """Drop indexes left invalid by interrupted concurrent builds.
+
+    Args:
+        db: PyDAL DAL instance connected to PostgreSQL
+    """
+    rows = db.executesql(
+        "SELECT pg_class.relname FROM pg_index "
+        "JOIN pg_class ON pg_class.oid = pg_index.indexrelid "
+        "JOIN pg_namespace ON pg_namespace.oid = pg_class.relnamespace "
+        "WHERE pg_namespace.nspname = current_schema() AND NOT pg_index.indisvalid"
+    )
+    for (name,) in rows:
+        logger.warning(f"Rebuilding invalid index {name}")
+        execute_ddl(db, f"DROP INDEX IF EXISTS {name}")
+
+
+if __name__ == '__main__':
+    from . import db, preload_tables
+
+    logging.basicConfig(level=logging.INFO)
+    preload_tables()
+    migrate(db)
+    logger.info("Schema migrations complete")
@@ -4,7 +4,48 @@ Resources Models
 Defines resource types, resources, resource users, and related operational models.
 """
 
-from pydal.validators import IS_NOT_EMPTY, IS_IN_SET
+import json
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+from pydal.objects import Expression
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .validators import (
+    NOT_EMPTY,
+    VALID_RESOURCE_STATUS,
+    VALID_SYNC_STATUS,
+    VALID_BACKUP_JOB_STATUS,
+    VALID_PROVISIONING_JOB_STATUS,
+)
+from .ddl import (
+    is_postgres,
+    json_type,
+    recency_index,
+)
+
+# Bits of resources.flags; each mirrors the boolean column of the same name.
+# The booleans stay the columns controllers read and forms write; flags only
+# backs bitmask predicates such as the partial ix_resources_can_backup index,
+# and is recomputed on every insert and update through the DAL. Existing rows
+# are packed by models.migrations
+CAN_MODIFY_USERS = 1 << 0
+CAN_MODIFY_CONFIG = 1 << 1
+CAN_BACKUP = 1 << 2
+CAN_SCALE = 1 << 3
+TLS_ENABLED = 1 << 4
+
+RESOURCE_FLAG_FIELDS = {
+    'can_modify_users': CAN_MODIFY_USERS,
+    'can_modify_config': CAN_MODIFY_CONFIG,
+    'can_backup': CAN_BACKUP,
+    'can_scale': CAN_SCALE,
+    'tls_enabled': TLS_ENABLED,
+}
 
 
 def define_resource_types(db):
@@ -17,16 +58,16 @@ def define_resource_types(db):
         'resource_types',
         db.Field('name', 'string',
                  length=100,
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  unique=True,
                  comment='Resource type identifier'),
         db.Field('category', 'string',
                  length=50,
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='Resource category (compute, storage, network, etc)'),
         db.Field('display_name', 'string',
                  length=255,
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='Human-readable display name'),
         db.Field('icon', 'string',
                  length=100,
@@ -59,39 +100,126 @@ def define_resource_types(db):
     )
 
 
+def define_resource_types_cache(db):
+    """Load the resource_types table into an in-process cache keyed by id.
+
+    resource_types is a small, near-static catalog, so resolving
+    ``resource_type_id`` from memory avoids a row fetch per resource. Insert,
+    update and delete callbacks reload the cache for writes made through
+    this process.
+
+    Args:
+        db: PyDAL DAL instance
+    """
+    db._resource_types_by_id = {}
+
+    def reload(*args):
+        rows = db(db.resource_types).select()
+        db._resource_types_by_id.clear()
+        db._resource_types_by_id.update((row.id, row) for row in rows)
+
+    reload()
+    db.resource_types._after_insert.append(reload)
+    db.resource_types._after_update.append(reload)
+    db.resource_types._after_delete.append(reload)
+
+
+def get_resource_type(db, resource_type_id):
+    """Get a resource type by id, using the in-process cache.
+
+    Falls back to the database on a cache miss, e.g. for rows inserted by
+    another process since startup.
+
+    Args:
+        db: PyDAL DAL instance
+        resource_type_id: Resource type ID
+
+    Returns:
+        resource_types row or None if not found
+    """
+    cache = getattr(db, '_resource_types_by_id', None)
+    if cache is None:
+        return db.resource_types[resource_type_id]
+
+    resource_type = cache.get(resource_type_id)
+    if resource_type is None:
+        resource_type = db.resource_types[resource_type_id]
+        if resource_type:
+            cache[resource_type.id] = resource_type
+    return resource_type
+
+
+# PostgreSQL indexes the indexes= option cannot express, built by
+# models.migrations
+RESOURCES_INDEX_DDL = (
+    "CREATE INDEX IF NOT EXISTS ix_resources_name_live "
+    "ON resources (name) WHERE deleted_at IS NULL",
+    # Leading team_id lookups are served by the composite indexes
+    "DROP INDEX IF EXISTS ix_resources_team_id_live",
+    "CREATE INDEX IF NOT EXISTS ix_resources_team_id_name_live "
+    "ON resources (team_id, name) WHERE deleted_at IS NULL",
+    # Expression index for lookups by connection host
+    "CREATE INDEX IF NOT EXISTS ix_resources_conn_host "
+    "ON resources ((connection_info->>'host'))",
+    "CREATE INDEX IF NOT EXISTS ix_resources_k8s_ns "
+    "ON resources (k8s_namespace, k8s_resource_name) "
+    "WHERE deleted_at IS NULL",
+    recency_index('resources', include=('team_id', 'status'), live=True),
+    # Backup scheduler scans backup-capable live resources
+    "CREATE INDEX IF NOT EXISTS ix_resources_can_backup "
+    f"ON resources (id) WHERE flags & {CAN_BACKUP} = {CAN_BACKUP} "
+    "AND deleted_at IS NULL",
+    # Stats collector scans active, lifecycle-managed live resources
+    "CREATE INDEX IF NOT EXISTS ix_resources_stats_active "
+    "ON resources (resource_type_id) WHERE status = 'active' "
+    "AND lifecycle_mode IN ('full', 'partial') AND deleted_at IS NULL",
+)
+
+
 def define_resources(db):
     """Define the resources table.
 
     Args:
         db: PyDAL DAL instance
     """
+    # Live lookups always filter soft-deleted rows; PostgreSQL gets partial
+    # indexes from models.migrations, other dialects keep full indexes
+    live_indexes = [] if is_postgres(db) else [
+        ['name'],
+        ['team_id', 'name'],
+        ['created_at'],
+    ]
+
+    def track_flags(table):
+        """Keep flags in step with partial capability updates."""
+        table._before_update.append(repack_resource_flags)
+
     db.define_table(
         'resources',
         db.Field('name', 'string',
                  length=255,
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='Resource name'),
         db.Field('resource_type_id', 'reference resource_types',
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='Resource type reference'),
         db.Field('team_id', 'reference teams',
                  ondelete='CASCADE',
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='Team that owns this resource'),
         db.Field('status', 'string',
                  length=50,
                  default='pending',
-                 requires=IS_IN_SET(['pending', 'provisioning', 'active',
-                                     'updating', 'paused', 'error', 'deleted']),
+                 requires=VALID_RESOURCE_STATUS,
                  comment='Resource status'),
         db.Field('lifecycle_mode', 'string',
                  length=50,
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='Lifecycle mode (full, partial, import)'),
         db.Field('provisioning_method', 'string',
                  length=50,
                  comment='Method used for provisioning'),
-        db.Field('connection_info', 'json',
+        db.Field('connection_info', json_type(db),
                  comment='Connection information (host, port, etc)'),
         db.Field('credentials', 'json',
                  comment='Encrypted credentials'),
@@ -111,7 +239,7 @@ def define_resources(db):
         db.Field('k8s_resource_type', 'string',
                  length=50,
                  comment='Kubernetes resource type (pod, deployment, etc)'),
-        db.Field('config', 'json',
+        db.Field('config', json_type(db),
                  comment='Resource-specific configuration'),
         db.Field('can_modify_users', 'boolean',
                  default=False,
@@ -125,6 +253,10 @@ def define_resources(db):
         db.Field('can_scale', 'boolean',
                  default=False,
                  comment='Whether resource can be scaled'),
+        db.Field('flags', 'bigint',
+                 default=0,
+                 compute=pack_resource_flags,
+                 comment='Capability bitmask (CAN_* and TLS_ENABLED bits)'),
         db.Field('created_by', 'reference users',
                  comment='User who created this resource'),
         db.Field('created_at', 'datetime',
@@ -137,46 +269,240 @@ def define_resources(db):
         db.Field('deleted_at', 'datetime',
                  comment='Soft delete timestamp'),
 
-        indexes=[
-            ['name'],
-            ['team_id'],
+        indexes=live_indexes + [
             ['resource_type_id'],
             ['status'],
-            ['created_at'],
-            ['team_id', 'name'],
+            ['team_id', 'status'],
         ],
 
         migrate=True,
         fake_migrate=False,
-        format='%(name)s'
+        format='%(name)s',
+        on_define=track_flags,
     )
 
 
+def pack_resource_flags(row):
+    """Pack a resource's boolean capability columns into a bitmask.
+
+    Used as the compute function of resources.flags. PyDAL only computes
+    it when every capability column is written, i.e. on inserts and full
+    updates; repack_resource_flags() covers partial updates.
+
+    Args:
+        row: Row or OpRow with the capability columns
+
+    Returns:
+        Bitmask of RESOURCE_FLAG_FIELDS
+    """
+    flags = 0
+    for name, mask in RESOURCE_FLAG_FIELDS.items():
+        if row[name]:
+            flags |= mask
+    return flags
+
+
+def repack_resource_flags(dbset, fields):
+    """Recompute flags on updates that write some capability columns.
+
+    Registered as a _before_update callback of resources. Each row keeps
+    the bits of the columns the update leaves alone, so flags is rebuilt
+    in SQL from the written values and the stored columns.
+
+    Args:
+        dbset: Set being updated
+        fields: OpRow of the update
+
+    Returns:
+        None, so the update goes ahead
+    """
+    written = [name for name in RESOURCE_FLAG_FIELDS if name in fields]
+    if not written or len(written) == len(RESOURCE_FLAG_FIELDS):
+        return None
+
+    table = dbset.db.resources
+    expand = dbset.db._adapter.expand
+    parts = [str(sum(
+        mask for name, mask in RESOURCE_FLAG_FIELDS.items()
+        if name in fields and fields[name]
+    ))]
+    parts += [
+        f"(CASE WHEN {expand(table[name] == True)} THEN {mask} ELSE 0 END)"
+        for name, mask in RESOURCE_FLAG_FIELDS.items()
+        if name not in fields
+    ]
+    fields['flags'] = Expression(dbset.db, ' + '.join(parts), type='bigint')
+    return None
+
+
+def has_flag(row, mask):
+    """Check whether every bit of a mask is set on a resource.
+
+    Args:
+        row: resources Row
+        mask: Bitmask of CAN_* / TLS_ENABLED bits
+
+    Returns:
+        True if all bits in mask are set
+    """
+    return (row.flags or 0) & mask == mask
+
+
+def set_flag(row, mask, enabled=True):
+    """Set or clear capability bits on a resource.
+
+    Updates both the flags bitmask and the matching boolean columns. Does
+    not commit.
+
+    Args:
+        row: resources Row with update_record
+        mask: Bitmask of CAN_* / TLS_ENABLED bits
+        enabled: Whether to set or clear the bits
+    """
+    flags = row.flags or 0
+    flags = flags | mask if enabled else flags & ~mask
+    values = {
+        name: bool(flags & bit) for name, bit in RESOURCE_FLAG_FIELDS.items()
+        if mask & bit
+    }
+    row.update_record(flags=flags, **values)
+
+
+def resources_by_team(db, team_id):
+    """Fetch a team's live resources together with their resource types.
+
+    Uses a single left join so callers reading resource type fields do not
+    trigger a reference lookup per row.
+
+    Args:
+        db: PyDAL DAL instance
+        team_id: Team ID
+
+    Returns:
+        PyDAL Rows with ``resources`` and ``resource_types`` sub-rows
+    """
+    return db(
+        (db.resources.team_id == team_id) &
+        (db.resources.status != 'deleted') &
+        (db.resources.deleted_at == None)
+    ).select(
+        db.resources.ALL,
+        db.resource_types.ALL,
+        left=db.resource_types.on(
+            db.resources.resource_type_id == db.resource_types.id
+        ),
+        orderby=db.resources.name,
+    )
+
+
+@dataclass
+class ExpandedResource:
+    """Resource row with its team, creator and type names already resolved."""
+    resource: Any
+    team_name: Optional[str]
+    created_by_username: Optional[str]
+    resource_type_name: Optional[str]
+    resource_type_display_name: Optional[str]
+
+
+def fetch_resources_expanded(db, where) -> List[ExpandedResource]:
+    """Fetch resources with team, creator and resource type in one query.
+
+    Joins teams, users (as ``created_by``) and resource_types so list
+    endpoints do not issue a reference lookup per row.
+
+    Args:
+        db: PyDAL DAL instance
+        where: PyDAL query selecting resources
+
+    Returns:
+        List of ExpandedResource
+    """
+    rows = db(where).select(
+        db.resources.ALL,
+        db.teams.name,
+        db.users.username,
+        db.resource_types.name,
+        db.resource_types.display_name,
+        left=[
+            db.teams.on(db.resources.team_id == db.teams.id),
+            db.users.on(db.resources.created_by == db.users.id),
+            db.resource_types.on(
+                db.resources.resource_type_id == db.resource_types.id
+            ),
+        ],
+    )
+
+    return [
+        ExpandedResource(
+            resource=row.resources,
+            team_name=row.teams.name,
+            created_by_username=row.users.username,
+            resource_type_name=row.resource_types.name,
+            resource_type_display_name=row.resource_types.display_name,
+        )
+        for row in rows
+    ]
+
+
+# NOTIFY channel signalled when a resource user becomes pending; the trigger
+# is created by models.migrations
+RESOURCE_USERS_CHANNEL = 'resource_users_changed'
+
+
+# PostgreSQL indexes the indexes= option cannot express, built by
+# models.migrations: partial indexes for live rows and the sync worker's
+# pending/error queue, plus a GIN index for role containment queries
+RESOURCE_USERS_INDEX_DDL = (
+    # Leading resource_id lookups are served by the composite index
+    "DROP INDEX IF EXISTS ix_resource_users_resource_id_live",
+    "CREATE INDEX IF NOT EXISTS ix_resource_users_resource_id_username_live "
+    "ON resource_users (resource_id, username) WHERE deleted_at IS NULL",
+    # The sync worker reads its queue oldest first
+    "CREATE INDEX IF NOT EXISTS ix_resource_users_sync_queue "
+    "ON resource_users (created_at) "
+    "WHERE sync_status IN ('pending', 'error')",
+    "CREATE INDEX IF NOT EXISTS gin_resource_users_roles "
+    "ON resource_users USING GIN (roles jsonb_path_ops)",
+    recency_index('resource_users', live=True),
+)
+
+
 def define_resource_users(db):
     """Define the resource_users table.
 
     Args:
         db: PyDAL DAL instance
     """
+    # Live lookups always filter soft-deleted rows; PostgreSQL gets partial
+    # indexes from models.migrations, other dialects keep full indexes
+    live_indexes = [] if is_postgres(db) else [
+        ['resource_id', 'username'],
+        ['created_at'],
+        ['sync_status', 'created_at'],
+    ]
+
     db.define_table(
         'resource_users',
         db.Field('resource_id', 'reference resources',
                  ondelete='CASCADE',
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='Resource reference'),
         db.Field('username', 'string',
                  length=255,
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='Username on resource'),
         db.Field('password_hash', 'string',
                  length=255,
                  comment='Encrypted password hash'),
-        db.Field('roles', 'json',
-                 comment='Roles assigned to user'),
+        # Deprecated: superseded by resource_user_roles, still written for
+        # one release so a rollback keeps working
+        db.Field('roles', json_type(db),
+                 comment='Roles assigned to user (deprecated)'),
         db.Field('sync_status', 'string',
                  length=50,
                  default='pending',
-                 requires=IS_IN_SET(['pending', 'syncing', 'synced', 'error']),
+                 requires=VALID_SYNC_STATUS,
                  comment='Synchronization status'),
         db.Field('last_synced_at', 'datetime',
                  comment='Last successful sync timestamp'),
@@ -194,46 +520,124 @@ def define_resource_users(db):
         db.Field('deleted_at', 'datetime',
                  comment='Soft delete timestamp'),
 
+        indexes=live_indexes,
+
+        migrate=True,
+        fake_migrate=False,
+        format='%(username)s',
+    )
+
+
+def define_resource_user_roles(db):
+    """Define the resource_user_roles table.
+
+    One row per role granted to a resource user, replacing the JSON
+    ``resource_users.roles`` array for role lookups.
+
+    Args:
+        db: PyDAL DAL instance
+    """
+    db.define_table(
+        'resource_user_roles',
+        db.Field('resource_user_id', 'reference resource_users',
+                 ondelete='CASCADE',
+                 requires=NOT_EMPTY,
+                 comment='Resource user reference'),
+        db.Field('role', 'string',
+                 length=64,
+                 requires=NOT_EMPTY,
+                 comment='Role name'),
+
         indexes=[
-            ['resource_id'],
-            ['resource_id', 'username'],
-            ['sync_status'],
-            ['created_at'],
+            ['resource_user_id'],
+            ['role', 'resource_user_id'],
         ],
 
         migrate=True,
         fake_migrate=False,
-        format='%(username)s'
+        format='%(role)s',
     )
 
 
+def set_resource_user_roles(db, resource_user_id, roles):
+    """Replace the roles granted to a resource user.
+
+    Writes both resource_user_roles and the deprecated JSON column. Does not
+    commit.
+
+    Args:
+        db: PyDAL DAL instance
+        resource_user_id: Resource user ID
+        roles: Iterable of role names
+    """
+    roles = list(dict.fromkeys(roles))
+    db(db.resource_user_roles.resource_user_id == resource_user_id).delete()
+    db.resource_user_roles.bulk_insert([
+        {'resource_user_id': resource_user_id, 'role': role} for role in roles
+    ])
+    db(db.resource_users.id == resource_user_id).update(roles=roles)
+
+
+def resource_users_with_role(db, resource_id, role):
+    """Get the live users of a resource that hold a role.
+
+    Args:
+        db: PyDAL DAL instance
+        resource_id: Resource ID
+        role: Role name
+
+    Returns:
+        Rows of resource_users
+    """
+    return db(
+        (db.resource_user_roles.role == role)
+        & (db.resource_user_roles.resource_user_id == db.resource_users.id)
+        & (db.resource_users.resource_id == resource_id)
+        & (db.resource_users.deleted_at == None)
+    ).select(db.resource_users.ALL)
+
+
+# PostgreSQL indexes the indexes= option cannot express, built by
+# models.migrations
+RESOURCE_STATS_INDEX_DDL = (
+    "CREATE INDEX IF NOT EXISTS brin_resource_stats_timestamp "
+    "ON resource_stats USING BRIN (timestamp) WITH (pages_per_range = 32)",
+    "CREATE INDEX IF NOT EXISTS gin_resource_stats_risk_factors "
+    "ON resource_stats USING GIN (risk_factors jsonb_path_ops)",
+    "CREATE INDEX IF NOT EXISTS gin_resource_stats_metrics "
+    "ON resource_stats USING GIN (metrics jsonb_path_ops)",
+)
+
+
 def define_resource_stats(db):
     """Define the resource_stats table.
 
     Args:
         db: PyDAL DAL instance
     """
+    # Append-only time series: PostgreSQL gets a BRIN index on timestamp
+    # from models.migrations, other dialects keep a B-tree
+    timestamp_indexes = [] if is_postgres(db) else [['timestamp']]
+
     db.define_table(
         'resource_stats',
         db.Field('resource_id', 'reference resources',
                  ondelete='CASCADE',
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='Resource reference'),
         db.Field('timestamp', 'datetime',
                  default=db.current_timestamp,
                  comment='Metrics timestamp'),
-        db.Field('metrics', 'json',
-                 requires=IS_NOT_EMPTY(),
+        db.Field('metrics', json_type(db),
+                 requires=NOT_EMPTY,
                  comment='Resource metrics data'),
         db.Field('risk_level', 'string',
                  length=20,
                  comment='Risk assessment level (low, medium, high, critical)'),
-        db.Field('risk_factors', 'json',
+        db.Field('risk_factors', json_type(db),
                  comment='Risk assessment factors'),
 
-        indexes=[
-            ['resource_id'],
-            ['timestamp'],
+        indexes=timestamp_indexes + [
             ['resource_id', 'timestamp'],
         ],
 
@@ -242,27 +646,236 @@ def define_resource_stats(db):
     )
 
 
+# Rows per INSERT batch for resource_stats ingestion
+STATS_BATCH_SIZE = 10000
+
+
+def insert_resource_stats_batch(db, rows, batch_size=STATS_BATCH_SIZE):
+    """Insert resource_stats rows in batches.
+
+    On PostgreSQL each batch is sent as one multi-row INSERT through
+    psycopg2's ``execute_values``; other dialects use PyDAL's bulk_insert.
+    Each batch is committed separately.
+
+    Args:
+        db: PyDAL DAL instance
+        rows: Iterable of dicts keyed by resource_stats field name
+        batch_size: Maximum rows per INSERT statement
+
+    Returns:
+        Number of rows inserted
+    """
+    table = db.resource_stats
+    rows = list(rows)
+
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start:start + batch_size]
+        if is_postgres(db):
+            _execute_values_insert(db, table, batch)
+        else:
+            table.bulk_insert(batch)
+        db.commit()
+
+    return len(rows)
+
+
+def _execute_values_insert(db, table, rows):
+    """Insert rows with a single multi-row INSERT on PostgreSQL.
+
+    Args:
+        db: PyDAL DAL instance
+        table: PyDAL table to insert into
+        rows: List of dicts keyed by field name
+    """
+    from psycopg2.extras import execute_values
+
+    fields = [table[name] for name in table.fields if name != 'id']
+    values = [_record_values(fields, row) for row in rows]
+
+    columns = ', '.join(field.name for field in fields)
+    execute_values(
+        db._adapter.cursor,
+        f"INSERT INTO {table._tablename} ({columns}) VALUES %s",
+        values,
+        page_size=len(values),
+    )
+
+
+def _json_dumps(value):
+    """Serialize a JSON column value, using orjson when installed.
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode()
+        except TypeError:
+            # e.g. non-string dict keys, which json.dumps coerces
+            pass
+    return json.dumps(value)
+
+
+def _record_values(fields, row):
+    """Build the column values for one row of a raw insert.
+
+    Missing fields take their default and JSON fields are encoded.
+
+    Args:
+        fields: PyDAL fields in column order
+        row: Dict keyed by field name
+
+    Returns:
+        Tuple of column values
+    """
+    record = []
+    for field in fields:
+        value = row.get(field.name, field.default)
+        if callable(value):
+            value = value()
+        if field.type in ('json', 'jsonb') and value is not None \
+                and not isinstance(value, str):
+            value = _json_dumps(value)
+        record.append(value)
+    return tuple(record)
+
+
+def copy_resource_stats(db, rows):
+    """Bulk load resource_stats rows, using COPY on PostgreSQL.
+
+    Args:
+        db: PyDAL DAL instance
+        rows: Iterable of dicts keyed by resource_stats field name
+
+    Returns:
+        Number of rows loaded
+    """
+    return _copy_rows(db, db.resource_stats, rows)
+
+
+def copy_provisioning_jobs(db, rows):
+    """Bulk load provisioning_jobs rows, using COPY on PostgreSQL.
+
+    Meant for backfills and reingests of finished jobs and their logs.
+
+    Args:
+        db: PyDAL DAL instance
+        rows: Iterable of dicts keyed by provisioning_jobs field name
+
+    Returns:
+        Number of rows loaded
+    """
+    return _copy_rows(db, db.provisioning_jobs, rows)
+
+
+def _copy_rows(db, table, rows):
+    """Load rows with ``COPY ... FROM STDIN`` and commit.
+
+    Rows are encoded lazily as they are read by psycopg2, so the iterable
+    is never held in memory. Other dialects fall back to bulk_insert.
+
+    Args:
+        db: PyDAL DAL instance
+        table: PyDAL table to load into
+        rows: Iterable of dicts keyed by field name
+
+    Returns:
+        Number of rows loaded
+    """
+    if not is_postgres(db):
+        rows = list(rows)
+        table.bulk_insert(rows)
+        db.commit()
+        return len(rows)
+
+    fields = [table[name] for name in table.fields if name != 'id']
+    columns = ', '.join(field.name for field in fields)
+    lines = (
+        '\t'.join(_copy_text(value) for value in _record_values(fields, row)) + '\n'
+        for row in rows
+    )
+
+    cursor = db._adapter.cursor
+    cursor.copy_expert(
+        f"COPY {table._tablename} ({columns}) FROM STDIN",
+        _CopyStream(lines),
+    )
+    db.commit()
+    return cursor.rowcount
+
+
+def _copy_text(value):
+    """Encode a value for COPY text format.
+
+    Args:
+        value: Column value
+
+    Returns:
+        Escaped text, or ``\\N`` for NULL
+    """
+    if value is None:
+        return '\\N'
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
+
+
+class _CopyStream:
+    """Read-only file object over an iterator of COPY lines."""
+
+    def __init__(self, lines):
+        self._lines = iter(lines)
+        self._buffer = ''
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            self._buffer += line
+        if size < 0:
+            size = len(self._buffer)
+        chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+
+# PostgreSQL indexes the indexes= option cannot express, built by
+# models.migrations
+BACKUP_JOBS_INDEX_DDL = (
+    recency_index('backup_jobs'),
+)
+
+
 def define_backup_jobs(db):
     """Define the backup_jobs table.
 
     Args:
         db: PyDAL DAL instance
     """
+    # Newest-first job lists get a descending index on PostgreSQL
+    recency_indexes = [] if is_postgres(db) else [['created_at']]
+
     db.define_table(
         'backup_jobs',
         db.Field('resource_id', 'reference resources',
                  ondelete='CASCADE',
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='Resource reference'),
         db.Field('job_type', 'string',
                  length=50,
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='Type of backup job'),
         db.Field('status', 'string',
                  length=50,
                  default='pending',
-                 requires=IS_IN_SET(['pending', 'running', 'completed',
-                                     'failed', 'cancelled']),
+                 requires=VALID_BACKUP_JOB_STATUS,
                  comment='Job status'),
         db.Field('backup_location', 'text',
                  comment='Location where backup is stored'),
@@ -280,11 +893,10 @@ def define_backup_jobs(db):
                  default=db.current_timestamp,
                  comment='Creation timestamp'),
 
-        indexes=[
-            ['resource_id'],
-            ['status'],
-            ['created_at'],
+        indexes=recency_indexes + [
             ['resource_id', 'created_at'],
+            ['status', 'created_at'],
+            ['resource_id', 'status', 'created_at'],
         ],
 
         migrate=True,
@@ -292,27 +904,36 @@ def define_backup_jobs(db):
     )
 
 
+# PostgreSQL indexes the indexes= option cannot express, built by
+# models.migrations
+PROVISIONING_JOBS_INDEX_DDL = (
+    recency_index('provisioning_jobs'),
+)
+
+
 def define_provisioning_jobs(db):
     """Define the provisioning_jobs table.
 
     Args:
         db: PyDAL DAL instance
     """
+    # Newest-first job lists get a descending index on PostgreSQL
+    recency_indexes = [] if is_postgres(db) else [['created_at']]
+
     db.define_table(
         'provisioning_jobs',
         db.Field('resource_id', 'reference resources',
                  ondelete='CASCADE',
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='Resource reference'),
         db.Field('job_type', 'string',
                  length=50,
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='Type of provisioning job'),
         db.Field('status', 'string',
                  length=50,
                  default='pending',
-                 requires=IS_IN_SET(['pending', 'running', 'completed',
-                                     'failed', 'rolled_back']),
+                 requires=VALID_PROVISIONING_JOB_STATUS,
                  comment='Job status'),
         db.Field('started_at', 'datetime',
                  comment='Job start timestamp'),
@@ -332,11 +953,10 @@ def define_provisioning_jobs(db):
                  update=db.current_timestamp,
                  comment='Last update timestamp'),
 
-        indexes=[
-            ['resource_id'],
-            ['status'],
-            ['created_at'],
+        indexes=recency_indexes + [
             ['resource_id', 'created_at'],
+            ['status', 'created_at'],
+            ['resource_id', 'status', 'created_at'],
         ],
 
         migrate=True,
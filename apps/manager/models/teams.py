@@ -4,7 +4,18 @@ Teams Model
 Defines the teams table for organizing users and resources.
 """
 
-from pydal.validators import IS_NOT_EMPTY
+from .validators import NOT_EMPTY
+
+from .ddl import is_postgres, recency_index
+
+
+# PostgreSQL indexes the indexes= option cannot express, built by
+# models.migrations
+TEAMS_INDEX_DDL = (
+    "CREATE INDEX IF NOT EXISTS ix_teams_name_live "
+    "ON teams (name) WHERE deleted_at IS NULL",
+    recency_index('teams', live=True),
+)
 
 
 def define_teams(db):
@@ -13,11 +24,15 @@ def define_teams(db):
     Args:
         db: PyDAL DAL instance
     """
+    # Live lookups always filter soft-deleted rows; PostgreSQL gets partial
+    # indexes from models.migrations, other dialects keep full indexes
+    live_indexes = [] if is_postgres(db) else [['name'], ['created_at']]
+
     db.define_table(
         'teams',
         db.Field('name', 'string',
                  length=255,
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  unique=True,
                  comment='Team name'),
         db.Field('description', 'text',
@@ -36,13 +51,11 @@ def define_teams(db):
                  comment='Soft delete timestamp'),
 
         # Indexes
-        indexes=[
-            ['name'],
-            ['created_at'],
+        indexes=live_indexes + [
             ['is_global'],
         ],
 
         migrate=True,
         fake_migrate=False,
-        format='%(name)s'
+        format='%(name)s',
     )
@@ -4,7 +4,20 @@ Users and Team Memberships Models
 Defines users and their team membership relationships.
 """
 
-from pydal.validators import IS_NOT_EMPTY, IS_EMAIL
+from .validators import NOT_EMPTY, EMAIL
+
+from .ddl import is_postgres, recency_index
+
+
+# PostgreSQL indexes the indexes= option cannot express, built by
+# models.migrations
+USERS_INDEX_DDL = (
+    "CREATE INDEX IF NOT EXISTS ix_users_username_live "
+    "ON users (username) WHERE deleted_at IS NULL",
+    "CREATE INDEX IF NOT EXISTS ix_users_email_live "
+    "ON users (email) WHERE deleted_at IS NULL",
+    recency_index('users', live=True),
+)
 
 
 def define_users(db):
@@ -13,21 +26,29 @@ def define_users(db):
     Args:
         db: PyDAL DAL instance
     """
+    # Live lookups always filter soft-deleted rows; PostgreSQL gets partial
+    # indexes from models.migrations, other dialects keep full indexes
+    live_indexes = [] if is_postgres(db) else [
+        ['username'],
+        ['email'],
+        ['created_at'],
+    ]
+
     db.define_table(
         'users',
         db.Field('username', 'string',
                  length=255,
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  unique=True,
                  comment='Unique username'),
         db.Field('email', 'string',
                  length=255,
-                 requires=[IS_NOT_EMPTY(), IS_EMAIL()],
+                 requires=[NOT_EMPTY, EMAIL],
                  unique=True,
                  comment='User email address'),
         db.Field('password_hash', 'string',
                  length=255,
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='Hashed password'),
         db.Field('first_name', 'string',
                  length=255,
@@ -51,16 +72,13 @@ def define_users(db):
                  comment='Soft delete timestamp'),
 
         # Indexes
-        indexes=[
-            ['username'],
-            ['email'],
-            ['created_at'],
+        indexes=live_indexes + [
             ['is_active'],
         ],
 
         migrate=True,
         fake_migrate=False,
-        format='%(username)s'
+        format='%(username)s',
     )
 
 
@@ -70,19 +88,23 @@ def define_team_memberships(db):
     Args:
         db: PyDAL DAL instance
     """
+    # PostgreSQL enforces (user_id, team_id) uniqueness with a unique index
+    # built by models.migrations, which also serves lookups by user_id
+    membership_indexes = [] if is_postgres(db) else [['user_id', 'team_id']]
+
     db.define_table(
         'team_memberships',
         db.Field('user_id', 'reference users',
                  ondelete='CASCADE',
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='Reference to user'),
         db.Field('team_id', 'reference teams',
                  ondelete='CASCADE',
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='Reference to team'),
         db.Field('role', 'string',
                  length=50,
-                 requires=IS_NOT_EMPTY(),
+                 requires=NOT_EMPTY,
                  comment='User role in team (admin, member, viewer)'),
         db.Field('created_at', 'datetime',
                  default=db.current_timestamp,
@@ -93,13 +115,11 @@ def define_team_memberships(db):
                  comment='Last update timestamp'),
 
         # Indexes
-        indexes=[
-            ['user_id'],
+        indexes=membership_indexes + [
             ['team_id'],
-            ['user_id', 'team_id'],  # Unique constraint via composite index
         ],
 
         migrate=True,
         fake_migrate=False,
-        format='%(role)s'
+        format='%(role)s',
     )
@@ -0,0 +1,44 @@
+"""
+Shared Validators
+
+Validator instances reused across table definitions. They are built once per
+process instead of once per field.
+"""
+
+from pydal.validators import IS_NOT_EMPTY, IS_EMAIL, IS_IN_SET, ValidationError
+
+
+class IS_IN_FROZENSET(IS_IN_SET):
+    """IS_IN_SET with constant-time membership checks.
+
+    Keeps the ordered option list for forms, but validates values against a
+    frozenset instead of scanning the list.
+    """
+
+    def __init__(self, theset, **kwargs):
+        super().__init__(list(theset), **kwargs)
+        self.members = frozenset(str(item) for item in theset)
+
+    def validate(self, value, record_id=None):
+        if str(value) not in self.members:
+            raise ValidationError(self.translator(self.error_message))
+        return value
+
+
+# Allowed status values
+RESOURCE_STATUSES = ('pending', 'provisioning', 'active', 'updating',
+                     'paused', 'error', 'deleted')
+SYNC_STATUSES = ('pending', 'syncing', 'synced', 'error')
+BACKUP_JOB_STATUSES = ('pending', 'running', 'completed', 'failed', 'cancelled')
+PROVISIONING_JOB_STATUSES = ('pending', 'running', 'completed', 'failed',
+                             'rolled_back')
+CA_TYPES = ('root', 'intermediate', 'self_signed')
+
+# Shared validator instances
+NOT_EMPTY = IS_NOT_EMPTY()
+EMAIL = IS_EMAIL()
+VALID_RESOURCE_STATUS = IS_IN_FROZENSET(RESOURCE_STATUSES)
+VALID_SYNC_STATUS = IS_IN_FROZENSET(SYNC_STATUSES)
+VALID_BACKUP_JOB_STATUS = IS_IN_FROZENSET(BACKUP_JOB_STATUSES)
+VALID_PROVISIONING_JOB_STATUS = IS_IN_FROZENSET(PROVISIONING_JOB_STATUSES)
+VALID_CA_TYPE = IS_IN_FROZENSET(CA_TYPES)
@@ -0,0 +1,63 @@
+"""
+Shared fixtures for the manager unit tests.
+
+The real ``models`` package connects to PostgreSQL on import, so the workers
+are imported against a stand-in package that loads the real model
+submodules without opening a connection. Each test builds the tables it
+needs on an in-memory SQLite database.
+"""
+
+import importlib.util
+import os
+import sys
+import types
+
+import pytest
+from pydal import DAL
+
+MANAGER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, MANAGER_DIR)
+
+_models = types.ModuleType('models')
+_models.__path__ = [os.path.join(MANAGER_DIR, 'models')]
+_models.db = None
+_models.DB_URI = 'sqlite:memory'
+_models.get_resource_type = lambda db, resource_type_id: None
+sys.modules['models'] = _models
+
+from models.resources import RESOURCE_USERS_CHANNEL  # noqa: E402
+
+_models.RESOURCE_USERS_CHANNEL = RESOURCE_USERS_CHANNEL
+
+
+def _find_spec(name):
+    try:
+        return importlib.util.find_spec(name)
+    except ModuleNotFoundError:
+        return None
+
+
+# Resource connectors are deployed alongside the manager; when they are not
+# importable, empty connector classes are registered so user_sync can be
+# imported
+_CONNECTOR_CLASSES = {
+    'postgresql': 'PostgreSQLConnector',
+    'mariadb': 'MariaDBConnector',
+    'redis': 'RedisConnector',
+    'ceph': 'CephConnector',
+    'san': 'SANConnector',
+}
+for _name, _class_name in _CONNECTOR_CLASSES.items():
+    _module_name = f'lib.resource_connectors.{_name}'
+    if _find_spec(_module_name) is None:
+        _module = types.ModuleType(_module_name)
+        setattr(_module, _class_name, type(_class_name, (), {}))
+        sys.modules[_module_name] = _module
+
+
+@pytest.fixture
+def sqlite_db():
+    """In-memory SQLite DAL instance, closed after the test."""
+    db = DAL('sqlite:memory')
+    yield db
+    db.close()
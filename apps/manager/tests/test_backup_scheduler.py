@@ -0,0 +1,219 @@
+"""
+Tests for the backup scheduler's deadline heap and backup_jobs writer.
+"""
+
+import asyncio
+import heapq
+import time
+
+import pytest
+from pydal import Field
+
+from workers import backup_scheduler
+from workers.backup_scheduler import (
+    BACKUP_RETRY_DELAY,
+    CLEANUP_JOB_ID,
+    BackupExecutionError,
+    BackupScheduler,
+    BackupSchedule,
+    BackupStatus,
+)
+
+
+class _LocalBackend:
+    def __init__(self, config):
+        self.config = config
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    """Scheduler on a backend that needs no storage, with an empty heap."""
+    monkeypatch.setitem(backup_scheduler._backend_classes, 'local', _LocalBackend)
+    scheduler = BackupScheduler()
+    scheduler._heap.clear()
+    return scheduler
+
+
+def _schedule(scheduler, resource_id, deadline):
+    """Schedule a backup due at a monotonic deadline."""
+    job = scheduler.schedule_backup(resource_id)
+    scheduler._heap.remove((job.next_deadline, resource_id))
+    heapq.heapify(scheduler._heap)
+    job.next_deadline = deadline
+    scheduler._push_job(job)
+    return job
+
+
+def test_initial_heap_holds_the_daily_cleanup(monkeypatch):
+    monkeypatch.setitem(backup_scheduler._backend_classes, 'local', _LocalBackend)
+    scheduler = BackupScheduler()
+
+    assert [resource_id for _, resource_id in scheduler._heap] == [CLEANUP_JOB_ID]
+    assert 0 < scheduler._seconds_until_next_due() <= 86400
+
+
+def test_pop_due_returns_due_jobs_in_deadline_order(scheduler):
+    now = time.monotonic()
+    _schedule(scheduler, 1, now - 10)
+    _schedule(scheduler, 2, now - 30)
+    _schedule(scheduler, 3, now - 20)
+    _schedule(scheduler, 4, now + 1000)
+
+    assert scheduler._pop_due() == [2, 3, 1]
+    assert [resource_id for _, resource_id in scheduler._heap] == [4]
+
+
+def test_pop_due_includes_the_cleanup_entry(scheduler):
+    now = time.monotonic()
+    _schedule(scheduler, 1, now - 10)
+    heapq.heappush(scheduler._heap, (now - 20, CLEANUP_JOB_ID))
+
+    assert scheduler._pop_due() == [CLEANUP_JOB_ID, 1]
+
+
+def test_pop_due_drops_removed_and_disabled_jobs(scheduler):
+    now = time.monotonic()
+    _schedule(scheduler, 1, now - 10)
+    _schedule(scheduler, 2, now - 10)
+    _schedule(scheduler, 3, now - 10)
+    del scheduler.backup_jobs[1]
+    scheduler.backup_jobs[2].enabled = False
+
+    assert scheduler._pop_due() == [3]
+    assert scheduler._heap == []
+
+
+def test_pop_due_repushes_stale_entries_at_the_current_deadline(scheduler):
+    now = time.monotonic()
+    job = _schedule(scheduler, 1, now - 10)
+    job.next_deadline = now + 1000
+
+    assert scheduler._pop_due() == []
+    assert scheduler._heap == [(now + 1000, 1)]
+
+
+def test_pop_due_returns_duplicate_entries_once(scheduler):
+    now = time.monotonic()
+    job = _schedule(scheduler, 1, now - 10)
+    scheduler._push_job(job)
+
+    assert scheduler._pop_due() == [1]
+    assert scheduler._heap == []
+
+
+def test_push_job_skips_disabled_jobs(scheduler):
+    scheduler.schedule_backup(1, enabled=False)
+
+    assert scheduler._heap == []
+    assert scheduler._seconds_until_next_due() is None
+
+
+def test_push_job_wakes_the_worker(scheduler):
+    scheduler._wakeup_event.clear()
+    scheduler.schedule_backup(1)
+
+    assert scheduler._wakeup_event.is_set()
+    assert scheduler._seconds_until_next_due() == 0.0
+
+
+def test_reschedule_pushes_the_next_run(scheduler):
+    job = scheduler.schedule_backup(1, schedule=BackupSchedule.WEEKLY)
+    scheduler._pop_due()
+    job.next_deadline = job.calculate_next_run()
+
+    scheduler._reschedule(1)
+
+    assert scheduler._heap == [(job.next_deadline, 1)]
+    assert 604800 - 5 < scheduler._seconds_until_next_due() <= 604800
+
+
+def test_reschedule_of_cleanup_pushes_the_next_cleanup(scheduler):
+    scheduler._reschedule(CLEANUP_JOB_ID)
+
+    [(deadline, resource_id)] = scheduler._heap
+    assert resource_id == CLEANUP_JOB_ID
+    assert 0 < deadline - time.monotonic() <= 86400
+
+
+def test_reschedule_of_removed_job_is_a_no_op(scheduler):
+    scheduler._reschedule(1)
+
+    assert scheduler._heap == []
+
+
+def test_failed_backup_is_retried_after_the_retry_delay(scheduler, monkeypatch):
+    job = scheduler.schedule_backup(1)
+    scheduler._pop_due()
+
+    def fail(resource_id, job_id=None):
+        raise BackupExecutionError("backend unavailable")
+
+    monkeypatch.setattr(scheduler, 'execute_backup', fail)
+    scheduler._run_due(1)
+    scheduler._reschedule(1)
+
+    assert scheduler._heap == [(job.next_deadline, 1)]
+    assert (
+        BACKUP_RETRY_DELAY - 5
+        < scheduler._seconds_until_next_due()
+        <= BACKUP_RETRY_DELAY
+    )
+
+
+def test_scheduler_tasks_leave_the_loop_task_factory_alone():
+    async def double(value):
+        return value * 2
+
+    async def main():
+        task = BackupScheduler._create_task(double(21))
+        return await task, asyncio.get_running_loop().get_task_factory()
+
+    assert asyncio.run(main()) == (42, None)
+
+
+@pytest.fixture
+def backup_jobs_db(sqlite_db, monkeypatch):
+    """SQLite backup_jobs table used as the scheduler's database."""
+    sqlite_db.define_table(
+        'backup_jobs',
+        Field('status', 'string'),
+        Field('backup_location', 'text'),
+        Field('backup_size_bytes', 'bigint'),
+        Field('error_message', 'text'),
+        Field('completed_at', 'datetime'),
+    )
+    monkeypatch.setattr(backup_scheduler, 'db', sqlite_db)
+    return sqlite_db
+
+
+def test_full_update_queue_is_written_by_the_caller(scheduler, backup_jobs_db, monkeypatch):
+    monkeypatch.setattr(backup_scheduler, 'BACKUP_DB_QUEUE_SIZE', 3)
+    monkeypatch.setattr(backup_scheduler, 'BACKUP_DB_BATCH_SIZE', 2)
+    job_ids = [backup_jobs_db.backup_jobs.insert(status='running') for _ in range(3)]
+    backup_jobs_db.commit()
+    scheduler.running = True
+
+    scheduler._update_backup_job_db(job_ids[0], BackupStatus.COMPLETED, size_bytes=10)
+    scheduler._update_backup_job_db(job_ids[1], BackupStatus.FAILED, error_msg='timeout')
+    assert len(scheduler._db_queue) == 2
+
+    scheduler._update_backup_job_db(job_ids[2], BackupStatus.COMPLETED)
+
+    assert not scheduler._db_queue
+    assert [row.status for row in backup_jobs_db(backup_jobs_db.backup_jobs).select()] == [
+        'completed', 'failed', 'completed',
+    ]
+
+
+def test_later_update_of_a_job_wins(scheduler, backup_jobs_db):
+    job_id = backup_jobs_db.backup_jobs.insert(status='pending')
+    backup_jobs_db.commit()
+    scheduler.running = True
+
+    scheduler._update_backup_job_db(job_id, BackupStatus.RUNNING)
+    scheduler._update_backup_job_db(job_id, BackupStatus.COMPLETED, backup_location='/b/1')
+    scheduler._flush_db_queue()
+
+    job = backup_jobs_db.backup_jobs(job_id)
+    assert (job.status, job.backup_location) == ('completed', '/b/1')
+    assert job.completed_at is not None
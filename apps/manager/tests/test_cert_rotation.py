@@ -0,0 +1,183 @@
+"""
+Tests for the certificate rotation worker's expiry query.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from pydal import Field
+
+from workers.cert_rotation import CertRotationWorker
+
+NOW = datetime(2026, 1, 15, 12, 0, 0)
+
+
+@pytest.fixture
+def certificates_db(sqlite_db):
+    """SQLite database with the columns the certificate expiry query reads."""
+    sqlite_db.define_table(
+        'resources',
+        Field('name', 'string'),
+        Field('k8s_namespace', 'string'),
+        Field('k8s_resource_name', 'string'),
+    )
+    sqlite_db.define_table(
+        'certificates',
+        Field('resource_id', 'reference resources'),
+        Field('ca_id', 'integer'),
+        Field('common_name', 'string'),
+        Field('san_dns', 'list:string'),
+        Field('san_ips', 'list:string'),
+        Field('valid_until', 'datetime'),
+        Field('renewal_threshold_days', 'integer', default=30),
+        Field('auto_renew', 'boolean', default=True),
+        Field('renewal_attempts', 'integer', default=0),
+        Field('next_renewal_attempt_at', 'datetime'),
+        Field('deleted_at', 'datetime'),
+    )
+    return sqlite_db
+
+
+@pytest.fixture
+def make_worker(certificates_db):
+    """Build workers on the SQLite database and stop their reload threads."""
+    workers = []
+
+    def make_worker(**kwargs):
+        worker = CertRotationWorker(certificates_db, ca_manager=object(), **kwargs)
+        workers.append(worker)
+        return worker
+
+    yield make_worker
+    for worker in workers:
+        worker.stop()
+
+
+def _insert_certificates(db, count, **fields):
+    values = dict(
+        ca_id=1,
+        common_name='db.example.com',
+        valid_until=NOW + timedelta(days=5),
+        renewal_threshold_days=30,
+        auto_renew=True,
+    )
+    values.update(fields)
+    ids = [db.certificates.insert(**values) for _ in range(count)]
+    db.commit()
+    return ids
+
+
+def _expiring_ids(worker, batch_size):
+    return [
+        cert.cert_id
+        for cert in worker.iter_expiring_certificates(now=NOW, batch_size=batch_size)
+    ]
+
+
+@pytest.mark.parametrize('count', [0, 1, 2, 3, 4, 5, 7])
+def test_batches_return_every_certificate_once(make_worker, certificates_db, count):
+    ids = _insert_certificates(certificates_db, count)
+    worker = make_worker()
+
+    assert _expiring_ids(worker, batch_size=3) == ids
+
+
+def test_full_last_batch_is_followed_by_one_empty_query(make_worker, certificates_db, monkeypatch):
+    ids = _insert_certificates(certificates_db, 6)
+    worker = make_worker()
+    cursors = []
+    select = worker._select_expiring_batch
+
+    def record_cursor(now, last_id, batch_size):
+        cursors.append(last_id)
+        return select(now, last_id, batch_size)
+
+    monkeypatch.setattr(worker, '_select_expiring_batch', record_cursor)
+
+    assert _expiring_ids(worker, batch_size=3) == ids
+    assert cursors == [0, ids[2], ids[5]]
+
+
+def test_short_batch_ends_the_scan(make_worker, certificates_db, monkeypatch):
+    _insert_certificates(certificates_db, 5)
+    worker = make_worker()
+    cursors = []
+    select = worker._select_expiring_batch
+
+    def record_cursor(now, last_id, batch_size):
+        cursors.append(last_id)
+        return select(now, last_id, batch_size)
+
+    monkeypatch.setattr(worker, '_select_expiring_batch', record_cursor)
+    _expiring_ids(worker, batch_size=3)
+
+    assert len(cursors) == 2
+
+
+def test_cursor_skips_ids_that_do_not_match(make_worker, certificates_db):
+    renewable = _insert_certificates(certificates_db, 2)
+    _insert_certificates(certificates_db, 3, valid_until=NOW + timedelta(days=90))
+    renewable += _insert_certificates(certificates_db, 2)
+    worker = make_worker()
+
+    assert _expiring_ids(worker, batch_size=2) == renewable
+
+
+def test_renewal_threshold_boundary(make_worker, certificates_db):
+    # Whole days until expiry must be <= renewal_threshold_days
+    inside = _insert_certificates(
+        certificates_db, 1,
+        renewal_threshold_days=7,
+        valid_until=NOW + timedelta(days=7, hours=23),
+    )
+    _insert_certificates(
+        certificates_db, 1,
+        renewal_threshold_days=7,
+        valid_until=NOW + timedelta(days=8),
+    )
+    worker = make_worker()
+
+    assert _expiring_ids(worker, batch_size=10) == inside
+
+
+def test_deleted_and_backed_off_certificates_are_excluded(make_worker, certificates_db):
+    due = _insert_certificates(certificates_db, 1)
+    due += _insert_certificates(
+        certificates_db, 1, next_renewal_attempt_at=NOW - timedelta(minutes=1),
+    )
+    _insert_certificates(certificates_db, 1, deleted_at=NOW - timedelta(days=1))
+    _insert_certificates(
+        certificates_db, 1, next_renewal_attempt_at=NOW + timedelta(minutes=1),
+    )
+    worker = make_worker()
+
+    assert _expiring_ids(worker, batch_size=10) == due
+
+
+def test_manual_certificates_need_a_notification_handler(make_worker, certificates_db):
+    near = _insert_certificates(
+        certificates_db, 1, auto_renew=False, valid_until=NOW + timedelta(days=3),
+    )
+    _insert_certificates(
+        certificates_db, 1, auto_renew=False, valid_until=NOW + timedelta(days=20),
+    )
+
+    assert _expiring_ids(make_worker(), batch_size=10) == []
+    notifying = make_worker(notification_handler=object(), notification_threshold_days=7)
+    assert _expiring_ids(notifying, batch_size=10) == near
+
+
+def test_kubernetes_target_is_joined_when_secrets_are_updated(make_worker, certificates_db):
+    resource_id = certificates_db.resources.insert(
+        name='db', k8s_namespace='tenant-a', k8s_resource_name='db-0',
+    )
+    _insert_certificates(certificates_db, 1, resource_id=resource_id)
+    _insert_certificates(certificates_db, 1)
+    worker = make_worker(k8s_client=object())
+
+    certs = list(worker.iter_expiring_certificates(now=NOW, batch_size=1))
+
+    assert [(c.k8s_namespace, c.k8s_resource_name) for c in certs] == [
+        ('tenant-a', 'db-0'),
+        (None, None),
+    ]
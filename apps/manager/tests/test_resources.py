@@ -0,0 +1,94 @@
+"""
+Tests for the resources capability flags.
+"""
+
+import pytest
+from pydal import Field
+
+from models.resources import (
+    CAN_BACKUP,
+    CAN_MODIFY_CONFIG,
+    CAN_MODIFY_USERS,
+    CAN_SCALE,
+    TLS_ENABLED,
+    RESOURCE_FLAG_FIELDS,
+    has_flag,
+    pack_resource_flags,
+    repack_resource_flags,
+    set_flag,
+)
+
+
+@pytest.fixture
+def resources_db(sqlite_db):
+    """SQLite database with the resources capability columns."""
+    sqlite_db.define_table(
+        'resources',
+        Field('name', 'string'),
+        *[Field(name, 'boolean', default=False) for name in RESOURCE_FLAG_FIELDS],
+        Field('flags', 'bigint', default=0, compute=pack_resource_flags),
+    )
+    sqlite_db.resources._before_update.append(repack_resource_flags)
+    return sqlite_db
+
+
+def _flags(db, resource_id):
+    return db.resources(resource_id).flags
+
+
+def test_insert_packs_flags(resources_db):
+    resource_id = resources_db.resources.insert(
+        name='db', can_modify_users=True, can_backup=True,
+    )
+
+    assert _flags(resources_db, resource_id) == CAN_MODIFY_USERS | CAN_BACKUP
+
+
+def test_partial_update_keeps_other_bits(resources_db):
+    resource_id = resources_db.resources.insert(
+        name='db', can_modify_users=True, can_modify_config=True, can_backup=True,
+    )
+
+    resources_db(resources_db.resources.id == resource_id).update(can_backup=False)
+
+    assert _flags(resources_db, resource_id) == CAN_MODIFY_USERS | CAN_MODIFY_CONFIG
+
+
+def test_partial_update_repacks_each_row(resources_db):
+    first = resources_db.resources.insert(name='a', can_scale=True)
+    second = resources_db.resources.insert(name='b', tls_enabled=True)
+
+    resources_db(resources_db.resources.id > 0).update(can_backup=True)
+
+    assert _flags(resources_db, first) == CAN_SCALE | CAN_BACKUP
+    assert _flags(resources_db, second) == TLS_ENABLED | CAN_BACKUP
+
+
+def test_full_update_packs_flags(resources_db):
+    resource_id = resources_db.resources.insert(name='db', can_backup=True)
+
+    resources_db(resources_db.resources.id == resource_id).update(
+        **{name: True for name in RESOURCE_FLAG_FIELDS}
+    )
+
+    assert _flags(resources_db, resource_id) == sum(RESOURCE_FLAG_FIELDS.values())
+
+
+def test_update_without_capability_columns_leaves_flags(resources_db):
+    resource_id = resources_db.resources.insert(name='db', can_backup=True)
+
+    resources_db(resources_db.resources.id == resource_id).update(name='renamed')
+
+    assert _flags(resources_db, resource_id) == CAN_BACKUP
+
+
+def test_set_flag_updates_bits_and_columns(resources_db):
+    resource_id = resources_db.resources.insert(name='db', can_scale=True)
+
+    set_flag(resources_db.resources(resource_id), CAN_BACKUP | TLS_ENABLED)
+    row = resources_db.resources(resource_id)
+
+    assert row.flags == CAN_SCALE | CAN_BACKUP | TLS_ENABLED
+    assert (row.can_backup, row.tls_enabled, row.can_modify_users) == (True, True, False)
+    assert has_flag(row, CAN_BACKUP | CAN_SCALE)
+    assert not has_flag(row, CAN_BACKUP | CAN_MODIFY_USERS)
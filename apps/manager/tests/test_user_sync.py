@@ -0,0 +1,127 @@
+"""
+Tests for the user sync worker's sync_status transitions.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydal import Field
+
+from workers.user_sync import SYNCING_STALE_AFTER, UserSyncWorker
+
+
+@pytest.fixture
+def resource_users_db(sqlite_db):
+    """SQLite database with the resource_users sync columns."""
+    sqlite_db.define_table(
+        'resource_users',
+        Field('username', 'string'),
+        Field('sync_status', 'string', default='pending'),
+        Field('sync_error', 'text'),
+        Field('last_synced_at', 'datetime'),
+        Field('updated_at', 'datetime'),
+    )
+    return sqlite_db
+
+
+@pytest.fixture
+def worker(resource_users_db):
+    """Worker bound to the SQLite database, without signal handlers or a pool."""
+    worker = UserSyncWorker.__new__(UserSyncWorker)
+    worker.db = resource_users_db
+    return worker
+
+
+def _insert_users(db, count, **fields):
+    ids = [
+        db.resource_users.insert(username=f'user{i}', **fields)
+        for i in range(count)
+    ]
+    db.commit()
+    return ids
+
+
+def _user(db, user_id):
+    return db.resource_users(user_id)
+
+
+def test_record_sync_results_sets_each_outcome(worker, resource_users_db):
+    synced, skipped, failed = (
+        _insert_users(resource_users_db, 2, sync_status='syncing', sync_error='old error'),
+        _insert_users(resource_users_db, 1, sync_status='syncing'),
+        _insert_users(resource_users_db, 3, sync_status='syncing'),
+    )
+    untouched = _insert_users(resource_users_db, 1, sync_status='syncing')
+
+    worker._record_sync_results(
+        synced,
+        skipped,
+        {
+            failed[0]: 'Connection refused',
+            failed[1]: 'Permission denied',
+            failed[2]: 'Connection refused',
+        },
+    )
+
+    for user_id in synced:
+        user = _user(resource_users_db, user_id)
+        assert (user.sync_status, user.sync_error) == ('synced', None)
+        assert user.last_synced_at is not None
+    assert _user(resource_users_db, skipped[0]).sync_status == 'pending'
+    assert [
+        (_user(resource_users_db, user_id).sync_status,
+         _user(resource_users_db, user_id).sync_error)
+        for user_id in failed
+    ] == [
+        ('error', 'Connection refused'),
+        ('error', 'Permission denied'),
+        ('error', 'Connection refused'),
+    ]
+    assert _user(resource_users_db, untouched[0]).sync_status == 'syncing'
+
+
+def test_record_sync_results_with_nothing_to_record(worker, resource_users_db):
+    user_ids = _insert_users(resource_users_db, 1, sync_status='syncing')
+
+    worker._record_sync_results([], [], {})
+
+    assert _user(resource_users_db, user_ids[0]).sync_status == 'syncing'
+
+
+def test_record_sync_results_rolls_back_on_failure(worker, resource_users_db, monkeypatch):
+    user_ids = _insert_users(resource_users_db, 2, sync_status='syncing')
+
+    def fail():
+        raise RuntimeError("connection lost")
+
+    monkeypatch.setattr(resource_users_db, 'commit', fail)
+    worker._record_sync_results(user_ids[:1], [], {user_ids[1]: 'Timed out'})
+
+    assert [
+        _user(resource_users_db, user_id).sync_status for user_id in user_ids
+    ] == ['syncing', 'syncing']
+
+
+def test_requeue_stale_syncing_returns_abandoned_claims(worker, resource_users_db):
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    stale = _insert_users(
+        resource_users_db, 2,
+        sync_status='syncing',
+        updated_at=now - timedelta(seconds=SYNCING_STALE_AFTER + 60),
+    )
+    fresh = _insert_users(
+        resource_users_db, 1,
+        sync_status='syncing',
+        updated_at=now - timedelta(seconds=SYNCING_STALE_AFTER - 60),
+    )
+    errored = _insert_users(
+        resource_users_db, 1,
+        sync_status='error',
+        updated_at=now - timedelta(seconds=SYNCING_STALE_AFTER + 60),
+    )
+
+    worker._requeue_stale_syncing()
+
+    assert [_user(resource_users_db, i).sync_status for i in stale] == ['pending', 'pending']
+    assert _user(resource_users_db, fresh[0]).sync_status == 'syncing'
+    assert _user(resource_users_db, errored[0]).sync_status == 'error'
@@ -7,22 +7,60 @@ Integrates with resource connectors for backup triggers and metadata collection.
 
 import logging
 import os
+import shutil
 import tempfile
+import threading
 import time
-from typing import Dict, List, Any, Optional
+from typing import Deque, Dict, Iterator, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass
 from enum import Enum
 import asyncio
+import concurrent.futures
+import heapq
+import importlib
+from collections import deque
 from pathlib import Path
 
 try:
-    from models import db
+    from models import db, get_resource_type
+    from models.ddl import is_postgres
 except ImportError:
     db = None
 
 logger = logging.getLogger(__name__)
 
+# Heap key of the daily retention cleanup; resource IDs are always positive
+CLEANUP_JOB_ID = -1
+
+# Backup backend classes by backend type, as "module:ClassName"
+_BACKENDS = {
+    's3': 'lib.backup_backends.s3:S3BackupBackend',
+    'nfs': 'lib.backup_backends.nfs:NFSBackupBackend',
+    'local': 'lib.backup_backends.local:LocalBackupBackend',
+}
+
+# Backend classes imported so far, by backend type
+_backend_classes: Dict[str, type] = {}
+
+
+# Seconds before a failed backup is attempted again
+BACKUP_RETRY_DELAY = 300.0
+
+# Queued backup_jobs updates at which the enqueuing thread writes the
+# backlog itself instead of waiting for the write-behind writer
+BACKUP_DB_QUEUE_SIZE = 1024
+
+# Seconds between write-behind flushes, and updates per flushed batch
+BACKUP_DB_FLUSH_INTERVAL = 0.1
+BACKUP_DB_BATCH_SIZE = 100
+
+# Concurrent per-resource backend cleanups during the retention sweep
+BACKUP_CLEANUP_CONCURRENCY = 8
+
+# Write buffer size when staging a backup stream on disk
+BACKUP_BUFFER_SIZE = 8 * 1024 * 1024
+
 
 class BackupType(Enum):
     """Backup type enumeration."""
@@ -58,6 +96,17 @@ class BackupExecutionError(BackupSchedulerError):
     pass
 
 
+# Seconds between runs for each schedule
+_SCHEDULE_DELTA_SECONDS = {
+    BackupSchedule.DAILY: 86400.0,
+    BackupSchedule.WEEKLY: 604800.0,
+    # Approximately 30 days
+    BackupSchedule.MONTHLY: 2592000.0,
+    # Custom schedule, use daily as default
+    BackupSchedule.CUSTOM: 86400.0,
+}
+
+
 @dataclass
 class BackupConfig:
     """Backup configuration parameters."""
@@ -70,17 +119,10 @@ class BackupConfig:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            'backend_type': self.backend_type,
-            'backend_config': self.backend_config,
-            'retention_days': self.retention_days,
-            'compression_enabled': self.compression_enabled,
-            'compression_format': self.compression_format,
-            'verify_integrity': self.verify_integrity,
-        }
+        return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class BackupJob:
     """Backup job configuration."""
     resource_id: int
@@ -88,43 +130,70 @@ class BackupJob:
     schedule: BackupSchedule = BackupSchedule.DAILY
     enabled: bool = True
     last_backup_time: Optional[datetime] = None
-    next_backup_time: Optional[datetime] = None
+    # time.monotonic() deadline of the next run, immune to wall-clock steps
+    next_deadline: Optional[float] = None
     retry_count: int = 0
     max_retries: int = 3
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    # Allocated by callers on first use; most jobs never carry metadata
+    metadata: Optional[Dict[str, Any]] = None
 
-    def should_run(self) -> bool:
+    def should_run(self, now_mono: Optional[float] = None) -> bool:
         """Check if backup job should run now.
 
+        Args:
+            now_mono: Current time.monotonic() value, read if not given
+
         Returns:
             True if backup should run
         """
         if not self.enabled:
             return False
 
-        if self.next_backup_time is None:
+        if self.next_deadline is None:
             return True
 
-        return datetime.utcnow() >= self.next_backup_time
+        if now_mono is None:
+            now_mono = time.monotonic()
+        return self.next_deadline <= now_mono
+
+    def calculate_next_run(self, now_mono: Optional[float] = None) -> float:
+        """Calculate next backup run deadline.
 
-    def calculate_next_run(self) -> datetime:
-        """Calculate next backup run time.
+        Args:
+            now_mono: Current time.monotonic() value, read if not given
 
         Returns:
-            datetime of next backup
+            time.monotonic() deadline of next backup
         """
-        now = datetime.utcnow()
+        if now_mono is None:
+            now_mono = time.monotonic()
+
+        return now_mono + _SCHEDULE_DELTA_SECONDS[self.schedule]
+
+
+def _load_backend_class(backend_type: str) -> type:
+    """Get the backup backend class for a backend type.
 
-        if self.schedule == BackupSchedule.DAILY:
-            return now + timedelta(days=1)
-        elif self.schedule == BackupSchedule.WEEKLY:
-            return now + timedelta(weeks=1)
-        elif self.schedule == BackupSchedule.MONTHLY:
-            # Add approximately 30 days
-            return now + timedelta(days=30)
-        else:
-            # Custom schedule, use daily as default
-            return now + timedelta(days=1)
+    The class is imported on first use and cached for later schedulers.
+
+    Args:
+        backend_type: Backend type ('s3', 'nfs', 'local')
+
+    Returns:
+        Backend class
+
+    Raises:
+        BackupSchedulerError: If the backend type is unknown
+    """
+    backend_class = _backend_classes.get(backend_type)
+    if backend_class is None:
+        target = _BACKENDS.get(backend_type)
+        if target is None:
+            raise BackupSchedulerError(f"Unknown backend type: {backend_type}")
+        module_name, class_name = target.split(':')
+        backend_class = getattr(importlib.import_module(module_name), class_name)
+        _backend_classes[backend_type] = backend_class
+    return backend_class
 
 
 class BackupScheduler:
@@ -146,10 +215,35 @@ class BackupScheduler:
         self.backup_jobs: Dict[int, BackupJob] = {}
         self.running = False
         self.worker_task = None
+
+        # Min-heap of (monotonic deadline, resource ID); entries go stale when
+        # a job is rescheduled and are re-checked against the job when popped
+        self._heap: List[Tuple[float, int]] = [
+            (self._next_cleanup_deadline(), CLEANUP_JOB_ID),
+        ]
+        self._wakeup_event = asyncio.Event()
+
+        # backup_jobs updates waiting for the write-behind writer; deque
+        # appends are thread-safe, so pool threads can enqueue directly.
+        # Flushes hold the lock so updates of a job are written in order
+        self._db_queue: Deque[Tuple[int, Dict[str, Any]]] = deque()
+        self._db_write_lock = threading.Lock()
+
+        # Dedicated pool so long backups never starve the default executor;
+        # created by run() and shut down when it exits
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
         self._initialize_backend()
 
         logger.info("Backup scheduler initialized")
 
+    def _create_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Create the backup thread pool."""
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=int(os.getenv('BACKUP_POOL_SIZE', '8')),
+            thread_name_prefix='backup',
+        )
+
     def _parse_config(self, config: Dict[str, Any]) -> BackupConfig:
         """Parse and validate backup configuration.
 
@@ -183,18 +277,8 @@ class BackupScheduler:
         """
         try:
             backend_type = self.config.backend_type
-
-            if backend_type == 's3':
-                from lib.backup_backends.s3 import S3BackupBackend
-                self.backend = S3BackupBackend(self.config.backend_config)
-            elif backend_type == 'nfs':
-                from lib.backup_backends.nfs import NFSBackupBackend
-                self.backend = NFSBackupBackend(self.config.backend_config)
-            elif backend_type == 'local':
-                from lib.backup_backends.local import LocalBackupBackend
-                self.backend = LocalBackupBackend(self.config.backend_config)
-            else:
-                raise BackupSchedulerError(f"Unknown backend type: {backend_type}")
+            backend_class = _load_backend_class(backend_type)
+            self.backend = backend_class(self.config.backend_config)
 
             logger.info(f"Backup backend initialized: {backend_type}")
 
@@ -221,10 +305,11 @@ class BackupScheduler:
             backup_type=backup_type,
             schedule=schedule,
             enabled=enabled,
-            next_backup_time=datetime.utcnow(),
+            next_deadline=time.monotonic(),
         )
 
         self.backup_jobs[resource_id] = job
+        self._push_job(job)
         logger.info(f"Backup scheduled for resource {resource_id}: schedule={schedule.value}, "
                    f"type={backup_type.value}")
 
@@ -259,6 +344,7 @@ class BackupScheduler:
             'backup_location': None,
             'error_message': None,
         }
+        backup_data: Dict[str, Any] = {}
 
         try:
             # Attempt backup execution
@@ -273,15 +359,17 @@ class BackupScheduler:
                 backup_data = self._execute_resource_backup(resource_id)
 
             # Upload backup to backend
-            backup_location = self._upload_backup(resource_id, backup_data)
+            upload_result = self._upload_backup(resource_id, backup_data)
+            backup_location = upload_result['remote_path']
 
             # Verify backup integrity if enabled
             if self.config.verify_integrity:
-                self._verify_backup(backup_location)
+                self._verify_backup(upload_result)
 
             # Update job status
-            job.last_backup_time = datetime.utcnow()
-            job.next_backup_time = job.calculate_next_run()
+            completed_at = datetime.utcnow()
+            job.last_backup_time = completed_at
+            job.next_deadline = job.calculate_next_run()
             job.retry_count = 0
 
             # Update database if available
@@ -293,7 +381,7 @@ class BackupScheduler:
                 'status': BackupStatus.COMPLETED.value,
                 'backup_size_bytes': backup_data.get('size_bytes', 0),
                 'backup_location': backup_location,
-                'completed_at': datetime.utcnow().isoformat(),
+                'completed_at': completed_at.isoformat(),
             })
 
             logger.info(f"Backup completed for resource {resource_id}: "
@@ -319,8 +407,8 @@ class BackupScheduler:
             raise BackupExecutionError(error_msg)
 
         finally:
-            # Cleanup temporary files
-            self._cleanup_temp_files()
+            # Cleanup this job's temporary files
+            self._cleanup_temp_files(backup_data.get('temp_dir'))
 
         return result
 
@@ -348,22 +436,50 @@ class BackupScheduler:
                 'resources_cleaned': [],
             }
 
-            # Clean up backups for each resource
-            for resource_id in self.backup_jobs:
-                try:
-                    prefix = f"{resource_id}/"
-                    cleanup_result = self.backend.cleanup_old_backups(max_age_seconds, prefix)
-
-                    stats['deleted_count'] += cleanup_result['deleted_count']
-                    stats['freed_space_bytes'] += cleanup_result['freed_space_bytes']
-                    stats['resources_cleaned'].append({
-                        'resource_id': resource_id,
-                        'deleted_count': cleanup_result['deleted_count'],
-                        'freed_space_bytes': cleanup_result['freed_space_bytes'],
-                    })
+            prefixes = {f"{resource_id}/": resource_id for resource_id in list(self.backup_jobs)}
 
+            # Backends that can clean many prefixes in one listing/delete pass
+            # get a single batched call
+            cleanup_batch = getattr(self.backend, 'cleanup_old_backups_batch', None)
+            batch_results = {}
+            if cleanup_batch is not None and prefixes:
+                try:
+                    batch_results = cleanup_batch(max_age_seconds, list(prefixes))
                 except Exception as e:
-                    logger.warning(f"Failed to cleanup backups for resource {resource_id}: {e}")
+                    logger.warning(f"Batched backup cleanup failed, cleaning per resource: {e}")
+
+            # Prefixes the batch did not cover are cleaned concurrently; they
+            # are independent backend round trips
+            pending = [prefix for prefix in prefixes if prefix not in batch_results]
+            results = dict(batch_results)
+            if pending:
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(len(pending), BACKUP_CLEANUP_CONCURRENCY),
+                    thread_name_prefix='backup-cleanup',
+                ) as executor:
+                    futures = {
+                        prefix: executor.submit(self.backend.cleanup_old_backups,
+                                                max_age_seconds, prefix)
+                        for prefix in pending
+                    }
+                    for prefix, future in futures.items():
+                        exception = future.exception()
+                        results[prefix] = exception if exception else future.result()
+
+            for prefix, resource_id in prefixes.items():
+                cleanup_result = results[prefix]
+                if isinstance(cleanup_result, Exception):
+                    logger.warning(f"Failed to cleanup backups for resource {resource_id}: "
+                                   f"{cleanup_result}")
+                    continue
+
+                stats['deleted_count'] += cleanup_result['deleted_count']
+                stats['freed_space_bytes'] += cleanup_result['freed_space_bytes']
+                stats['resources_cleaned'].append({
+                    'resource_id': resource_id,
+                    'deleted_count': cleanup_result['deleted_count'],
+                    'freed_space_bytes': cleanup_result['freed_space_bytes'],
+                })
 
             logger.info(f"Cleanup completed: deleted {stats['deleted_count']} backups, "
                        f"freed {stats['freed_space_bytes']} bytes")
@@ -396,16 +512,12 @@ class BackupScheduler:
                 raise BackupExecutionError(f"Resource does not support backups: {resource_id}")
 
             # Get resource type to determine backup method
-            resource_type = db.resource_types[resource.resource_type_id]
-
-            # Create temporary backup file
-            temp_dir = tempfile.mkdtemp(prefix=f"backup_resource_{resource_id}_")
-            backup_file = Path(temp_dir) / "backup.tar.gz"
+            resource_type = get_resource_type(db, resource.resource_type_id)
 
             logger.info(f"Creating backup for resource {resource_id} ({resource_type.name})")
 
             # Import resource connector based on type
-            backup_data = self._create_resource_dump(resource, resource_type, backup_file)
+            backup_data = self._create_resource_dump(resource, resource_type)
 
             return backup_data
 
@@ -413,31 +525,28 @@ class BackupScheduler:
             logger.error(f"Failed to backup resource {resource_id}: {e}")
             raise BackupExecutionError(f"Resource backup failed: {e}")
 
-    def _create_resource_dump(self, resource: Any, resource_type: Any,
-                             output_file: Path) -> Dict[str, Any]:
-        """Create resource dump/backup file.
+    def _create_resource_dump(self, resource: Any, resource_type: Any) -> Dict[str, Any]:
+        """Create resource dump/backup stream.
+
+        The dump is produced lazily as byte chunks under ``chunks``; its size
+        is known once the stream has been consumed by _upload_backup.
 
         Args:
             resource: Resource database object
             resource_type: Resource type database object
-            output_file: Path to output backup file
 
         Returns:
             Dictionary with backup metadata
         """
         try:
-            # For now, create mock backup file
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            output_file.write_text(f"Backup of {resource.name} ({resource_type.name})\n")
-
-            file_size = output_file.stat().st_size
+            # For now, create mock backup contents
+            content = f"Backup of {resource.name} ({resource_type.name})\n".encode()
 
             return {
-                'size_bytes': file_size,
+                'chunks': iter([content]),
                 'format': 'tar.gz',
                 'resource_name': resource.name,
                 'resource_type': resource_type.name,
-                'temp_path': str(output_file),
             }
 
         except Exception as e:
@@ -453,18 +562,13 @@ class BackupScheduler:
         Returns:
             Dictionary with mock backup metadata
         """
-        temp_dir = tempfile.mkdtemp(prefix=f"backup_resource_{resource_id}_")
-        backup_file = Path(temp_dir) / "backup.tar.gz"
-        backup_file.write_text(f"Mock backup for resource {resource_id}\n")
-
         return {
-            'size_bytes': backup_file.stat().st_size,
+            'chunks': iter([f"Mock backup for resource {resource_id}\n".encode()]),
             'format': 'tar.gz',
             'resource_id': resource_id,
-            'temp_path': str(backup_file),
         }
 
-    def _upload_backup(self, resource_id: int, backup_data: Dict[str, Any]) -> str:
+    def _upload_backup(self, resource_id: int, backup_data: Dict[str, Any]) -> Dict[str, Any]:
         """Upload backup file to backend storage.
 
         Args:
@@ -472,31 +576,88 @@ class BackupScheduler:
             backup_data: Backup data dictionary
 
         Returns:
-            Remote path/location of uploaded backup
+            Backend upload result, with at least ``remote_path``
 
         Raises:
             BackupExecutionError: If upload fails
         """
         try:
-            temp_path = backup_data['temp_path']
-            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-            remote_path = f"{resource_id}/backup_{timestamp}.tar.gz"
+            # Formatted from struct_time fields; avoids strftime's locale lookup
+            tm = time.gmtime()
+            remote_path = (
+                f"{resource_id}/backup_{tm.tm_year:04d}{tm.tm_mon:02d}{tm.tm_mday:02d}_"
+                f"{tm.tm_hour:02d}{tm.tm_min:02d}{tm.tm_sec:02d}.tar.gz"
+            )
 
             logger.info(f"Uploading backup to backend: {remote_path}")
 
-            upload_result = self.backend.upload(temp_path, remote_path)
+            chunks = self._count_bytes(backup_data['chunks'], backup_data)
+            upload_stream = getattr(self.backend, 'upload_stream', None)
+            if upload_stream is not None:
+                # Streamed straight to the backend, one pass over the bytes
+                upload_result = upload_stream(chunks, remote_path)
+            else:
+                temp_path = self._stage_backup(resource_id, chunks, backup_data)
+                backup_data['temp_path'] = temp_path
+                upload_result = self.backend.upload(temp_path, remote_path)
 
-            return upload_result['remote_path']
+            return upload_result
 
         except Exception as e:
             logger.error(f"Failed to upload backup: {e}")
             raise BackupExecutionError(f"Upload failed: {e}")
 
-    def _verify_backup(self, backup_location: str) -> bool:
+    @staticmethod
+    def _count_bytes(chunks: Iterator[bytes], backup_data: Dict[str, Any]) -> Iterator[bytes]:
+        """Pass chunks through while recording the total in ``size_bytes``.
+
+        Args:
+            chunks: Backup byte chunks
+            backup_data: Backup data dictionary to update
+
+        Yields:
+            The input chunks
+        """
+        backup_data['size_bytes'] = 0
+        for chunk in chunks:
+            backup_data['size_bytes'] += len(chunk)
+            yield chunk
+
+    def _stage_backup(
+        self,
+        resource_id: int,
+        chunks: Iterator[bytes],
+        backup_data: Dict[str, Any],
+    ) -> str:
+        """Write a backup stream to a temporary file for path-based backends.
+
+        The temporary directory is recorded in ``backup_data['temp_dir']``
+        before anything is written, so cleanup also removes partial files.
+
+        Args:
+            resource_id: ID of resource
+            chunks: Backup byte chunks
+            backup_data: Backup data dictionary to update
+
+        Returns:
+            Path of the staged backup file
+        """
+        temp_dir = tempfile.mkdtemp(prefix=f"backup_resource_{resource_id}_")
+        backup_data['temp_dir'] = temp_dir
+        backup_file = Path(temp_dir) / "backup.tar.gz"
+        with open(backup_file, 'wb', buffering=BACKUP_BUFFER_SIZE) as output:
+            for chunk in chunks:
+                output.write(chunk)
+        return str(backup_file)
+
+    def _verify_backup(self, upload_result: Dict[str, Any]) -> bool:
         """Verify backup integrity.
 
+        Uses the stored size reported by the upload and only asks the backend
+        for metadata when the upload did not report one.
+
         Args:
-            backup_location: Location of backup to verify
+            upload_result: Backend upload result
 
         Returns:
             True if verification passed
@@ -504,13 +665,16 @@ class BackupScheduler:
         Raises:
             BackupExecutionError: If verification fails
         """
+        backup_location = upload_result['remote_path']
         try:
             logger.info(f"Verifying backup: {backup_location}")
 
             # Get backup metadata
-            metadata = self.backend.get_backup_metadata(backup_location)
+            size_bytes = upload_result.get('size_bytes')
+            if size_bytes is None:
+                size_bytes = self.backend.get_backup_metadata(backup_location)['size_bytes']
 
-            if metadata['size_bytes'] == 0:
+            if size_bytes == 0:
                 raise BackupExecutionError("Backup file is empty")
 
             logger.info(f"Backup verification passed: {backup_location}")
@@ -520,21 +684,23 @@ class BackupScheduler:
             logger.error(f"Backup verification failed: {e}")
             raise BackupExecutionError(f"Verification failed: {e}")
 
-    def _cleanup_temp_files(self) -> None:
-        """Clean up temporary backup files."""
-        try:
-            import shutil
-            temp_root = tempfile.gettempdir()
-            for item in Path(temp_root).glob("backup_resource_*"):
-                if item.is_dir():
-                    shutil.rmtree(item)
-        except Exception as e:
-            logger.warning(f"Failed to cleanup temp files: {e}")
+    def _cleanup_temp_files(self, temp_dir: Optional[str]) -> None:
+        """Clean up a backup job's temporary directory.
+
+        Args:
+            temp_dir: Temporary directory created for the job, if any
+        """
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
 
     def _update_backup_job_db(self, job_id: int, status: BackupStatus, backup_location: str = None,
                              size_bytes: int = 0, error_msg: str = None) -> None:
         """Update backup job status in database.
 
+        While the worker loop runs, the update is queued for the write-behind
+        writer; otherwise it is written immediately. Updates are never
+        dropped: a full queue is written by the calling thread.
+
         Args:
             job_id: Database job ID
             status: Job status
@@ -542,55 +708,269 @@ class BackupScheduler:
             size_bytes: Size of backup in bytes
             error_msg: Error message if failed
         """
+        if db is None:
+            return
+
+        values = {
+            'status': status.value,
+            'backup_location': backup_location,
+            'backup_size_bytes': size_bytes,
+            'error_message': error_msg,
+            'completed_at': datetime.utcnow() if status in [BackupStatus.COMPLETED,
+                                                            BackupStatus.FAILED] else None,
+        }
+
+        self._db_queue.append((job_id, values))
+        if not self.running or len(self._db_queue) >= BACKUP_DB_QUEUE_SIZE:
+            self._flush_db_queue()
+
+    def _write_backup_job_updates(self, updates: List[Tuple[int, Dict[str, Any]]]) -> None:
+        """Write queued backup_jobs updates in one transaction.
+
+        Later updates of the same job win. On PostgreSQL the batch is a single
+        UPDATE joined against a VALUES list.
+
+        Args:
+            updates: (job ID, field values) pairs in queue order
+        """
+        latest = dict(updates)
+        columns = ['status', 'backup_location', 'backup_size_bytes', 'error_message',
+                   'completed_at']
+
         try:
-            if db is None:
-                return
-
-            job = db.backup_jobs[job_id]
-            job.update_record(
-                status=status.value,
-                backup_location=backup_location,
-                backup_size_bytes=size_bytes,
-                error_message=error_msg,
-                completed_at=datetime.utcnow() if status in [BackupStatus.COMPLETED,
-                                                             BackupStatus.FAILED] else None,
-            )
+            if is_postgres(db):
+                rows = ', '.join(
+                    ['(%s::bigint, %s::varchar, %s::text, %s::bigint, %s::text, %s::timestamp)']
+                    * len(latest)
+                )
+                placeholders = []
+                for job_id, values in latest.items():
+                    placeholders.append(job_id)
+                    placeholders.extend(values[column] for column in columns)
+                assignments = ', '.join(f"{column} = v.{column}" for column in columns)
+                db.executesql(
+                    f"UPDATE backup_jobs AS b SET {assignments} "
+                    f"FROM (VALUES {rows}) AS v(id, {', '.join(columns)}) "
+                    "WHERE b.id = v.id",
+                    placeholders=placeholders,
+                )
+            else:
+                for job_id, values in latest.items():
+                    db(db.backup_jobs.id == job_id).update(**values)
+            # Runs on pool threads, each with its own connection
+            db.commit()
 
         except Exception as e:
-            logger.warning(f"Failed to update backup job in database: {e}")
+            db.rollback()
+            logger.warning(f"Failed to update backup jobs in database: {e}")
+
+    def _drain_db_queue(self) -> List[Tuple[int, Dict[str, Any]]]:
+        """Pop up to BACKUP_DB_BATCH_SIZE queued backup_jobs updates.
+
+        Returns:
+            (job ID, field values) pairs in queue order
+        """
+        batch = []
+        while self._db_queue and len(batch) < BACKUP_DB_BATCH_SIZE:
+            batch.append(self._db_queue.popleft())
+        return batch
+
+    def _flush_db_queue(self) -> None:
+        """Write every queued backup_jobs update in queue order.
+
+        Blocks on database I/O, so it is never run on the event loop.
+        """
+        with self._db_write_lock:
+            batch = self._drain_db_queue()
+            while batch:
+                self._write_backup_job_updates(batch)
+                batch = self._drain_db_queue()
+
+    async def _db_writer(self) -> None:
+        """Flush queued backup_jobs updates every BACKUP_DB_FLUSH_INTERVAL.
+
+        Flushes run on the default executor so status writes never wait
+        behind backups on the backup pool.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(BACKUP_DB_FLUSH_INTERVAL)
+            if self._db_queue:
+                await loop.run_in_executor(None, self._flush_db_queue)
+
+    def _push_job(self, job: BackupJob) -> None:
+        """Add a job's next run to the schedule heap and wake the worker.
+
+        Args:
+            job: Backup job to schedule
+        """
+        if not job.enabled:
+            return
+
+        deadline = job.next_deadline if job.next_deadline is not None else time.monotonic()
+        heapq.heappush(self._heap, (deadline, job.resource_id))
+        self._wakeup_event.set()
+
+    def _pop_due(self) -> List[int]:
+        """Pop every due entry from the schedule heap.
+
+        Stale entries of rescheduled jobs are pushed back at the job's
+        current due time; entries of removed or disabled jobs are dropped.
+
+        Returns:
+            Resource IDs (or CLEANUP_JOB_ID) due now, without duplicates
+        """
+        now_mono = time.monotonic()
+        due = []
+
+        while self._heap and self._heap[0][0] <= now_mono:
+            deadline, resource_id = heapq.heappop(self._heap)
+            if resource_id == CLEANUP_JOB_ID:
+                due.append(resource_id)
+                continue
+
+            job = self.backup_jobs.get(resource_id)
+            if job is None or not job.enabled:
+                continue
+
+            if job.next_deadline is not None and job.next_deadline != deadline:
+                heapq.heappush(self._heap, (job.next_deadline, resource_id))
+                continue
+
+            due.append(resource_id)
+
+        return list(dict.fromkeys(due))
+
+    def _seconds_until_next_due(self) -> Optional[float]:
+        """Get the time until the earliest scheduled entry is due.
+
+        Returns:
+            Seconds to wait, or None if nothing is scheduled
+        """
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - time.monotonic())
+
+    @staticmethod
+    def _next_cleanup_deadline() -> float:
+        """Get the deadline of the next daily cleanup (02:00 UTC).
+
+        The wall-clock target is converted to a monotonic deadline once.
+
+        Returns:
+            time.monotonic() deadline of next cleanup
+        """
+        now = datetime.utcnow()
+        cleanup_time = now.replace(hour=2, minute=0, second=0, microsecond=0)
+        if cleanup_time <= now:
+            cleanup_time += timedelta(days=1)
+        return time.monotonic() + (cleanup_time - now).total_seconds()
+
+    def _run_due(self, resource_id: int) -> None:
+        """Run one due heap entry.
+
+        Called on the backup thread pool.
+
+        Args:
+            resource_id: Resource ID, or CLEANUP_JOB_ID for retention cleanup
+        """
+        if resource_id == CLEANUP_JOB_ID:
+            try:
+                self.cleanup_old_backups()
+            except BackupSchedulerError as e:
+                logger.error(f"Scheduled cleanup failed: {e}")
+            return
+
+        try:
+            logger.info(f"Triggering scheduled backup for resource {resource_id}")
+            self.execute_backup(resource_id)
+        except BackupExecutionError as e:
+            logger.error(f"Scheduled backup failed for resource {resource_id}: {e}")
+            self.backup_jobs[resource_id].next_deadline = (
+                time.monotonic() + BACKUP_RETRY_DELAY
+            )
+
+    async def _arun_due(self, resource_id: int) -> None:
+        """Run one due heap entry on the backup thread pool.
+
+        Args:
+            resource_id: Resource ID, or CLEANUP_JOB_ID for retention cleanup
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._run_due, resource_id)
+
+    def _reschedule(self, resource_id: int) -> None:
+        """Push the next run of a heap entry that just ran.
+
+        Args:
+            resource_id: Resource ID, or CLEANUP_JOB_ID for retention cleanup
+        """
+        if resource_id == CLEANUP_JOB_ID:
+            heapq.heappush(self._heap, (self._next_cleanup_deadline(), CLEANUP_JOB_ID))
+        elif resource_id in self.backup_jobs:
+            self._push_job(self.backup_jobs[resource_id])
+
+    @staticmethod
+    def _create_task(coro: Any) -> asyncio.Task:
+        """Create a scheduler task, started eagerly where supported.
+
+        On Python 3.12+ the task body runs up to its first real suspension
+        right away. Only the scheduler's own tasks are created this way; the
+        host loop's task factory is left alone.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            Task wrapping the coroutine
+        """
+        loop = asyncio.get_running_loop()
+        eager_task_factory = getattr(asyncio, 'eager_task_factory', None)
+        if eager_task_factory is not None:
+            return eager_task_factory(loop, coro)
+        return loop.create_task(coro)
 
     async def run(self) -> None:
         """Main worker loop for backup scheduler.
 
-        Periodically checks for scheduled backups and executes them.
+        Sleeps until the earliest scheduled backup (or the daily cleanup) is
+        due, or until schedule_backup adds an earlier one.
         """
         self.running = True
+        if self._executor is None:
+            self._executor = self._create_executor()
         logger.info("Backup scheduler worker started")
 
+        loop = asyncio.get_running_loop()
+        db_writer = None
+        if db is not None:
+            db_writer = self._create_task(self._db_writer())
+
         try:
             while self.running:
                 try:
-                    current_time = datetime.utcnow()
-                    logger.debug(f"Checking backup schedules at {current_time}")
-
-                    # Check each scheduled backup job
-                    for resource_id, job in list(self.backup_jobs.items()):
-                        if job.should_run():
-                            try:
-                                logger.info(f"Triggering scheduled backup for resource {resource_id}")
-                                self.execute_backup(resource_id)
-                            except BackupExecutionError as e:
-                                logger.error(f"Scheduled backup failed for resource {resource_id}: {e}")
-
-                    # Run cleanup every 24 hours
-                    if current_time.hour == 2 and current_time.minute < 5:
-                        try:
-                            self.cleanup_old_backups()
-                        except BackupSchedulerError as e:
-                            logger.error(f"Scheduled cleanup failed: {e}")
-
-                    # Sleep for 5 minutes before checking again
-                    await asyncio.sleep(300)
+                    # Clear before computing the delay so a job scheduled in
+                    # between still wakes us
+                    self._wakeup_event.clear()
+                    delay = self._seconds_until_next_due()
+                    try:
+                        await asyncio.wait_for(self._wakeup_event.wait(), timeout=delay)
+                        continue
+                    except asyncio.TimeoutError:
+                        pass
+
+                    # Due backups run concurrently on the backup pool; the
+                    # heap is only touched from the event loop
+                    due = self._pop_due()
+                    results = await asyncio.gather(
+                        *[self._create_task(self._arun_due(resource_id))
+                          for resource_id in due],
+                        return_exceptions=True,
+                    )
+                    for resource_id, result in zip(due, results):
+                        if isinstance(result, Exception):
+                            logger.error(f"Scheduled run failed for {resource_id}: {result}")
+                        self._reschedule(resource_id)
 
                 except Exception as e:
                     logger.error(f"Unexpected error in backup scheduler loop: {e}")
@@ -600,10 +980,18 @@ class BackupScheduler:
             logger.info("Backup scheduler worker stopped")
         finally:
             self.running = False
+            if db_writer is not None:
+                db_writer.cancel()
+                # Write whatever the writer had not flushed yet
+                await loop.run_in_executor(None, self._flush_db_queue)
+            # Queued backups are dropped; a later run() starts a new pool
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
 
     def stop(self) -> None:
         """Stop the backup scheduler worker."""
         logger.info("Stopping backup scheduler worker")
         self.running = False
+        self._wakeup_event.set()
         if self.worker_task:
             self.worker_task.cancel()
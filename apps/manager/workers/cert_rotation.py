@@ -15,20 +15,97 @@ Handles:
 
 import os
 import logging
-import time
+import queue
+import random
 import json
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List, Tuple
+import hmac
+import threading
+import concurrent.futures
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, Iterator, List, Tuple, Union
 from dataclasses import dataclass
 
 try:
     from pydal import DAL
+    from pydal.objects import Expression
 except ImportError:
     raise ImportError("pydal is required for certificate rotation worker")
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pybase64 is a vectorized drop-in replacement for the standard module
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
 
 logger = logging.getLogger(__name__)
 
+# Longest a cycle may be skipped on the strength of the previous cycle's
+# earliest renewal time. Certificates imported or edited since then are not
+# seen by the skip check, so this stays short
+NEXT_ACTION_CACHE_TTL = timedelta(minutes=15)
+
+# Retry delay after a failed cycle: doubles per consecutive failure up to
+# check_interval, plus up to RETRY_JITTER seconds of random jitter
+RETRY_BASE_DELAY = 60
+RETRY_JITTER = 30
+
+# Attempts per external resource certificate reload, RELOAD_RETRY_DELAY
+# seconds apart
+RELOAD_ATTEMPTS = 3
+RELOAD_RETRY_DELAY = 5
+
+# A certificate whose renewal failed is not retried for RENEWAL_BACKOFF_BASE
+# seconds, doubling per consecutive failure up to RENEWAL_BACKOFF_MAX
+RENEWAL_BACKOFF_BASE = 60
+RENEWAL_BACKOFF_MAX = 86400
+
+# Certificates listed per notification digest; larger groups are split
+NOTIFICATION_DIGEST_SIZE = 50
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize a value to compact JSON, using orjson when installed.
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        JSON string without insignificant whitespace
+    """
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _utcnow() -> datetime:
+    """Get the current UTC time as a naive datetime.
+
+    Matches the naive UTC values PyDAL returns for datetime columns, without
+    the deprecated ``datetime.utcnow()``.
+
+    Returns:
+        Current UTC time without tzinfo
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _pem_bytes(pem: Union[str, bytes]) -> bytes:
+    """Get PEM data as bytes, encoding it only if needed.
+
+    Args:
+        pem: PEM data as returned by the CA manager
+
+    Returns:
+        PEM data as bytes
+    """
+    return pem if isinstance(pem, bytes) else pem.encode()
+
 
 class CertRotationError(Exception):
     """Base exception for certificate rotation errors."""
@@ -55,7 +132,7 @@ class NotificationError(CertRotationError):
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CertificateInfo:
     """Certificate information for renewal operations."""
     cert_id: int
@@ -69,6 +146,7 @@ class CertificateInfo:
     auto_renew: bool
     k8s_namespace: Optional[str]
     k8s_resource_name: Optional[str]
+    renewal_attempts: int = 0
 
 
 class CertRotationWorker:
@@ -90,6 +168,7 @@ class CertRotationWorker:
         notification_handler: Optional[Any] = None,
         check_interval: int = 86400,
         notification_threshold_days: int = 7,
+        max_parallel_renewals: int = 8,
     ):
         """Initialize Certificate Rotation Worker.
 
@@ -100,6 +179,7 @@ class CertRotationWorker:
             notification_handler: Notification handler for alerts (optional)
             check_interval: Seconds between rotation checks (default: 86400 = 24 hours)
             notification_threshold_days: Days before expiry to notify (default: 7)
+            max_parallel_renewals: Certificates renewed concurrently (default: 8)
 
         Raises:
             ValueError: If required parameters are invalid
@@ -115,11 +195,43 @@ class CertRotationWorker:
         self.notification_handler = notification_handler
         self.check_interval = check_interval
         self.notification_threshold_days = notification_threshold_days
+        self.max_parallel_renewals = max_parallel_renewals
+        # Work that cannot have any effect is filtered out of the expiry query
+        self._will_notify = notification_handler is not None
+        self._will_update_k8s = k8s_client is not None
+        # CoreV1Api for Secret reads and patches, built on first use from the
+        # configuration the Kubernetes client loaded
+        self._k8s_core_api = None
+        self._k8s_core_api_lock = threading.Lock()
+        # PostgreSQL runs the expiry query from a fixed, parameterized SQL
+        # string instead of rebuilding it through the DAL for every batch
+        self._expiring_query_sql = (
+            self._build_expiring_query_sql()
+            if db._adapter.dbengine == 'postgres' else None
+        )
         self.is_running = False
+        self._stop_event = threading.Event()
+        self._consecutive_failures = 0
+        # Earliest time any known certificate can need renewal or a warning
+        self._next_possible_action_at: Optional[datetime] = None
+        # Rows looked up during the current cycle, keyed by (table, id)
+        self._cycle_cache: Dict[Tuple[str, int], Any] = {}
+        # Notifications sent as one digest per event type per flush
+        self._pending_notifications: List[Tuple[CertificateInfo, str, Dict[str, Any]]] = []
+        self._notification_lock = threading.Lock()
+        # External resource reloads run off the renewal path on one thread
+        self._reload_queue: queue.Queue = queue.Queue()
+        self._reload_worker = threading.Thread(
+            target=self._reload_drain,
+            name='cert-reload',
+            daemon=True,
+        )
+        self._reload_worker.start()
 
         logger.info(
             f"CertRotationWorker initialized with check_interval={check_interval}s, "
-            f"notification_threshold={notification_threshold_days} days"
+            f"notification_threshold={notification_threshold_days} days, "
+            f"max_parallel_renewals={max_parallel_renewals}"
         )
 
     def run(self) -> None:
@@ -130,17 +242,25 @@ class CertRotationWorker:
         """
         logger.info("Starting Certificate Rotation Worker")
         self.is_running = True
+        self._stop_event.clear()
 
         try:
-            while self.is_running:
+            while not self._stop_event.is_set():
+                delay = self.check_interval
                 try:
                     self._rotation_cycle()
+                    self._consecutive_failures = 0
                 except Exception as e:
                     logger.error(f"Error during rotation cycle: {e}", exc_info=True)
-                    # Continue despite errors - worker remains operational
+                    # Continue despite errors - worker remains operational,
+                    # retrying transient failures well before the next check
+                    delay = self._retry_delay()
+                    self._consecutive_failures += 1
+                    logger.info(f"Retrying rotation cycle in {delay:.0f}s")
 
-                # Sleep until next check
-                time.sleep(self.check_interval)
+                # Sleep until next check, waking immediately on stop()
+                if self._stop_event.wait(delay):
+                    break
 
         except KeyboardInterrupt:
             logger.info("Certificate Rotation Worker interrupted by user")
@@ -149,10 +269,22 @@ class CertRotationWorker:
         finally:
             self.stop()
 
+    def _retry_delay(self) -> float:
+        """Get the delay before retrying a failed rotation cycle.
+
+        Returns:
+            Exponential backoff in seconds, capped at check_interval, with jitter
+        """
+        backoff = RETRY_BASE_DELAY * 2 ** min(self._consecutive_failures, 32)
+        return min(self.check_interval, backoff) + random.uniform(0, RETRY_JITTER)
+
     def stop(self) -> None:
         """Stop the worker gracefully."""
         logger.info("Stopping Certificate Rotation Worker")
         self.is_running = False
+        self._stop_event.set()
+        self._reload_queue.put(None)
+        self._flush_notifications()
 
     def _rotation_cycle(self) -> None:
         """Execute a single certificate rotation cycle.
@@ -161,100 +293,413 @@ class CertRotationWorker:
         Sends notifications for certificates expiring without auto-renewal.
         """
         logger.debug("Starting certificate rotation cycle")
+        # One timestamp for every threshold check in this cycle
+        now = _utcnow()
+        if (self._next_possible_action_at is not None
+                and now < self._next_possible_action_at):
+            logger.debug(
+                f"No certificate needs action before "
+                f"{self._next_possible_action_at.isoformat()}, skipping cycle"
+            )
+            return
 
-        # Check for expiring certificates
-        expiring_certs = self.check_expiring_certificates()
-        logger.info(f"Found {len(expiring_certs)} expiring certificates")
-
-        for cert_info in expiring_certs:
-            if cert_info.auto_renew:
-                try:
-                    self._renew_certificate_with_recovery(cert_info)
-                except CertificateRenewalError as e:
-                    logger.error(
-                        f"Failed to renew certificate {cert_info.cert_id}: {e}"
-                    )
-                    try:
-                        self.notify_admin(
-                            cert_info,
-                            error=str(e),
-                            event_type="renewal_failed"
+        self._cycle_cache = {}
+
+        # Lazy tables are materialized here, before pool threads touch them
+        for table in ('certificates', 'certificate_authorities', 'resources', 'audit_logs'):
+            self.db[table]
+
+        # Renewals are I/O bound (CA signing, Kubernetes API, DB commit), so
+        # they run on a bounded pool while later batches are still fetched
+        expiring_count = 0
+        pending = {}
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_parallel_renewals,
+            thread_name_prefix='cert-renewal',
+        ) as executor:
+            for cert_info in self.iter_expiring_certificates(now):
+                expiring_count += 1
+                if cert_info.auto_renew:
+                    future = executor.submit(self._renew_on_pool_thread, cert_info)
+                    pending[future] = cert_info
+                    if len(pending) >= 2 * self.max_parallel_renewals:
+                        done, _ = concurrent.futures.wait(
+                            pending, return_when=concurrent.futures.FIRST_COMPLETED
                         )
-                    except NotificationError as ne:
-                        logger.error(f"Failed to send renewal failure notification: {ne}")
+                        for future in done:
+                            self._handle_renewal_result(pending.pop(future), future)
+                    continue
+
+                # Certificate expiring but auto_renew=False - the query only
+                # returns these inside the notification window
+                days_until_expiry = (cert_info.valid_until - now).days
+                self._queue_notification(
+                    cert_info,
+                    days_until_expiry=days_until_expiry,
+                    event_type="expiry_warning"
+                )
 
-            else:
-                # Certificate expiring but auto_renew=False - notify admin
-                days_until_expiry = (cert_info.valid_until - datetime.utcnow()).days
-                if days_until_expiry <= self.notification_threshold_days:
-                    try:
-                        self.notify_admin(
-                            cert_info,
-                            days_until_expiry=days_until_expiry,
-                            event_type="expiry_warning"
-                        )
-                    except NotificationError as ne:
-                        logger.error(f"Failed to send expiry warning: {ne}")
+            for future in concurrent.futures.as_completed(pending):
+                self._handle_renewal_result(pending[future], future)
 
+        self._flush_notifications()
+        self._next_possible_action_at = self._next_action_time(now)
+        logger.info(f"Processed {expiring_count} expiring certificates")
         logger.debug("Certificate rotation cycle completed")
 
-    def check_expiring_certificates(self) -> List[CertificateInfo]:
+    def _renew_on_pool_thread(self, cert_info: CertificateInfo) -> None:
+        """Renew a certificate on a renewal pool thread.
+
+        PyDAL keeps one connection per thread; it is returned to the pool
+        once the renewal finishes.
+
+        Args:
+            cert_info: Certificate information
+
+        Raises:
+            CertificateRenewalError: If renewal fails after recovery attempts
+        """
+        try:
+            self._renew_certificate_with_recovery(cert_info)
+        finally:
+            self.db._adapter.close(action='rollback', really=False)
+
+    def _handle_renewal_result(
+        self,
+        cert_info: CertificateInfo,
+        future: concurrent.futures.Future,
+    ) -> None:
+        """Report the outcome of a pooled certificate renewal.
+
+        Args:
+            cert_info: Certificate information
+            future: Completed renewal future
+        """
+        try:
+            future.result()
+        except CertificateRenewalError as e:
+            logger.error(
+                f"Failed to renew certificate {cert_info.cert_id}: {e}"
+            )
+            self._record_renewal_failure(cert_info)
+            self._queue_notification(
+                cert_info,
+                error=str(e),
+                event_type="renewal_failed"
+            )
+        except Exception as e:
+            logger.error(
+                f"Unexpected error renewing certificate {cert_info.cert_id}: {e}",
+                exc_info=True
+            )
+            self._record_renewal_failure(cert_info)
+
+    def _record_renewal_failure(self, cert_info: CertificateInfo) -> None:
+        """Back off renewal of a certificate after a failed attempt.
+
+        The expiry query skips the certificate until next_renewal_attempt_at,
+        which is stored so restarts keep the backoff.
+
+        Args:
+            cert_info: Certificate information
+        """
+        attempts = cert_info.renewal_attempts + 1
+        backoff = min(
+            RENEWAL_BACKOFF_MAX,
+            RENEWAL_BACKOFF_BASE * 2 ** min(cert_info.renewal_attempts, 32),
+        )
+        try:
+            self.db(self.db.certificates.id == cert_info.cert_id).update(
+                renewal_attempts=attempts,
+                next_renewal_attempt_at=_utcnow() + timedelta(seconds=backoff),
+            )
+            self.db.commit()
+            logger.info(
+                f"Certificate {cert_info.cert_id} renewal failed {attempts} time(s), "
+                f"retrying in {backoff}s"
+            )
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to record renewal failure: {e}", exc_info=True)
+
+    def iter_expiring_certificates(
+        self,
+        now: Optional[datetime] = None,
+        batch_size: int = 500,
+    ) -> Iterator[CertificateInfo]:
         """Find certificates expiring soon that should be renewed.
 
+        Certificates are fetched in keyset-paginated batches ordered by id,
+        so memory stays bounded by the batch size and callers can start
+        renewing before the scan completes.
+
+        Args:
+            now: Naive UTC time thresholds are measured from (default: now)
+            batch_size: Certificates fetched per query (default: 500)
+
+        Yields:
+            CertificateInfo for each expiring certificate
+
+        Raises:
+            CertificateRenewalError: If database query fails
+        """
+        now = now or _utcnow()
+        last_id = 0
+        while True:
+            batch = self._select_expiring_batch(now, last_id, batch_size)
+            yield from batch
+
+            if len(batch) < batch_size:
+                break
+            last_id = batch[-1].cert_id
+
+    def _build_expiring_query_sql(self) -> str:
+        """Build the parameterized PostgreSQL expiry query.
+
+        Takes ``now``, ``window_end``, ``notify_end``, ``last_id`` and
+        ``batch_size`` as named placeholders and mirrors the predicate of
+        the DAL query in _select_expiring_rows.
+
         Returns:
-            List of CertificateInfo for expiring certificates
+            SQL statement string
+        """
+        columns = (
+            "certificates.id, certificates.resource_id, certificates.ca_id, "
+            "certificates.common_name, certificates.san_dns, certificates.san_ips, "
+            "certificates.valid_until, certificates.renewal_threshold_days, "
+            "certificates.auto_renew, certificates.renewal_attempts"
+        )
+        join = ""
+        if self._will_update_k8s:
+            columns += ", resources.k8s_namespace, resources.k8s_resource_name"
+            join = " LEFT JOIN resources ON resources.id = certificates.resource_id"
+
+        if self._will_notify:
+            actionable = "(certificates.auto_renew OR certificates.valid_until < %(notify_end)s)"
+        else:
+            actionable = "certificates.auto_renew"
+
+        return (
+            f"SELECT {columns} FROM certificates{join} "
+            "WHERE certificates.id > %(last_id)s "
+            "AND certificates.deleted_at IS NULL "
+            "AND (certificates.next_renewal_attempt_at IS NULL "
+            "OR certificates.next_renewal_attempt_at <= %(now)s) "
+            "AND certificates.valid_until <= %(window_end)s "
+            "AND certificates.valid_until < %(now)s + "
+            "(certificates.renewal_threshold_days + 1) * INTERVAL '1 day' "
+            f"AND {actionable} "
+            "ORDER BY certificates.id LIMIT %(batch_size)s"
+        )
+
+    def _select_expiring_batch(
+        self,
+        now: datetime,
+        last_id: int,
+        batch_size: int,
+    ) -> List[CertificateInfo]:
+        """Select the next batch of expiring certificates after a cursor.
+
+        Args:
+            now: Naive UTC time thresholds are measured from
+            last_id: Highest certificate id already returned
+            batch_size: Maximum number of rows to select
+
+        Returns:
+            CertificateInfo for each certificate in the batch, ordered by id
 
         Raises:
-            Exception: If database query fails
+            CertificateRenewalError: If database query fails
         """
         try:
-            # Calculate threshold date
-            now = datetime.utcnow()
-
-            # Query certificates expiring within their renewal threshold
-            certs = self.db(
-                (self.db.certificates.deleted_at.isnull()) &
-                (self.db.certificates.valid_until <= now + timedelta(days=30))
-            ).select()
-
-            expiring_certs = []
-            for cert in certs:
-                # Get resource to check k8s info
-                resource = None
-                if cert.resource_id:
-                    resource = self.db.resources[cert.resource_id]
-
-                cert_info = CertificateInfo(
-                    cert_id=cert.id,
-                    resource_id=cert.resource_id,
-                    ca_id=cert.ca_id,
-                    common_name=cert.common_name,
-                    san_dns=cert.san_dns,
-                    san_ips=cert.san_ips,
-                    valid_until=cert.valid_until,
-                    renewal_threshold_days=cert.renewal_threshold_days,
-                    auto_renew=cert.auto_renew,
-                    k8s_namespace=resource.k8s_namespace if resource else None,
-                    k8s_resource_name=resource.k8s_resource_name if resource else None,
+            if self._expiring_query_sql is None:
+                return self._select_expiring_rows(now, last_id, batch_size)
+
+            rows = self.db.executesql(
+                self._expiring_query_sql,
+                placeholders={
+                    'now': now,
+                    'window_end': now + timedelta(days=30),
+                    'notify_end': now + timedelta(days=self.notification_threshold_days + 1),
+                    'last_id': last_id,
+                    'batch_size': batch_size,
+                },
+                as_dict=True,
+            )
+            return [
+                CertificateInfo(
+                    cert_id=row['id'],
+                    resource_id=row['resource_id'],
+                    ca_id=row['ca_id'],
+                    common_name=row['common_name'],
+                    san_dns=row['san_dns'],
+                    san_ips=row['san_ips'],
+                    valid_until=row['valid_until'],
+                    renewal_threshold_days=row['renewal_threshold_days'],
+                    auto_renew=row['auto_renew'],
+                    k8s_namespace=row.get('k8s_namespace'),
+                    k8s_resource_name=row.get('k8s_resource_name'),
+                    renewal_attempts=row['renewal_attempts'] or 0,
                 )
-
-                # Check if certificate is within its renewal threshold
-                days_until_expiry = (cert.valid_until - now).days
-                if days_until_expiry <= cert.renewal_threshold_days:
-                    expiring_certs.append(cert_info)
-
-            logger.debug(f"Found {len(expiring_certs)} certificates within renewal threshold")
-            return expiring_certs
+                for row in rows
+            ]
 
         except Exception as e:
             logger.error(f"Failed to check expiring certificates: {e}", exc_info=True)
             raise CertificateRenewalError(f"Database query failed: {e}")
 
-    def renew_certificate(self, cert_id: int) -> Tuple[str, str, datetime]:
+    def _select_expiring_rows(
+        self,
+        now: datetime,
+        last_id: int,
+        batch_size: int,
+    ) -> List[CertificateInfo]:
+        """Select the next batch of expiring certificates through the DAL.
+
+        Used on dialects other than PostgreSQL.
+
+        Args:
+            now: Naive UTC time thresholds are measured from
+            last_id: Highest certificate id already returned
+            batch_size: Maximum number of rows to select
+
+        Returns:
+            CertificateInfo for each certificate in the batch, ordered by id
+        """
+        certificates = self.db.certificates
+        resources = self.db.resources
+
+        renewal_deadline = self._renewal_deadline(now)
+
+        # Query certificates expiring within their renewal threshold;
+        # certificates without auto-renew only matter once they are
+        # close enough to notify about, and only if anyone is notified
+        query = (
+            (certificates.id > last_id) &
+            (certificates.deleted_at == None) &
+            ((certificates.next_renewal_attempt_at == None) |
+             (certificates.next_renewal_attempt_at <= now)) &
+            (certificates.valid_until <= now + timedelta(days=30)) &
+            (certificates.valid_until < renewal_deadline)
+        )
+        if self._will_notify:
+            query &= ((certificates.auto_renew == True) |
+                      (certificates.valid_until <
+                       now + timedelta(days=self.notification_threshold_days + 1)))
+        else:
+            query &= (certificates.auto_renew == True)
+
+        fields = [
+            certificates.id,
+            certificates.resource_id,
+            certificates.ca_id,
+            certificates.common_name,
+            certificates.san_dns,
+            certificates.san_ips,
+            certificates.valid_until,
+            certificates.renewal_threshold_days,
+            certificates.auto_renew,
+            certificates.renewal_attempts,
+        ]
+        left = None
+        if self._will_update_k8s:
+            fields += [resources.k8s_namespace, resources.k8s_resource_name]
+            left = resources.on(resources.id == certificates.resource_id)
+
+        rows = self.db(query).select(
+            *fields,
+            left=left,
+            orderby=certificates.id,
+            limitby=(0, batch_size),
+        )
+
+        batch = []
+        for row in rows:
+            if self._will_update_k8s:
+                cert, resource = row.certificates, row.resources
+            else:
+                cert, resource = row, None
+            batch.append(CertificateInfo(
+                cert_id=cert.id,
+                resource_id=cert.resource_id,
+                ca_id=cert.ca_id,
+                common_name=cert.common_name,
+                san_dns=cert.san_dns,
+                san_ips=cert.san_ips,
+                valid_until=cert.valid_until,
+                renewal_threshold_days=cert.renewal_threshold_days,
+                auto_renew=cert.auto_renew,
+                k8s_namespace=resource.k8s_namespace if resource else None,
+                k8s_resource_name=resource.k8s_resource_name if resource else None,
+                renewal_attempts=cert.renewal_attempts or 0,
+            ))
+        return batch
+
+    def _next_action_time(self, now: datetime) -> Optional[datetime]:
+        """Find the earliest time a live certificate can need action.
+
+        A certificate can first be returned by the expiry query one day
+        more than its renewal threshold before valid_until. The earliest
+        valid_until per distinct threshold is aggregated in SQL, so this
+        stays cheap regardless of the number of certificates.
+
+        Args:
+            now: Naive UTC time of the current cycle
+
+        Returns:
+            Earliest action time, capped at NEXT_ACTION_CACHE_TTL from now,
+            or None if it could not be determined
+        """
+        certificates = self.db.certificates
+        earliest_expiry = certificates.valid_until.min()
+        try:
+            rows = self.db(certificates.deleted_at == None).select(
+                certificates.renewal_threshold_days,
+                earliest_expiry,
+                groupby=certificates.renewal_threshold_days,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to compute next certificate action time: {e}")
+            return None
+
+        next_action = now + NEXT_ACTION_CACHE_TTL
+        for row in rows:
+            expiry = row[earliest_expiry]
+            if expiry is None:
+                continue
+            threshold_days = row.certificates.renewal_threshold_days or 0
+            next_action = min(next_action, expiry - timedelta(days=threshold_days + 1))
+        return next_action
+
+    def _renewal_deadline(self, now: datetime) -> Expression:
+        """Build the per-row renewal deadline as a SQL expression.
+
+        A certificate is within its renewal threshold when its whole days
+        until expiry are <= renewal_threshold_days, i.e. when valid_until is
+        before ``now + (renewal_threshold_days + 1)`` days.
+
+        Args:
+            now: Current UTC time
+
+        Returns:
+            PyDAL Expression for the dialect of the connected database
+        """
+        timestamp = now.isoformat(sep=' ')
+        days = "(certificates.renewal_threshold_days + 1)"
+        dbengine = self.db._adapter.dbengine
+        if dbengine == 'postgres':
+            sql = f"TIMESTAMP '{timestamp}' + {days} * INTERVAL '1 day'"
+        elif dbengine == 'mysql':
+            sql = f"DATE_ADD('{timestamp}', INTERVAL {days} DAY)"
+        else:
+            sql = f"DATETIME('{timestamp}', '+' || {days} || ' days')"
+        return Expression(self.db, sql)
+
+    def renew_certificate(self, cert_info: CertificateInfo) -> Tuple[str, str, datetime]:
         """Renew a single certificate.
 
         Args:
-            cert_id: Certificate ID to renew
+            cert_info: Certificate information of the certificate to renew
 
         Returns:
             Tuple of (certificate_pem, private_key_pem, valid_until)
@@ -263,28 +708,24 @@ class CertRotationWorker:
             CertificateRenewalError: If renewal fails
             CANotFoundError: If CA is not available
         """
+        cert_id = cert_info.cert_id
         try:
-            # Load certificate
-            cert = self.db.certificates[cert_id]
-            if not cert:
-                raise CertificateRenewalError(f"Certificate {cert_id} not found")
-
             # Load CA
-            ca = self.db.certificate_authorities[cert.ca_id]
+            ca = self._get_row('certificate_authorities', cert_info.ca_id)
             if not ca:
-                raise CANotFoundError(f"CA {cert.ca_id} not found or not available")
+                raise CANotFoundError(f"CA {cert_info.ca_id} not found or not available")
 
             logger.info(
-                f"Renewing certificate {cert_id} ({cert.common_name}) "
+                f"Renewing certificate {cert_id} ({cert_info.common_name}) "
                 f"using CA {ca.name}"
             )
 
             # Generate new certificate with same SANs
             new_cert_pem, new_key_pem, valid_until = self.ca_manager.renew_certificate(
-                ca_id=cert.ca_id,
-                common_name=cert.common_name,
-                san_dns=cert.san_dns,
-                san_ips=cert.san_ips,
+                ca_id=cert_info.ca_id,
+                common_name=cert_info.common_name,
+                san_dns=cert_info.san_dns,
+                san_ips=cert_info.san_ips,
             )
 
             logger.info(
@@ -303,8 +744,9 @@ class CertRotationWorker:
     def update_k8s_secret(
         self,
         resource: Any,
-        certificate_pem: str,
-        private_key_pem: str,
+        certificate_pem: Union[str, bytes],
+        private_key_pem: Union[str, bytes],
+        skip_unchanged: bool = True,
     ) -> None:
         """Update Kubernetes Secret with new certificate.
 
@@ -312,6 +754,8 @@ class CertRotationWorker:
             resource: Resource object containing k8s metadata
             certificate_pem: New certificate in PEM format
             private_key_pem: New private key in PEM format
+            skip_unchanged: Skip the write when the Secret already holds
+                this certificate and key (default: True)
 
         Raises:
             K8sUpdateError: If update fails
@@ -332,24 +776,50 @@ class CertRotationWorker:
                 f"in namespace {resource.k8s_namespace}"
             )
 
+            # Encoded once and shared by the comparison and the payload
+            cert_bytes = _pem_bytes(certificate_pem)
+            key_bytes = _pem_bytes(private_key_pem)
+
+            if skip_unchanged and self._k8s_secret_matches(
+                resource, cert_bytes, key_bytes
+            ):
+                logger.info(
+                    f"Kubernetes Secret for resource {resource.id} already up to date, "
+                    f"skipping update"
+                )
+                return
+
             # Prepare secret data (base64 encoded)
-            import base64
             secret_data = {
-                "tls.crt": base64.b64encode(certificate_pem.encode()).decode(),
-                "tls.key": base64.b64encode(private_key_pem.encode()).decode(),
+                "tls.crt": base64.b64encode(cert_bytes).decode("ascii"),
+                "tls.key": base64.b64encode(key_bytes).decode("ascii"),
             }
 
-            # Create or update secret
-            self.k8s_client.apply_manifest({
-                "apiVersion": "v1",
-                "kind": "Secret",
-                "metadata": {
-                    "name": resource.k8s_resource_name,
-                    "namespace": resource.k8s_namespace,
-                },
-                "type": "kubernetes.io/tls",
-                "data": secret_data,
-            })
+            # Patch only the TLS keys so labels, annotations and other data
+            # set by other controllers survive; create the Secret if missing
+            try:
+                self._core_api().patch_namespaced_secret(
+                    resource.k8s_resource_name,
+                    resource.k8s_namespace,
+                    {"data": secret_data},
+                )
+                created = False
+            except Exception as e:
+                if getattr(e, 'status', None) != 404:
+                    raise
+                created = True
+
+            if created:
+                self.k8s_client.apply_manifest({
+                    "apiVersion": "v1",
+                    "kind": "Secret",
+                    "metadata": {
+                        "name": resource.k8s_resource_name,
+                        "namespace": resource.k8s_namespace,
+                    },
+                    "type": "kubernetes.io/tls",
+                    "data": secret_data,
+                })
 
             logger.info(
                 f"Kubernetes Secret successfully updated for resource {resource.id}"
@@ -362,6 +832,53 @@ class CertRotationWorker:
             )
             raise K8sUpdateError(f"Secret update failed: {e}")
 
+    def _core_api(self) -> Any:
+        """Get the shared CoreV1Api, creating it on first use.
+
+        Returns:
+            kubernetes.client.CoreV1Api instance
+        """
+        with self._k8s_core_api_lock:
+            if self._k8s_core_api is None:
+                from kubernetes import client
+                self._k8s_core_api = client.CoreV1Api()
+            return self._k8s_core_api
+
+    def _k8s_secret_matches(
+        self,
+        resource: Any,
+        cert_bytes: bytes,
+        key_bytes: bytes,
+    ) -> bool:
+        """Check whether the existing Secret already holds a certificate and key.
+
+        Missing Secrets and failed reads count as a mismatch, so the Secret
+        is still written.
+
+        Args:
+            resource: Resource object containing k8s metadata
+            cert_bytes: PEM-encoded certificate
+            key_bytes: PEM-encoded private key
+
+        Returns:
+            True if the Secret's tls.crt and tls.key equal the given values
+        """
+        try:
+            secret = self._core_api().read_namespaced_secret(
+                resource.k8s_resource_name, resource.k8s_namespace
+            )
+            data = secret.data or {}
+            existing_cert = base64.b64decode(data.get('tls.crt', ''))
+            existing_key = base64.b64decode(data.get('tls.key', ''))
+        except Exception as e:
+            logger.debug(f"Could not read Kubernetes Secret for resource {resource.id}: {e}")
+            return False
+
+        # Both comparisons always run so timing does not reveal which differs
+        cert_matches = hmac.compare_digest(existing_cert, cert_bytes)
+        key_matches = hmac.compare_digest(existing_key, key_bytes)
+        return cert_matches and key_matches
+
     def reload_external_resource_certificate(
         self,
         resource: Any,
@@ -386,6 +903,34 @@ class CertRotationWorker:
         )
         return False
 
+    def _reload_drain(self) -> None:
+        """Reload queued certificates on external resources until stopped.
+
+        Runs on the reload thread. Each reload is attempted up to
+        RELOAD_ATTEMPTS times; failures are logged and never block renewals.
+        """
+        while True:
+            item = self._reload_queue.get()
+            if item is None:
+                return
+
+            resource, certificate_pem, private_key_pem = item
+            for attempt in range(1, RELOAD_ATTEMPTS + 1):
+                try:
+                    self.reload_external_resource_certificate(
+                        resource,
+                        certificate_pem,
+                        private_key_pem
+                    )
+                    break
+                except Exception as e:
+                    logger.warning(
+                        f"External resource reload failed for resource {resource.id} "
+                        f"(attempt {attempt}/{RELOAD_ATTEMPTS}, non-blocking): {e}"
+                    )
+                    if attempt < RELOAD_ATTEMPTS:
+                        self._stop_event.wait(RELOAD_RETRY_DELAY)
+
     def notify_admin(
         self,
         cert_info: CertificateInfo,
@@ -435,6 +980,93 @@ class CertRotationWorker:
             )
             raise NotificationError(f"Notification failed: {e}")
 
+    def _queue_notification(
+        self,
+        cert_info: CertificateInfo,
+        event_type: str,
+        **extra: Any,
+    ) -> None:
+        """Queue an admin notification for the next digest.
+
+        Args:
+            cert_info: Certificate information
+            event_type: Type of event (renewal_success, renewal_failed, expiry_warning)
+            **extra: days_until_expiry or error, as accepted by notify_admin
+        """
+        if not self.notification_handler:
+            return
+        with self._notification_lock:
+            self._pending_notifications.append((cert_info, event_type, extra))
+
+    def _flush_notifications(self) -> None:
+        """Send queued notifications as one digest per event type.
+
+        Groups larger than NOTIFICATION_DIGEST_SIZE are split into several
+        digests; a group of one is sent as a regular notification.
+        """
+        with self._notification_lock:
+            pending, self._pending_notifications = self._pending_notifications, []
+
+        groups: Dict[str, List[Tuple[CertificateInfo, Dict[str, Any]]]] = {}
+        for cert_info, event_type, extra in pending:
+            groups.setdefault(event_type, []).append((cert_info, extra))
+
+        for event_type, entries in groups.items():
+            for start in range(0, len(entries), NOTIFICATION_DIGEST_SIZE):
+                chunk = entries[start:start + NOTIFICATION_DIGEST_SIZE]
+                try:
+                    if len(chunk) == 1:
+                        cert_info, extra = chunk[0]
+                        self.notify_admin(cert_info, event_type=event_type, **extra)
+                    else:
+                        self._send_digest(event_type, chunk)
+                except NotificationError as ne:
+                    logger.error(f"Failed to send {event_type} notification: {ne}")
+
+    def _send_digest(
+        self,
+        event_type: str,
+        entries: List[Tuple[CertificateInfo, Dict[str, Any]]],
+    ) -> None:
+        """Send one notification covering several certificates.
+
+        Args:
+            event_type: Type of event shared by all entries
+            entries: (certificate information, notify_admin extras) pairs
+
+        Raises:
+            NotificationError: If notification fails
+        """
+        try:
+            message = "\n\n".join(
+                self._build_notification_message(
+                    cert_info,
+                    event_type,
+                    extra.get('days_until_expiry'),
+                    extra.get('error')
+                )
+                for cert_info, extra in entries
+            )
+
+            self.notification_handler.send(
+                subject=(
+                    f"Certificate Rotation: {event_type.replace('_', ' ').title()} "
+                    f"({len(entries)} certificates)"
+                ),
+                message=message,
+                event_type=event_type,
+                cert_id=None,
+            )
+
+            logger.info(
+                f"Digest notification sent for {len(entries)} certificates "
+                f"(event: {event_type})"
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to send {event_type} digest notification: {e}", exc_info=True)
+            raise NotificationError(f"Notification failed: {e}")
+
     def _renew_certificate_with_recovery(self, cert_info: CertificateInfo) -> None:
         """Renew certificate with full recovery and rollback support.
 
@@ -445,69 +1077,63 @@ class CertRotationWorker:
             CertificateRenewalError: If renewal fails after recovery attempts
         """
         logger.info(f"Renewing certificate {cert_info.cert_id}")
-
-        # Store old certificate for rollback
-        old_cert_db = self.db.certificates[cert_info.cert_id]
-        old_certificate = old_cert_db.certificate
-        old_private_key = old_cert_db.private_key
+        k8s_updated = False
 
         try:
             # Step 1: Renew certificate
-            new_cert_pem, new_key_pem, valid_until = self.renew_certificate(
-                cert_info.cert_id
-            )
+            new_cert_pem, new_key_pem, valid_until = self.renew_certificate(cert_info)
 
             # Step 2: If k8s resource, update Secret
             if cert_info.k8s_namespace and cert_info.k8s_resource_name:
                 try:
                     self.update_k8s_secret(
-                        self.db.resources[cert_info.resource_id],
+                        self._get_row('resources', cert_info.resource_id),
                         new_cert_pem,
                         new_key_pem
                     )
+                    k8s_updated = True
                 except K8sUpdateError as e:
                     logger.error(f"K8s update failed, rolling back: {e}")
                     raise CertificateRenewalError(f"K8s update failed: {e}")
 
-            # Step 3: Try to reload on external resource
+            # Steps 3-4: Update database and create audit log in one
+            # transaction, so a renewal is never stored unaudited
+            try:
+                self.db(self.db.certificates.id == cert_info.cert_id).update(
+                    certificate=new_cert_pem,
+                    private_key=new_key_pem,
+                    valid_until=valid_until,
+                    renewal_attempts=0,
+                    next_renewal_attempt_at=None,
+                    updated_at=_utcnow(),
+                )
+                self._create_audit_log(
+                    action="certificate_renewed",
+                    cert_id=cert_info.cert_id,
+                    resource_id=cert_info.resource_id,
+                    details={
+                        "common_name": cert_info.common_name,
+                        "valid_until": valid_until.isoformat(),
+                        "k8s_updated": bool(cert_info.k8s_namespace),
+                    },
+                )
+                self.db.commit()
+            except Exception as e:
+                self.db.rollback()
+                if k8s_updated:
+                    self._rollback(cert_info)
+                raise CertificateRenewalError(f"Database update failed: {e}")
+
+            # Step 5: Queue reload on external resource (non-blocking)
             if cert_info.resource_id:
-                try:
-                    self.reload_external_resource_certificate(
-                        self.db.resources[cert_info.resource_id],
-                        new_cert_pem,
-                        new_key_pem
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"External resource reload failed (non-blocking): {e}"
-                    )
-
-            # Step 4: Update database
-            self.db.certificates[cert_info.cert_id] = dict(
-                certificate=new_cert_pem,
-                private_key=new_key_pem,
-                valid_until=valid_until,
-                updated_at=datetime.utcnow(),
-            )
-            self.db.commit()
+                self._reload_queue.put((
+                    self._get_row('resources', cert_info.resource_id),
+                    new_cert_pem,
+                    new_key_pem,
+                ))
 
-            # Step 5: Create audit log
-            self._create_audit_log(
-                action="certificate_renewed",
-                cert_id=cert_info.cert_id,
-                resource_id=cert_info.resource_id,
-                details={
-                    "common_name": cert_info.common_name,
-                    "valid_until": valid_until.isoformat(),
-                    "k8s_updated": bool(cert_info.k8s_namespace),
-                }
-            )
-
-            # Step 6: Send notification
-            try:
-                self.notify_admin(cert_info, event_type="renewal_success")
-            except NotificationError:
-                logger.error("Failed to send success notification (non-blocking)")
+            # Step 6: Queue notification for the cycle digest
+            self._queue_notification(cert_info, event_type="renewal_success")
 
             logger.info(f"Certificate {cert_info.cert_id} renewed successfully")
 
@@ -520,6 +1146,51 @@ class CertRotationWorker:
             )
             raise CertificateRenewalError(f"Unexpected error: {e}")
 
+    def _get_row(self, table: str, row_id: int) -> Any:
+        """Look up a row by id, memoized for the current rotation cycle.
+
+        Args:
+            table: Table name
+            row_id: Row ID
+
+        Returns:
+            PyDAL Row, or None if it does not exist
+        """
+        key = (table, row_id)
+        if key not in self._cycle_cache:
+            self._cycle_cache[key] = self.db[table][row_id]
+        return self._cycle_cache[key]
+
+    def _rollback(self, cert_info: CertificateInfo) -> None:
+        """Restore the stored certificate to the Kubernetes Secret.
+
+        Called when the Secret was updated but the database update failed.
+        The stored certificate is only read here, since most renewals never
+        need it.
+
+        Args:
+            cert_info: Certificate information
+        """
+        try:
+            old_cert = self.db(
+                self.db.certificates.id == cert_info.cert_id
+            ).select(
+                self.db.certificates.certificate,
+                self.db.certificates.private_key,
+            ).first()
+            self.update_k8s_secret(
+                self._get_row('resources', cert_info.resource_id),
+                old_cert.certificate,
+                old_cert.private_key
+            )
+            logger.info(f"Kubernetes Secret rolled back for certificate {cert_info.cert_id}")
+        except Exception as e:
+            logger.error(
+                f"Failed to roll back Kubernetes Secret for certificate "
+                f"{cert_info.cert_id}: {e}",
+                exc_info=True
+            )
+
     def _build_notification_message(
         self,
         cert_info: CertificateInfo,
@@ -566,24 +1237,23 @@ class CertRotationWorker:
     ) -> None:
         """Create audit log entry for certificate operations.
 
+        The entry is inserted into the current transaction and committed by
+        the caller.
+
         Args:
             action: Action performed (e.g., 'certificate_renewed')
             cert_id: Certificate ID
             resource_id: Associated resource ID if applicable
             details: Additional details as dictionary
         """
-        try:
-            self.db.audit_logs.insert(
-                action=action,
-                resource_type="certificate",
-                resource_id=cert_id,
-                details=json.dumps(details or {}),
-                timestamp=datetime.utcnow(),
-            )
-            self.db.commit()
-            logger.debug(f"Audit log created: {action} for certificate {cert_id}")
-        except Exception as e:
-            logger.error(f"Failed to create audit log: {e}", exc_info=True)
+        self.db.audit_logs.insert(
+            action=action,
+            resource_type="certificate",
+            resource_id=cert_id,
+            details=_json_dumps(details) if details else None,
+            timestamp=_utcnow(),
+        )
+        logger.debug(f"Audit log created: {action} for certificate {cert_id}")
 
 
 def create_cert_rotation_worker(
@@ -597,6 +1267,7 @@ def create_cert_rotation_worker(
     Reads configuration from environment variables:
     - CHECK_INTERVAL: Rotation check interval in seconds (default: 86400)
     - NOTIFICATION_THRESHOLD: Days before expiry to notify (default: 7)
+    - MAX_PARALLEL_RENEWALS: Certificates renewed concurrently (default: 8)
 
     Args:
         db: PyDAL database instance
@@ -609,6 +1280,7 @@ def create_cert_rotation_worker(
     """
     check_interval = int(os.getenv("CHECK_INTERVAL", "86400"))
     notification_threshold = int(os.getenv("NOTIFICATION_THRESHOLD", "7"))
+    max_parallel_renewals = int(os.getenv("MAX_PARALLEL_RENEWALS", "8"))
 
     return CertRotationWorker(
         db=db,
@@ -617,4 +1289,5 @@ def create_cert_rotation_worker(
         notification_handler=notification_handler,
         check_interval=check_interval,
         notification_threshold_days=notification_threshold,
+        max_parallel_renewals=max_parallel_renewals,
     )
@@ -16,69 +16,85 @@ import os
 import time
 import logging
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, field
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timezone
 import threading
 import json
+import random
+import importlib
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
 
 from prometheus_client import Gauge, Counter
 
+try:
+    from models import get_resource_type, insert_resource_stats_batch
+except ImportError:
+    get_resource_type = None
+    insert_resource_stats_batch = None
+
 logger = logging.getLogger(__name__)
 
 
-# Prometheus metrics
+# Prometheus metrics; per-resource series are labelled by resource_id only,
+# with names and types exposed once through RESOURCE_INFO for query-time joins
+RESOURCE_INFO = Gauge(
+    'nest_resource_info',
+    'Resource metadata (always 1)',
+    ['resource_id', 'resource_name', 'resource_type']
+)
+
 RESOURCE_CPU_PERCENT = Gauge(
     'nest_resource_cpu_percent',
     'Resource CPU usage percentage',
-    ['resource_id', 'resource_name']
+    ['resource_id']
 )
 
 RESOURCE_MEMORY_BYTES = Gauge(
     'nest_resource_memory_bytes',
     'Resource memory usage in bytes',
-    ['resource_id', 'resource_name']
+    ['resource_id']
 )
 
 RESOURCE_MEMORY_PERCENT = Gauge(
     'nest_resource_memory_percent',
     'Resource memory usage percentage',
-    ['resource_id', 'resource_name']
+    ['resource_id']
 )
 
 RESOURCE_DISK_USAGE_PERCENT = Gauge(
     'nest_resource_disk_usage_percent',
     'Resource disk usage percentage',
-    ['resource_id', 'resource_name']
+    ['resource_id']
 )
 
 RESOURCE_NETWORK_IN_BYTES = Gauge(
     'nest_resource_network_in_bytes',
     'Network bytes received',
-    ['resource_id', 'resource_name']
+    ['resource_id']
 )
 
 RESOURCE_NETWORK_OUT_BYTES = Gauge(
     'nest_resource_network_out_bytes',
     'Network bytes transmitted',
-    ['resource_id', 'resource_name']
+    ['resource_id']
 )
 
 RESOURCE_CONNECTIONS = Gauge(
     'nest_resource_connections',
     'Active connections',
-    ['resource_id', 'resource_name', 'connection_type']
+    ['resource_id', 'connection_type']
 )
 
 RESOURCE_CACHE_HIT_RATIO = Gauge(
     'nest_resource_cache_hit_ratio',
     'Cache hit ratio percentage',
-    ['resource_id', 'resource_name']
+    ['resource_id']
 )
 
 RESOURCE_RISK_LEVEL = Gauge(
     'nest_resource_risk_level',
     'Resource risk level (0=low, 1=medium, 2=high, 3=critical)',
-    ['resource_id', 'resource_name']
+    ['resource_id']
 )
 
 STATS_COLLECTION_ERRORS = Counter(
@@ -87,21 +103,192 @@ STATS_COLLECTION_ERRORS = Counter(
     ['resource_id', 'resource_type']
 )
 
+STATS_COLLECTION_SKIPPED = Counter(
+    'nest_stats_collection_skipped_total',
+    'Resources skipped because the collection cycle deadline passed'
+)
+
 STATS_COLLECTION_DURATION = Gauge(
     'nest_stats_collection_duration_seconds',
     'Statistics collection duration',
     ['operation']
 )
 
+# Sleep between cycles is jittered by up to this fraction of the interval so
+# manager replicas do not collect in lockstep
+INTERVAL_JITTER = 0.1
+
+# Resources not collected within this fraction of the interval are skipped
+CYCLE_DEADLINE_FRACTION = 0.8
+
+# Resources failing collection are retried after
+# RESOURCE_BACKOFF_BASE * 2 ** failures seconds, capped at RESOURCE_BACKOFF_MAX
+RESOURCE_BACKOFF_BASE = 60
+RESOURCE_BACKOFF_MAX = 3600
+
+# Seconds a pod's CPU capacity is reused before its spec is read again
+POD_CPU_CAPACITY_TTL = 600
+
+# Seconds a Kubernetes API request may take, so a stalled API server cannot
+# hold a collection thread indefinitely
+K8S_REQUEST_TIMEOUT = 10
+
+# Per-resource gauges labelled by resource_id alone, by metrics key
+_RESOURCE_GAUGES = (
+    ('cpu_percent', RESOURCE_CPU_PERCENT),
+    ('memory_bytes', RESOURCE_MEMORY_BYTES),
+    ('memory_percent', RESOURCE_MEMORY_PERCENT),
+    ('disk_usage_percent', RESOURCE_DISK_USAGE_PERCENT),
+    ('network_in_bytes', RESOURCE_NETWORK_IN_BYTES),
+    ('network_out_bytes', RESOURCE_NETWORK_OUT_BYTES),
+    ('cache_hit_ratio', RESOURCE_CACHE_HIT_RATIO),
+)
+_RESOURCE_GAUGES_BY_KEY = dict(_RESOURCE_GAUGES)
+
+# Gauge values closer than this to the last exported value are not re-set
+GAUGE_EPSILON = 1e-6
+
+# Connection counts exported by RESOURCE_CONNECTIONS; connectors may report
+# other keys, which are not exported to keep the label set bounded
+EXPORTED_CONNECTION_TYPES = frozenset({'total', 'active', 'idle'})
+
+# Risk levels in increasing priority
+RISK_LEVELS = ('low', 'medium', 'high', 'critical')
+
+# Bits of RiskFactors.factors
+FACTOR_DISK_CRITICAL = 1 << 0
+FACTOR_DISK_HIGH = 1 << 1
+FACTOR_MEMORY_HIGH = 1 << 2
+FACTOR_MEMORY_MODERATE = 1 << 3
+FACTOR_CONNECTIONS_HIGH = 1 << 4
+FACTOR_CPU_HIGH = 1 << 5
+
+# Stored text of each factor bit, in bit order; formatted with the measured
+# value of the factor's attribute
+FACTOR_NAMES = {
+    FACTOR_DISK_CRITICAL: 'Disk usage critical (>95%)',
+    FACTOR_DISK_HIGH: 'Disk usage high (>85%)',
+    FACTOR_MEMORY_HIGH: 'Memory usage high (>90%)',
+    FACTOR_MEMORY_MODERATE: 'Memory usage moderate (>85%)',
+    FACTOR_CONNECTIONS_HIGH: 'Connection saturation high ({:.1f}%)',
+    FACTOR_CPU_HIGH: 'CPU usage high ({:.1f}%)',
+}
+
+# RiskFactors attribute -> (threshold, RISK_LEVELS index, factor bit) rules,
+# highest threshold first; the first rule exceeded applies
+_RISK_THRESHOLDS = (
+    ('disk_usage_percent', (
+        (95, 3, FACTOR_DISK_CRITICAL),
+        (85, 2, FACTOR_DISK_HIGH),
+    )),
+    ('memory_percent', (
+        (90, 2, FACTOR_MEMORY_HIGH),
+        (85, 1, FACTOR_MEMORY_MODERATE),
+    )),
+    ('connection_saturation', (
+        (80, 1, FACTOR_CONNECTIONS_HIGH),
+    )),
+    ('cpu_percent', (
+        (85, 1, FACTOR_CPU_HIGH),
+    )),
+)
+
+# RiskFactors attribute measured by each factor bit
+_FACTOR_ATTRS = {
+    factor_bit: attr
+    for attr, rules in _RISK_THRESHOLDS
+    for _, _, factor_bit in rules
+}
+
+# Keep raw connector output in stored metrics (debugging only)
+STORE_RAW_STATS = os.getenv('NEST_STATS_RAW', '0') == '1'
+
+# Default-valued metrics left out of stored rows; absent keys read as zero
+_EMPTY_METRIC_VALUES = (0, 0.0, None, {}, '')
+
+
+def _utcnow() -> datetime:
+    """Get the current UTC time as a naive datetime, like PyDAL's columns."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _sparse_metrics(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop default-valued entries from a metrics dict before storage."""
+    return {k: v for k, v in metrics.items() if v not in _EMPTY_METRIC_VALUES}
+
+# Kubernetes quantity suffixes and multipliers, longest suffix first so
+# binary suffixes ("Mi") are matched before decimal ones ("M")
+_K8S_SUFFIXES = (
+    ('Ki', 1024),
+    ('Mi', 1024 ** 2),
+    ('Gi', 1024 ** 3),
+    ('Ti', 1024 ** 4),
+    ('k', 1000),
+    ('M', 1000 ** 2),
+    ('G', 1000 ** 3),
+    ('T', 1000 ** 4),
+)
+_K8S_SUFFIX_KEYS = tuple(suffix for suffix, _ in _K8S_SUFFIXES)
+
+# Resource connector classes by resource type name, as "module:ClassName"
+_CONNECTORS = {
+    'postgresql': 'apps.manager.lib.resource_connectors.postgresql:PostgreSQLConnector',
+    'mariadb': 'apps.manager.lib.resource_connectors.mariadb:MariaDBConnector',
+    'redis': 'apps.manager.lib.resource_connectors.redis:RedisConnector',
+    'ceph': 'apps.manager.lib.resource_connectors.ceph:CephConnector',
+    'san': 'apps.manager.lib.resource_connectors.san:SANConnector',
+}
+
+# Connector classes imported so far, by resource type name
+_connector_classes: Dict[str, type] = {}
+
+
+def _load_connector_class(resource_type_name: str) -> Optional[type]:
+    """Get the connector class for a resource type.
+
+    The class is imported on first use and cached for later lookups.
 
-@dataclass
+    Args:
+        resource_type_name: Lower-case resource type name
+
+    Returns:
+        Connector class, or None if the type has no connector
+
+    Raises:
+        ImportError: If the connector module cannot be imported
+    """
+    connector_class = _connector_classes.get(resource_type_name)
+    if connector_class is None:
+        target = _CONNECTORS.get(resource_type_name)
+        if target is None:
+            return None
+        module_name, class_name = target.split(':')
+        connector_class = getattr(importlib.import_module(module_name), class_name)
+        _connector_classes[resource_type_name] = connector_class
+    return connector_class
+
+
+@dataclass(slots=True)
 class RiskFactors:
     """Risk assessment factors for a resource."""
     disk_usage_percent: Optional[float] = None
     memory_percent: Optional[float] = None
     connection_saturation: Optional[float] = None
     cpu_percent: Optional[float] = None
-    factors: List[str] = field(default_factory=list)
+    # Bitwise OR of FACTOR_* bits; stored as text, see describe()
+    factors: int = 0
+
+    def describe(self) -> List[str]:
+        """Render the set factors as text, with their measured values.
+
+        Returns:
+            Text of each set factor, in bit order
+        """
+        return [
+            name.format(getattr(self, _FACTOR_ATTRS[bit]))
+            for bit, name in FACTOR_NAMES.items()
+            if self.factors & bit
+        ]
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
@@ -110,7 +297,7 @@ class RiskFactors:
             'memory_percent': self.memory_percent,
             'connection_saturation': self.connection_saturation,
             'cpu_percent': self.cpu_percent,
-            'factors': self.factors,
+            'factors': self.describe(),
         }
 
 
@@ -155,6 +342,42 @@ class StatsCollector:
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        # Last RESOURCE_INFO (resource_name, resource_type) per resource_id
+        self._resource_info: Dict[str, tuple] = {}
+        # Resolved gauge children per resource_id, keyed by metrics key, or
+        # by ('connections', connection_type) for RESOURCE_CONNECTIONS
+        self._label_cache: Dict[str, Dict[Any, Any]] = {}
+        # Last value set per resource_id and gauge child key
+        self._last_values: Dict[str, Dict[Any, float]] = {}
+        # Consecutive collection failures and next attempt (time.monotonic())
+        # per resource_id, for resources in backoff
+        self._fail_counts: Dict[str, int] = {}
+        self._next_try: Dict[str, float] = {}
+        # Collections still running past an earlier cycle's deadline, per
+        # resource_id; the resource is not submitted again until they finish
+        self._overrunning: Dict[str, Future] = {}
+        # Pod CPU capacity per resource_id as (pod name, millicores,
+        # time.monotonic() expiry)
+        self._cpu_capacity: Dict[str, tuple] = {}
+        # Pod metrics listed this cycle, keyed by namespace then pod name
+        self._k8s_pod_metrics: Dict[str, Dict[str, Any]] = {}
+        # Active-resources SELECT and its fields, compiled on first use
+        self._active_fields: Optional[list] = None
+        self._active_sql: Optional[str] = None
+        # Kubernetes API clients shared by all pool threads, built on first use
+        self._k8s_api_lock = threading.Lock()
+        self._k8s_api_client = None
+        self._custom_api = None
+        self._core_api = None
+        # Collection is I/O bound, so resources are collected concurrently
+        self._executor: Optional[ThreadPoolExecutor] = self._create_executor()
+
+    def _create_executor(self) -> ThreadPoolExecutor:
+        """Create the per-resource collection thread pool."""
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix='stats',
+        )
 
     @property
     def k8s_client(self):
@@ -168,6 +391,27 @@ class StatsCollector:
                 return None
         return self._k8s_client
 
+    def _k8s_apis(self) -> tuple:
+        """Get the shared Kubernetes API clients, creating them on first use.
+
+        One ApiClient backs both APIs so pool threads share its urllib3
+        connection pool, sized for max_workers, and keep connections alive
+        across cycles.
+
+        Returns:
+            Tuple of (CustomObjectsApi, CoreV1Api)
+        """
+        with self._k8s_api_lock:
+            if self._k8s_api_client is None:
+                from kubernetes import client
+                configuration = client.Configuration.get_default_copy()
+                configuration.connection_pool_maxsize = self.max_workers * 2
+                configuration.retries = 3
+                self._k8s_api_client = client.ApiClient(configuration)
+                self._custom_api = client.CustomObjectsApi(self._k8s_api_client)
+                self._core_api = client.CoreV1Api(self._k8s_api_client)
+            return self._custom_api, self._core_api
+
     def start(self) -> None:
         """Start the statistics collector worker thread."""
         if self._running:
@@ -176,6 +420,8 @@ class StatsCollector:
 
         self._running = True
         self._stop_event.clear()
+        if self._executor is None:
+            self._executor = self._create_executor()
         self._thread = threading.Thread(target=self.run, daemon=True)
         self._thread.start()
         logger.info(f"Stats collector started (interval: {self.interval_seconds}s)")
@@ -196,6 +442,13 @@ class StatsCollector:
         logger.info("Stopping stats collector...")
         self._stop_event.set()
         self._running = False
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        with self._k8s_api_lock:
+            if self._k8s_api_client is not None:
+                self._k8s_api_client.close()
+                self._k8s_api_client = self._custom_api = self._core_api = None
 
         if self._thread:
             self._thread.join(timeout=timeout)
@@ -220,9 +473,11 @@ class StatsCollector:
                 elapsed = time.time() - start_time
                 STATS_COLLECTION_DURATION.labels(operation='collect_all_stats').set(elapsed)
 
-                # Sleep for remaining interval (or 0 if collection took longer)
-                remaining = max(0, self.interval_seconds - elapsed)
-                self._stop_event.wait(remaining)
+                # Sleep for remaining interval (or 0 if collection took longer),
+                # jittered to spread load from multiple replicas
+                jitter = self.interval_seconds * INTERVAL_JITTER
+                remaining = max(0, self.interval_seconds - elapsed) + random.uniform(-jitter, jitter)
+                self._stop_event.wait(max(0, remaining))
 
             except Exception as e:
                 logger.error(f"Error in stats collection loop: {e}", exc_info=True)
@@ -232,43 +487,236 @@ class StatsCollector:
         """Collect statistics for all active resources.
 
         Queries resources with lifecycle_mode in ('full', 'partial') and active status,
-        then collects appropriate metrics for each resource type.
+        then collects appropriate metrics for each resource type. Resources
+        not collected by the cycle deadline are skipped until the next cycle,
+        and resources in failure backoff until their next attempt. A
+        collection still running at the deadline counts as a failure, and its
+        resource is not collected again until that call returns.
         """
+        deadline = time.monotonic() + self.interval_seconds * CYCLE_DEADLINE_FRACTION
         try:
-            # Query all active resources in full or partial lifecycle mode
-            resources = self.db(
-                (self.db.resources.status == 'active') &
-                (self.db.resources.lifecycle_mode.belongs(['full', 'partial'])) &
-                (self.db.resources.deleted_at == None)
-            ).select()
+            resources = self._select_active_resources()
 
             logger.debug(f"Collecting stats for {len(resources)} resources")
 
-            for resource in resources:
-                try:
-                    self.collect_resource_stats(resource)
-                except Exception as e:
-                    logger.error(
-                        f"Failed to collect stats for resource {resource.id} "
-                        f"({resource.name}): {e}",
-                        exc_info=True
-                    )
-                    STATS_COLLECTION_ERRORS.labels(
-                        resource_id=str(resource.id),
-                        resource_type=resource.resource_type_id
-                    ).inc()
+            self._evict_stale_series({str(resource.id) for resource in resources})
+
+            # Lazy tables are materialized here, before pool threads touch them
+            self.db.resource_types
+            self.db.resource_stats
+
+            # One naive UTC timestamp for every row written this cycle
+            cycle_ts = _utcnow()
+
+            self._overrunning = {
+                resource_id: future for resource_id, future in self._overrunning.items()
+                if not future.done()
+            }
+            now = time.monotonic()
+            resources = [
+                resource for resource in resources
+                if now >= self._next_try.get(str(resource.id), 0)
+                and str(resource.id) not in self._overrunning
+            ]
+
+            if self._executor is None:
+                self._executor = self._create_executor()
+
+            # One metrics list call per namespace instead of one GET per pod
+            self._k8s_pod_metrics = self._list_k8s_pod_metrics({
+                resource.k8s_namespace for resource in resources
+                if resource.k8s_namespace and resource.k8s_resource_name
+            })
+
+            futures = {
+                self._executor.submit(
+                    self._collect_on_pool_thread, resource, cycle_ts, deadline
+                ): resource
+                for resource in resources
+            }
+            rows = []
+            try:
+                for future in as_completed(futures, timeout=max(0, deadline - time.monotonic())):
+                    resource = futures[future]
+                    try:
+                        row = future.result()
+                        if row:
+                            rows.append(row)
+                    except Exception as e:
+                        logger.error(
+                            f"Failed to collect stats for resource {resource.id} "
+                            f"({resource.name}): {e}",
+                            exc_info=True
+                        )
+                        STATS_COLLECTION_ERRORS.labels(
+                            resource_id=str(resource.id),
+                            resource_type=resource.resource_type_id
+                        ).inc()
+            except FuturesTimeout:
+                # Queued collections are dropped; running ones keep their pool
+                # thread, so their resources back off instead of piling up
+                outstanding = [future for future in futures if not future.done()]
+                for future in outstanding:
+                    if future.cancel():
+                        STATS_COLLECTION_SKIPPED.inc()
+                        continue
+                    resource = futures[future]
+                    self._overrunning[str(resource.id)] = future
+                    self._record_collection_failure(resource)
+                logger.warning(
+                    f"Stats collection deadline passed with {len(outstanding)} "
+                    f"resources outstanding"
+                )
+
+            # Store the whole cycle's metrics in one batched write
+            if rows:
+                self._store_resource_stats(rows)
 
         except Exception as e:
             logger.error(f"Failed to query resources: {e}", exc_info=True)
 
-    def collect_resource_stats(self, resource: Any) -> None:
+    def _select_active_resources(self) -> Any:
+        """Select active resources in full or partial lifecycle mode.
+
+        Only the columns collection needs are fetched. The SQL is compiled
+        once and reused; rows are still parsed by PyDAL.
+
+        Returns:
+            PyDAL Rows of resources
+        """
+        if self._active_sql is None:
+            resources_table = self.db.resources
+            self._active_fields = [
+                resources_table.id,
+                resources_table.name,
+                resources_table.resource_type_id,
+                resources_table.k8s_namespace,
+                resources_table.k8s_resource_name,
+                resources_table.connection_info,
+                resources_table.credentials,
+            ]
+            self._active_sql = self.db(
+                (resources_table.status == 'active') &
+                (resources_table.lifecycle_mode.belongs(['full', 'partial'])) &
+                (resources_table.deleted_at == None)
+            )._select(*self._active_fields)
+
+        return self.db.executesql(self._active_sql, fields=self._active_fields)
+
+    def _set_gauge(self, resource_id: str, key: Any, gauge: Gauge, value: float) -> None:
+        """Set a per-resource gauge child, skipping unchanged values.
+
+        Gauge children are resolved once per resource and reused.
+
+        Args:
+            resource_id: resource_id label value
+            key: Metrics key, or ('connections', connection_type)
+            gauge: Gauge the child belongs to
+            value: New value
+        """
+        last_values = self._last_values.setdefault(resource_id, {})
+        previous = last_values.get(key)
+        if previous is not None and abs(value - previous) < GAUGE_EPSILON:
+            return
+
+        children = self._label_cache.setdefault(resource_id, {})
+        child = children.get(key)
+        if child is None:
+            labels = (resource_id, key[1]) if isinstance(key, tuple) else (resource_id,)
+            child = children[key] = gauge.labels(*labels)
+        child.set(value)
+        last_values[key] = value
+
+    def _evict_stale_series(self, active_ids: set) -> None:
+        """Remove Prometheus series of resources that are no longer collected.
+
+        Args:
+            active_ids: resource_id label values of this cycle's resources
+        """
+        for resource_id in set(self._cpu_capacity) - active_ids:
+            del self._cpu_capacity[resource_id]
+
+        for resource_id in set(self._fail_counts) - active_ids:
+            del self._fail_counts[resource_id]
+            self._next_try.pop(resource_id, None)
+
+        for resource_id in set(self._label_cache) - active_ids:
+            self._last_values.pop(resource_id, None)
+            for key in self._label_cache.pop(resource_id):
+                if key == 'risk_level':
+                    RESOURCE_RISK_LEVEL.remove(resource_id)
+                elif isinstance(key, tuple):
+                    RESOURCE_CONNECTIONS.remove(resource_id, key[1])
+                else:
+                    _RESOURCE_GAUGES_BY_KEY[key].remove(resource_id)
+
+            info = self._resource_info.pop(resource_id, None)
+            if info is not None:
+                RESOURCE_INFO.remove(resource_id, *info)
+
+    def _store_resource_stats(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert collected resource_stats rows in batches.
+
+        Args:
+            rows: resource_stats rows returned by collect_resource_stats
+        """
+        try:
+            if insert_resource_stats_batch is not None:
+                insert_resource_stats_batch(self.db, rows)
+            else:
+                self.db.resource_stats.bulk_insert(rows)
+                self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to store stats for {len(rows)} resources: {e}",
+                        exc_info=True)
+
+    def _collect_on_pool_thread(
+        self,
+        resource: Any,
+        timestamp: datetime,
+        deadline: float
+    ) -> Optional[Dict[str, Any]]:
+        """Collect statistics for a resource on a collection pool thread.
+
+        PyDAL keeps one connection per thread; it is returned to the pool
+        once the collection finishes.
+
+        Args:
+            resource: Resource record from database
+            timestamp: Collection cycle timestamp
+            deadline: time.monotonic() value after which collection is skipped
+
+        Returns:
+            resource_stats row, or None if no metrics were collected
+        """
+        if time.monotonic() >= deadline:
+            STATS_COLLECTION_SKIPPED.inc()
+            logger.debug(f"Skipping stats for resource {resource.name}: cycle deadline passed")
+            return None
+
+        try:
+            return self.collect_resource_stats(resource, timestamp)
+        finally:
+            self.db._adapter.close(action='rollback', really=False)
+
+    def collect_resource_stats(
+        self,
+        resource: Any,
+        timestamp: Optional[datetime] = None
+    ) -> Optional[Dict[str, Any]]:
         """Collect statistics for a single resource.
 
         Determines resource type (Kubernetes or external) and collects
-        appropriate metrics using the corresponding method.
+        appropriate metrics using the corresponding method. The caller
+        stores the returned row.
 
         Args:
             resource: Resource record from database
+            timestamp: Row timestamp (naive UTC), defaults to now
+
+        Returns:
+            resource_stats row, or None if no metrics were collected
         """
         resource_id = resource.id
         resource_name = resource.name
@@ -286,32 +734,98 @@ class StatsCollector:
 
             if not metrics:
                 logger.warning(f"No metrics collected for resource {resource_name}")
-                return
+                self._record_collection_failure(resource)
+                return None
+
+            self._fail_counts.pop(str(resource_id), None)
+            self._next_try.pop(str(resource_id), None)
 
             # Calculate risk assessment
             risk_level, risk_factors = self.calculate_risk_level(metrics)
 
-            # Store metrics in database
-            self.db.resource_stats.insert(
-                resource_id=resource_id,
-                timestamp=datetime.now(),
-                metrics=metrics,
-                risk_level=risk_level,
-                risk_factors=risk_factors.to_dict(),
-            )
-            self.db.commit()
-
             # Export to Prometheus
             self.export_prometheus_metrics(resource, metrics, risk_level)
 
             logger.debug(f"Stats collected for resource {resource_name}: "
                         f"risk_level={risk_level}")
 
+            return dict(
+                resource_id=resource_id,
+                timestamp=timestamp or _utcnow(),
+                metrics=_sparse_metrics(metrics),
+                risk_level=risk_level,
+                risk_factors=risk_factors.to_dict(),
+            )
+
         except Exception as e:
             logger.error(f"Error collecting stats for resource {resource_name}: {e}",
                         exc_info=True)
+            self._record_collection_failure(resource)
             raise
 
+    def _record_collection_failure(self, resource: Any) -> None:
+        """Back off further collection of a resource after a failure.
+
+        Args:
+            resource: Resource record whose collection failed
+        """
+        resource_id = str(resource.id)
+        failures = self._fail_counts.get(resource_id, 0) + 1
+        self._fail_counts[resource_id] = failures
+        delay = min(RESOURCE_BACKOFF_MAX, RESOURCE_BACKOFF_BASE * 2 ** failures)
+        self._next_try[resource_id] = time.monotonic() + delay
+        logger.info(
+            f"Backing off stats collection for resource {resource.name} "
+            f"for {delay}s after {failures} consecutive failures"
+        )
+
+    def _list_k8s_pod_metrics(self, namespaces: set) -> Dict[str, Dict[str, Any]]:
+        """List pod metrics for each namespace, concurrently on the pool.
+
+        Args:
+            namespaces: Namespaces holding Kubernetes resources
+
+        Returns:
+            Pod metrics keyed by namespace then pod name; namespaces whose
+            list call failed are left out
+        """
+        if not namespaces or not self.k8s_client:
+            return {}
+
+        try:
+            custom_api, _ = self._k8s_apis()
+        except Exception as e:
+            logger.warning(f"Kubernetes metrics API not available: {e}")
+            return {}
+
+        def list_namespace(namespace: str) -> Dict[str, Any]:
+            response = custom_api.list_namespaced_custom_object(
+                group="metrics.k8s.io",
+                version="v1beta1",
+                namespace=namespace,
+                plural="pods",
+                _request_timeout=K8S_REQUEST_TIMEOUT,
+            )
+            return {
+                item['metadata']['name']: item
+                for item in response.get('items', [])
+            }
+
+        pod_metrics = {}
+        futures = {
+            self._executor.submit(list_namespace, namespace): namespace
+            for namespace in namespaces
+        }
+        for future in as_completed(futures):
+            namespace = futures[future]
+            try:
+                pod_metrics[namespace] = future.result()
+            except Exception as e:
+                logger.warning(
+                    f"Failed to list Kubernetes pod metrics in {namespace}: {e}"
+                )
+        return pod_metrics
+
     def _collect_k8s_metrics(self, resource: Any) -> Optional[Dict[str, Any]]:
         """Collect metrics from Kubernetes Metrics API for a pod/container.
 
@@ -329,45 +843,104 @@ class StatsCollector:
             namespace = resource.k8s_namespace
             pod_name = resource.k8s_resource_name
 
-            # Get pod metrics using Kubernetes Metrics API
-            # Note: Requires metrics-server to be installed in the cluster
-            try:
-                from kubernetes import client
-                custom_api = client.CustomObjectsApi()
-
-                metric_pod = custom_api.get_namespaced_custom_object(
-                    group="metrics.k8s.io",
-                    version="v1beta1",
-                    namespace=namespace,
-                    plural="pods",
-                    name=pod_name,
-                )
+            # Use the namespace listing from this cycle when there is one
+            listed = self._k8s_pod_metrics.get(namespace)
+            if listed is not None:
+                metric_pod = listed.get(pod_name)
+                if metric_pod is None:
+                    logger.warning(f"No Kubernetes metrics for {namespace}/{pod_name}")
+                    return None
+            else:
+                # Get pod metrics using Kubernetes Metrics API
+                # Note: Requires metrics-server to be installed in the cluster
+                try:
+                    custom_api, _ = self._k8s_apis()
+
+                    metric_pod = custom_api.get_namespaced_custom_object(
+                        group="metrics.k8s.io",
+                        version="v1beta1",
+                        namespace=namespace,
+                        plural="pods",
+                        name=pod_name,
+                        _request_timeout=K8S_REQUEST_TIMEOUT,
+                    )
 
-                metrics = self._parse_k8s_metrics(metric_pod)
-                return metrics
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to get Kubernetes metrics for {namespace}/{pod_name}: {e}"
+                    )
+                    return None
 
-            except Exception as e:
-                logger.warning(
-                    f"Failed to get Kubernetes metrics for {namespace}/{pod_name}: {e}"
-                )
-                return None
+            cpu_capacity_m = self._get_pod_cpu_capacity(resource)
+            return self._parse_k8s_metrics(metric_pod, cpu_capacity_m)
 
         except Exception as e:
             logger.error(f"Error collecting K8s metrics for resource {resource.name}: {e}",
                         exc_info=True)
             return None
 
-    def _parse_k8s_metrics(self, metric_pod: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_pod_cpu_capacity(self, resource: Any) -> Optional[float]:
+        """Get the CPU a pod may use, from its container limits or requests.
+
+        The pod spec is cached per resource for POD_CPU_CAPACITY_TTL
+        seconds, or until the resource names a different pod.
+
+        Args:
+            resource: Resource record with k8s details
+
+        Returns:
+            Summed container CPU limits (requests where a container has no
+            limit) in millicores, or None if unknown
+        """
+        resource_id = str(resource.id)
+        pod_name = resource.k8s_resource_name
+        now = time.monotonic()
+        cached = self._cpu_capacity.get(resource_id)
+        if cached is not None and cached[0] == pod_name and now < cached[2]:
+            return cached[1]
+
+        try:
+            _, core_api = self._k8s_apis()
+            pod = core_api.read_namespaced_pod(
+                pod_name, resource.k8s_namespace, _request_timeout=K8S_REQUEST_TIMEOUT
+            )
+        except Exception as e:
+            logger.warning(f"Failed to read pod spec for resource {resource.name}: {e}")
+            return cached[1] if cached is not None else None
+
+        capacity_m = 0.0
+        for container in pod.spec.containers:
+            resources = container.resources
+            cpu = None
+            if resources is not None:
+                cpu = (resources.limits or {}).get('cpu') or (resources.requests or {}).get('cpu')
+            if cpu is None:
+                # One unbounded container makes the pod's capacity unknown
+                capacity_m = 0.0
+                break
+            capacity_m += self._parse_k8s_cpu(cpu)
+
+        capacity = capacity_m or None
+        self._cpu_capacity[resource_id] = (
+            pod_name, capacity, now + POD_CPU_CAPACITY_TTL
+        )
+        return capacity
+
+    def _parse_k8s_metrics(
+        self,
+        metric_pod: Dict[str, Any],
+        cpu_capacity_m: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Parse Kubernetes metrics API response.
 
         Args:
             metric_pod: Raw metrics API response
+            cpu_capacity_m: Pod CPU limit in millicores; one core if unknown
 
         Returns:
             Normalized metrics dictionary
         """
         metrics = {
-            'timestamp': datetime.now().isoformat(),
             'cpu_percent': 0.0,
             'memory_bytes': 0,
             'memory_percent': 0.0,
@@ -385,19 +958,15 @@ class StatsCollector:
             for container in containers:
                 usage = container.get('usage', {})
 
-                # CPU: convert millicores to percentage (assuming 1000m = 100%)
-                cpu_str = usage.get('cpu', '0m')
-                if cpu_str.endswith('m'):
-                    total_cpu_m += int(cpu_str[:-1])
-                elif cpu_str.endswith('n'):
-                    total_cpu_m += int(cpu_str[:-1]) / 1_000_000
+                # CPU: millicores
+                total_cpu_m += self._parse_k8s_cpu(usage.get('cpu', '0m'))
 
                 # Memory: convert to bytes
                 memory_str = usage.get('memory', '0Ki')
                 total_memory_bytes += self._parse_k8s_quantity(memory_str)
 
-            # Convert millicores to percentage (assuming 1000m per core, using single core as base)
-            metrics['cpu_percent'] = min(100.0, (total_cpu_m / 1000.0) * 100)
+            # Percentage of the pod's CPU limit, or of one core without one
+            metrics['cpu_percent'] = min(100.0, total_cpu_m / (cpu_capacity_m or 1000.0) * 100)
             metrics['memory_bytes'] = total_memory_bytes
 
         except Exception as e:
@@ -405,6 +974,26 @@ class StatsCollector:
 
         return metrics
 
+    def _parse_k8s_cpu(self, quantity: str) -> float:
+        """Parse Kubernetes CPU quantity string to millicores.
+
+        Args:
+            quantity: Kubernetes CPU quantity (e.g., "250m", "2", "1500000n")
+
+        Returns:
+            Value in millicores
+        """
+        try:
+            if quantity.endswith('n'):
+                return int(quantity[:-1]) / 1_000_000
+            if quantity.endswith('u'):
+                return int(quantity[:-1]) / 1_000
+            if quantity.endswith('m'):
+                return float(quantity[:-1])
+            return float(quantity) * 1000
+        except ValueError:
+            return 0.0
+
     def _parse_k8s_quantity(self, quantity: str) -> int:
         """Parse Kubernetes resource quantity string to bytes.
 
@@ -417,30 +1006,28 @@ class StatsCollector:
         if not quantity:
             return 0
 
-        multipliers = {
-            'Ki': 1024,
-            'Mi': 1024 ** 2,
-            'Gi': 1024 ** 3,
-            'Ti': 1024 ** 4,
-            'k': 1000,
-            'M': 1000 ** 2,
-            'G': 1000 ** 3,
-            'T': 1000 ** 4,
-        }
+        # metrics-server reports integer quantities; skip float parsing for them
+        if quantity.isdigit():
+            return int(quantity)
 
-        for suffix, multiplier in multipliers.items():
+        if not quantity.endswith(_K8S_SUFFIX_KEYS):
+            # Try plain number
+            try:
+                return int(quantity)
+            except ValueError:
+                return 0
+
+        for suffix, multiplier in _K8S_SUFFIXES:
             if quantity.endswith(suffix):
+                number = quantity[:-len(suffix)]
+                if number.isdigit():
+                    return int(number) * multiplier
                 try:
-                    value = float(quantity[:-len(suffix)])
-                    return int(value * multiplier)
+                    return int(float(number) * multiplier)
                 except ValueError:
                     return 0
 
-        # Try plain number
-        try:
-            return int(quantity)
-        except ValueError:
-            return 0
+        return 0
 
     def _collect_external_metrics(self, resource: Any) -> Optional[Dict[str, Any]]:
         """Collect metrics from external resource using appropriate connector.
@@ -453,7 +1040,10 @@ class StatsCollector:
         """
         try:
             resource_type_id = resource.resource_type_id
-            resource_type = self.db.resource_types[resource_type_id]
+            if get_resource_type is not None:
+                resource_type = get_resource_type(self.db, resource_type_id)
+            else:
+                resource_type = self.db.resource_types[resource_type_id]
 
             if not resource_type:
                 logger.warning(f"Resource type not found: {resource_type_id}")
@@ -494,30 +1084,13 @@ class StatsCollector:
         try:
             resource_type_name = resource_type.name.lower()
 
-            if resource_type_name == 'postgresql':
-                from apps.manager.lib.resource_connectors.postgresql import PostgreSQLConnector
-                return PostgreSQLConnector(resource.connection_info, resource.credentials)
-
-            elif resource_type_name == 'mariadb':
-                from apps.manager.lib.resource_connectors.mariadb import MariaDBConnector
-                return MariaDBConnector(resource.connection_info, resource.credentials)
-
-            elif resource_type_name == 'redis':
-                from apps.manager.lib.resource_connectors.redis import RedisConnector
-                return RedisConnector(resource.connection_info, resource.credentials)
-
-            elif resource_type_name == 'ceph':
-                from apps.manager.lib.resource_connectors.ceph import CephConnector
-                return CephConnector(resource.connection_info, resource.credentials)
-
-            elif resource_type_name == 'san':
-                from apps.manager.lib.resource_connectors.san import SANConnector
-                return SANConnector(resource.connection_info, resource.credentials)
-
-            else:
+            connector_class = _load_connector_class(resource_type_name)
+            if connector_class is None:
                 logger.warning(f"No connector available for resource type: {resource_type_name}")
                 return None
 
+            return connector_class(resource.connection_info, resource.credentials)
+
         except ImportError as e:
             logger.warning(f"Failed to import connector: {e}")
             return None
@@ -540,7 +1113,6 @@ class StatsCollector:
             Normalized metrics dictionary
         """
         metrics = {
-            'timestamp': datetime.now().isoformat(),
             'resource_type': resource_type,
         }
 
@@ -572,8 +1144,9 @@ class StatsCollector:
                     metrics['used_bytes'] / metrics['total_bytes'] * 100
                 )
 
-        # Include raw stats for inspection
-        metrics['raw_stats'] = connector_stats
+        # Raw connector output duplicates the fields above; opt-in only
+        if STORE_RAW_STATS:
+            metrics['raw_stats'] = connector_stats
 
         return metrics
 
@@ -593,56 +1166,28 @@ class StatsCollector:
         Returns:
             Tuple of (risk_level_string, RiskFactors object)
         """
-        risk_factors = RiskFactors()
-        risk_level = 'low'
-
-        # Check disk usage
-        disk_usage = metrics.get('disk_usage_percent')
-        if disk_usage is not None:
-            risk_factors.disk_usage_percent = disk_usage
-            if disk_usage > 95:
-                risk_level = 'critical'
-                risk_factors.factors.append('Disk usage critical (>95%)')
-            elif disk_usage > 85:
-                risk_level = 'high'
-                risk_factors.factors.append('Disk usage high (>85%)')
-
-        # Check memory usage
-        memory_percent = metrics.get('memory_percent')
-        if memory_percent is not None:
-            risk_factors.memory_percent = memory_percent
-            if memory_percent > 90:
-                if risk_level not in ['critical']:
-                    risk_level = 'high'
-                risk_factors.factors.append('Memory usage high (>90%)')
-            elif memory_percent > 85:
-                if risk_level not in ['critical', 'high']:
-                    risk_level = 'medium'
-                risk_factors.factors.append('Memory usage moderate (>85%)')
-
-        # Check connection saturation (for databases)
+        # Connection saturation (for databases) is derived, the rest are read as-is
+        saturation = None
         connections = metrics.get('connections', {})
         if isinstance(connections, dict):
             total_conns = connections.get('total', 0)
-            active_conns = connections.get('active', 0)
             if total_conns > 0:
-                saturation = (active_conns / total_conns) * 100
-                risk_factors.connection_saturation = saturation
-                if saturation > 80:
-                    if risk_level not in ['critical', 'high']:
-                        risk_level = 'medium'
-                    risk_factors.factors.append(f'Connection saturation high ({saturation:.1f}%)')
-
-        # Check CPU usage
-        cpu_percent = metrics.get('cpu_percent')
-        if cpu_percent is not None:
-            risk_factors.cpu_percent = cpu_percent
-            if cpu_percent > 85:
-                if risk_level not in ['critical', 'high']:
-                    risk_level = 'medium'
-                risk_factors.factors.append(f'CPU usage high ({cpu_percent:.1f}%)')
-
-        return risk_level, risk_factors
+                saturation = (connections.get('active', 0) / total_conns) * 100
+
+        risk_factors = RiskFactors()
+        level = 0
+        for attr, rules in _RISK_THRESHOLDS:
+            value = saturation if attr == 'connection_saturation' else metrics.get(attr)
+            if value is None:
+                continue
+            setattr(risk_factors, attr, value)
+            for threshold, rule_level, factor_bit in rules:
+                if value > threshold:
+                    level = max(level, rule_level)
+                    risk_factors.factors |= factor_bit
+                    break
+
+        return RISK_LEVELS[level], risk_factors
 
     def export_prometheus_metrics(
         self,
@@ -664,70 +1209,32 @@ class StatsCollector:
         resource_name = resource.name
 
         try:
-            # CPU usage
-            if 'cpu_percent' in metrics:
-                RESOURCE_CPU_PERCENT.labels(
-                    resource_id=resource_id,
-                    resource_name=resource_name
-                ).set(metrics['cpu_percent'])
-
-            # Memory usage
-            if 'memory_bytes' in metrics:
-                RESOURCE_MEMORY_BYTES.labels(
-                    resource_id=resource_id,
-                    resource_name=resource_name
-                ).set(metrics['memory_bytes'])
-
-            if 'memory_percent' in metrics:
-                RESOURCE_MEMORY_PERCENT.labels(
-                    resource_id=resource_id,
-                    resource_name=resource_name
-                ).set(metrics['memory_percent'])
-
-            # Disk usage
-            if 'disk_usage_percent' in metrics:
-                RESOURCE_DISK_USAGE_PERCENT.labels(
-                    resource_id=resource_id,
-                    resource_name=resource_name
-                ).set(metrics['disk_usage_percent'])
-
-            # Network I/O
-            if 'network_in_bytes' in metrics:
-                RESOURCE_NETWORK_IN_BYTES.labels(
-                    resource_id=resource_id,
-                    resource_name=resource_name
-                ).set(metrics['network_in_bytes'])
-
-            if 'network_out_bytes' in metrics:
-                RESOURCE_NETWORK_OUT_BYTES.labels(
-                    resource_id=resource_id,
-                    resource_name=resource_name
-                ).set(metrics['network_out_bytes'])
+            # A renamed resource drops its old info series
+            info = (resource_name, str(resource.resource_type_id))
+            previous_info = self._resource_info.get(resource_id)
+            if previous_info is not None and previous_info != info:
+                RESOURCE_INFO.remove(resource_id, *previous_info)
+            self._resource_info[resource_id] = info
+            RESOURCE_INFO.labels(resource_id, *info).set(1)
+
+            # CPU, memory, disk, network I/O and cache hit ratio
+            for key, gauge in _RESOURCE_GAUGES:
+                if key in metrics:
+                    self._set_gauge(resource_id, key, gauge, metrics[key])
 
             # Connections
             connections = metrics.get('connections', {})
             if isinstance(connections, dict):
                 for conn_type, count in connections.items():
-                    RESOURCE_CONNECTIONS.labels(
-                        resource_id=resource_id,
-                        resource_name=resource_name,
-                        connection_type=conn_type
-                    ).set(count)
-
-            # Cache hit ratio
-            if 'cache_hit_ratio' in metrics:
-                RESOURCE_CACHE_HIT_RATIO.labels(
-                    resource_id=resource_id,
-                    resource_name=resource_name
-                ).set(metrics['cache_hit_ratio'])
+                    if conn_type not in EXPORTED_CONNECTION_TYPES:
+                        continue
+                    self._set_gauge(resource_id, ('connections', conn_type),
+                                    RESOURCE_CONNECTIONS, count)
 
             # Risk level (convert to numeric: low=0, medium=1, high=2, critical=3)
             risk_level_map = {'low': 0, 'medium': 1, 'high': 2, 'critical': 3}
             risk_numeric = risk_level_map.get(risk_level, 0)
-            RESOURCE_RISK_LEVEL.labels(
-                resource_id=resource_id,
-                resource_name=resource_name
-            ).set(risk_numeric)
+            self._set_gauge(resource_id, 'risk_level', RESOURCE_RISK_LEVEL, risk_numeric)
 
         except Exception as e:
             logger.error(f"Error exporting Prometheus metrics for {resource_name}: {e}",
@@ -19,11 +19,20 @@ import time
 import signal
 import logging
 import json
+import select
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 # Import PyDAL database
-from models import db
+from models import db, DB_URI, RESOURCE_USERS_CHANNEL
+from pydal.objects import Expression
+
+try:
+    import psycopg2
+except ImportError:
+    psycopg2 = None
 
 # Import resource connectors
 from lib.resource_connectors.postgresql import PostgreSQLConnector
@@ -40,6 +49,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Returned for users left unsynced because the worker is shutting down
+_SKIPPED = object()
+
+# Connector class by resource type name
+_CONNECTORS = {
+    'db-postgresql': PostgreSQLConnector,     # PostgreSQL databases
+    'db-mariadb': MariaDBConnector,           # MariaDB databases
+    'db-redis': RedisConnector,               # Redis cache/data stores
+    'db-valkey': RedisConnector,              # Valkey (Redis-compatible) stores
+    'storage-ceph': CephConnector,            # Ceph storage
+    'storage-san': SANConnector,              # SAN storage
+}
+
+# Seconds a resource's connector is reused before it is reconnected
+CONNECTOR_CACHE_TTL = 300
+
+# Users left in 'syncing' this many seconds, e.g. by a worker that died
+# mid-batch, are returned to 'pending'; also how often that is checked
+SYNCING_STALE_AFTER = 900
+
 
 class UserSyncWorker:
     """
@@ -49,18 +78,44 @@ class UserSyncWorker:
     respective resources using resource-specific connectors.
     """
 
-    def __init__(self, sleep_interval: int = 30, batch_size: int = 10):
+    def __init__(
+        self,
+        sleep_interval: int = 30,
+        batch_size: int = 10,
+        max_workers: int = 4
+    ):
         """
         Initialize the UserSyncWorker.
 
         Args:
             sleep_interval: Seconds to sleep between sync cycles (default: 30)
             batch_size: Maximum users to sync per cycle (default: 10)
+            max_workers: Maximum users synced concurrently (default: 4)
         """
         self.sleep_interval = sleep_interval
         self.batch_size = batch_size
+        self.max_workers = max_workers
         self.running = True
         self.db = db
+        # Pending-users SELECT and its fields, compiled on first use
+        self._pending_fields = None
+        self._pending_sql = None
+        # Autocommit connection LISTENing for pending users, opened on first wait
+        self._listen_conn = None
+        # time.monotonic() of the next stale 'syncing' check; due at startup
+        self._next_stale_check = 0.0
+
+        # Connectors per resource id as (connector, expires_at, (connection_info,
+        # credentials)); a changed connection config replaces the connector
+        self._connector_cache: Dict[int, tuple] = {}
+        self._connector_lock = threading.Lock()
+
+        # Syncs are bound by connector I/O, so a batch is synced concurrently,
+        # one resource per thread; a batch never needs more than batch_size
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, batch_size)),
+            thread_name_prefix='user-sync',
+        )
 
         # Set up signal handlers for graceful shutdown
         signal.signal(signal.SIGTERM, self._handle_shutdown)
@@ -68,7 +123,8 @@ class UserSyncWorker:
 
         logger.info(
             f"UserSyncWorker initialized - "
-            f"interval: {sleep_interval}s, batch_size: {batch_size}"
+            f"interval: {sleep_interval}s, batch_size: {batch_size}, "
+            f"max_workers: {max_workers}"
         )
 
     def _handle_shutdown(self, signum, frame):
@@ -81,14 +137,19 @@ class UserSyncWorker:
         Main worker loop.
 
         Continuously monitors the resource_users table for pending users
-        and syncs them to their resources. Implements graceful shutdown handling.
+        and syncs them to their resources. Between cycles it waits for a
+        pending-user notification, polling every sleep_interval as a fallback.
+        Implements graceful shutdown handling.
         """
         logger.info("UserSyncWorker starting main loop")
 
         while self.running:
             try:
+                if time.monotonic() >= self._next_stale_check:
+                    self._requeue_stale_syncing()
+                    self._next_stale_check = time.monotonic() + SYNCING_STALE_AFTER
                 self.sync_pending_users()
-                time.sleep(self.sleep_interval)
+                self._wait_for_pending_users(self.sleep_interval)
             except KeyboardInterrupt:
                 logger.info("KeyboardInterrupt received, shutting down")
                 break
@@ -100,6 +161,9 @@ class UserSyncWorker:
                 # Continue running despite errors
                 time.sleep(self.sleep_interval)
 
+        self._executor.shutdown(wait=True)
+        self.close_all()
+        self._close_listen_connection()
         logger.info("UserSyncWorker shutdown complete")
 
     def sync_pending_users(self):
@@ -110,34 +174,65 @@ class UserSyncWorker:
         - sync_status='pending': Never synced users
         - Recently updated users that need re-syncing
 
-        Processes up to batch_size users per cycle.
+        Processes up to batch_size users per cycle. Each user is loaded
+        together with its resource and resource type in one joined query.
         """
         try:
-            # Query for pending users
-            pending_users = self.db(
-                (self.db.resource_users.sync_status == 'pending') |
-                (self.db.resource_users.sync_status == 'error')
-            ).select(
-                limitby=(0, self.batch_size),
-                orderby=self.db.resource_users.created_at
-            )
+            resource_users = self.db.resource_users
+
+            # Query for pending users with their resources and resource types
+            pending_users = self._select_pending_users()
 
             if not pending_users:
                 return
 
             logger.info(f"Found {len(pending_users)} pending users to sync")
 
-            for resource_user in pending_users:
-                if not self.running:
-                    break
+            # Mark the whole batch as syncing in one update; updated_at dates
+            # the claim for _requeue_stale_syncing
+            batch_ids = [row.resource_users.id for row in pending_users]
+            self.db(resource_users.id.belongs(batch_ids)).update(
+                sync_status='syncing',
+                updated_at=self._utc_now()
+            )
+            self.db.commit()
 
+            # Users of the same resource are synced in turn on one thread so
+            # they share that resource's cached connector
+            by_resource = {}
+            for row in pending_users:
+                by_resource.setdefault(row.resource_users.resource_id, []).append(row)
+
+            futures = {
+                self._executor.submit(self._sync_on_pool_thread, rows): rows
+                for rows in by_resource.values()
+            }
+            synced_ids = []
+            skipped_ids = []
+            errors = {}
+            for future in as_completed(futures):
                 try:
-                    self.sync_user(resource_user.id)
+                    outcomes = future.result()
                 except Exception as e:
                     logger.error(
-                        f"Error syncing user {resource_user.id}: {e}",
+                        f"Error syncing users of resource "
+                        f"{futures[future][0].resource_users.resource_id}: {e}",
                         exc_info=True
                     )
+                    outcomes = [
+                        (row.resource_users.id, "Unexpected error occurred - check logs")
+                        for row in futures[future]
+                    ]
+
+                for resource_user_id, outcome in outcomes:
+                    if outcome is None:
+                        synced_ids.append(resource_user_id)
+                    elif outcome is _SKIPPED:
+                        skipped_ids.append(resource_user_id)
+                    else:
+                        errors[resource_user_id] = outcome
+
+            self._record_sync_results(synced_ids, skipped_ids, errors)
 
         except Exception as e:
             logger.error(
@@ -145,57 +240,196 @@ class UserSyncWorker:
                 exc_info=True
             )
 
-    def sync_user(self, resource_user_id: int):
+    def _requeue_stale_syncing(self):
+        """
+        Return users stuck in 'syncing' to 'pending'.
+
+        A batch is marked 'syncing' before it is dispatched, so a worker
+        that dies mid-batch leaves the whole batch there. Claims older than
+        SYNCING_STALE_AFTER are treated as abandoned.
+        """
+        resource_users = self.db.resource_users
+        # Claims are dated by the database clock, so the cutoff is as well
+        cutoff = self._utc_now(-SYNCING_STALE_AFTER)
+        try:
+            requeued = self.db(
+                (resource_users.sync_status == 'syncing') &
+                (resource_users.updated_at < cutoff)
+            ).update(sync_status='pending')
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Error requeueing stale syncing users: {e}", exc_info=True)
+            return
+
+        if requeued:
+            logger.warning(f"Requeued {requeued} users stuck in syncing")
+
+    def _select_pending_users(self):
+        """
+        Select a batch of pending users with their resources and types.
+
+        The joined SELECT is compiled once and reused every cycle; rows are
+        still parsed by PyDAL.
+
+        Returns:
+            PyDAL Rows with resource_users, resources and resource_types parts
+        """
+        if self._pending_sql is None:
+            resource_users = self.db.resource_users
+            resources = self.db.resources
+            resource_types = self.db.resource_types
+            self._pending_fields = [
+                resource_users.id,
+                resource_users.resource_id,
+                resource_users.username,
+                resource_users.password_hash,
+                resource_users.roles,
+                resources.id,
+                resources.name,
+                resources.resource_type_id,
+                resources.connection_info,
+                resources.credentials,
+                resource_types.name,
+            ]
+            self._pending_sql = self.db(
+                (resource_users.sync_status == 'pending') |
+                (resource_users.sync_status == 'error')
+            )._select(
+                *self._pending_fields,
+                left=[
+                    resources.on(resources.id == resource_users.resource_id),
+                    resource_types.on(resource_types.id == resources.resource_type_id),
+                ],
+                limitby=(0, self.batch_size),
+                orderby=resource_users.created_at
+            )
+
+        return self.db.executesql(self._pending_sql, fields=self._pending_fields)
+
+    def _wait_for_pending_users(self, timeout: float):
+        """
+        Wait until a user becomes pending or the timeout passes.
+
+        Uses LISTEN on RESOURCE_USERS_CHANNEL, which a resource_users trigger
+        notifies. Falls back to sleeping when no listening connection can be
+        opened.
+
+        Args:
+            timeout: Maximum seconds to wait
+        """
+        conn = self._get_listen_connection()
+        if conn is None:
+            time.sleep(timeout)
+            return
+
+        try:
+            if select.select([conn], [], [], timeout)[0]:
+                # Drain every queued notification; one cycle handles them all
+                conn.poll()
+                conn.notifies.clear()
+        except Exception as e:
+            logger.warning(f"Lost pending-user listener connection: {e}")
+            self._close_listen_connection()
+
+    def _get_listen_connection(self):
+        """
+        Get the connection LISTENing for pending users, opening it if needed.
+
+        Returns:
+            psycopg2 connection, or None if it could not be opened
+        """
+        if self._listen_conn is not None or psycopg2 is None:
+            return self._listen_conn
+
+        try:
+            conn = psycopg2.connect(DB_URI)
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {RESOURCE_USERS_CHANNEL}")
+            self._listen_conn = conn
+        except Exception as e:
+            logger.warning(f"Could not listen for pending users, polling instead: {e}")
+        return self._listen_conn
+
+    def _close_listen_connection(self):
+        """Close the connection LISTENing for pending users."""
+        if self._listen_conn is None:
+            return
+        try:
+            self._listen_conn.close()
+        except Exception:
+            pass
+        self._listen_conn = None
+
+    def _sync_on_pool_thread(self, rows) -> List[tuple]:
+        """
+        Sync the users of one resource, in turn, on a sync pool thread.
+
+        PyDAL keeps one connection per thread; it is returned to the pool
+        once the syncs finish. Users not yet started at shutdown are skipped.
+
+        Args:
+            rows: Joined rows as selected by sync_pending_users
+
+        Returns:
+            (resource_user_id, outcome) per row, where outcome is the result
+            of sync_user or _SKIPPED at shutdown
+        """
+        try:
+            return [
+                (row.resource_users.id,
+                 self.sync_user(row) if self.running else _SKIPPED)
+                for row in rows
+            ]
+        finally:
+            self.db._adapter.close(action='rollback', really=False)
+
+    def sync_user(self, row) -> Optional[str]:
         """
         Sync a single user to its resource.
 
+        The caller records the resulting sync_status; see
+        _record_sync_results.
+
         Args:
-            resource_user_id: ID of the resource_user record to sync
+            row: Joined row with resource_users, resources and resource_types
+                 parts, as selected by sync_pending_users
+
+        Returns:
+            None if the user was synced, else the message for sync_error
 
         Process:
-        1. Load resource_user, resource, and resource_type
+        1. Check the joined resource and resource_type exist
         2. Determine appropriate connector based on resource_type
         3. Initialize connector with connection info and credentials
         4. Call connector.create_user() or update_user()
-        5. Update sync_status and timestamps on success
-        6. On failure, update sync_status and sync_error
+        5. Report success, or the sync_error message on failure
         """
-        try:
-            # Load resource_user record
-            resource_user = self.db.resource_users[resource_user_id]
-            if not resource_user:
-                logger.warning(f"Resource user {resource_user_id} not found")
-                return
+        resource_user = row.resource_users
+        resource_user_id = resource_user.id
 
+        try:
             logger.info(
                 f"Syncing user {resource_user.username} "
                 f"(resource_user_id: {resource_user_id})"
             )
 
-            # Update sync_status to 'syncing'
-            resource_user.update_record(sync_status='syncing')
-            self.db.commit()
-
-            # Load resource
-            resource = self.db.resources[resource_user.resource_id]
-            if not resource:
+            # Left joins leave a missing resource or type with a null id/name
+            resource = row.resources
+            if resource.id is None:
                 raise ValueError(
                     f"Resource {resource_user.resource_id} not found"
                 )
 
-            # Load resource_type
-            resource_type = self.db.resource_types[resource.resource_type_id]
-            if not resource_type:
+            resource_type = row.resource_types
+            if resource_type.name is None:
                 raise ValueError(
                     f"Resource type {resource.resource_type_id} not found"
                 )
 
             # Get connector for this resource type
-            connector = self._get_connector(
-                resource_type.name,
-                resource.connection_info,
-                resource.credentials
-            )
+            connector = self._get_connector(resource, resource_type.name)
 
             if not connector:
                 raise ValueError(
@@ -225,40 +459,33 @@ class UserSyncWorker:
                 )
                 connector.create_user(user_data)
 
-            # Mark as synced
-            resource_user.update_record(
-                sync_status='synced',
-                last_synced_at=datetime.utcnow(),
-                sync_error=None
-            )
-            self.db.commit()
-
             logger.info(
                 f"Successfully synced user {resource_user.username} "
                 f"to resource {resource.name}"
             )
+            return None
 
         except ConnectionError as e:
-            self._handle_sync_error(
-                resource_user_id,
+            return self._handle_sync_error(
+                resource_user,
                 f"Connection error: {str(e)}",
                 "Connection failed - will retry"
             )
         except ValueError as e:
-            self._handle_sync_error(
-                resource_user_id,
+            return self._handle_sync_error(
+                resource_user,
                 f"Configuration error: {str(e)}",
                 "Invalid configuration - requires manual review"
             )
         except PermissionError as e:
-            self._handle_sync_error(
-                resource_user_id,
+            return self._handle_sync_error(
+                resource_user,
                 f"Authentication error: {str(e)}",
                 "Authentication failed - check credentials"
             )
         except Exception as e:
-            self._handle_sync_error(
-                resource_user_id,
+            return self._handle_sync_error(
+                resource_user,
                 f"Sync failed: {str(e)}",
                 "Unexpected error occurred - check logs"
             )
@@ -304,11 +531,7 @@ class UserSyncWorker:
                 )
 
             # Get connector for this resource type
-            connector = self._get_connector(
-                resource_type.name,
-                resource.connection_info,
-                resource.credentials
-            )
+            connector = self._get_connector(resource, resource_type.name)
 
             if not connector:
                 raise ValueError(
@@ -347,14 +570,70 @@ class UserSyncWorker:
             )
             raise
 
-    def _get_connector(
+    def _get_connector(self, resource, resource_type_name: str):
+        """
+        Get the connector for a resource, reusing a cached one when possible.
+
+        A cached connector is reused until CONNECTOR_CACHE_TTL expires or the
+        resource's connection_info or credentials change.
+
+        Args:
+            resource: Resource record with id, connection_info and credentials
+            resource_type_name: Name of the resource type (e.g., 'db-postgresql')
+
+        Returns:
+            Initialized connector instance or None if no connector available
+        """
+        config = (resource.connection_info, resource.credentials)
+        with self._connector_lock:
+            cached = self._connector_cache.pop(resource.id, None)
+        if cached is not None:
+            connector, expires_at, cached_config = cached
+            if expires_at > time.monotonic() and cached_config == config:
+                with self._connector_lock:
+                    self._connector_cache[resource.id] = cached
+                return connector
+            self._close_connector(connector)
+
+        connector = self._create_connector(resource_type_name, *config)
+        if connector is not None:
+            with self._connector_lock:
+                self._connector_cache[resource.id] = (
+                    connector, time.monotonic() + CONNECTOR_CACHE_TTL, config
+                )
+        return connector
+
+    def close_all(self):
+        """Close and forget all cached connectors."""
+        with self._connector_lock:
+            cached = list(self._connector_cache.values())
+            self._connector_cache.clear()
+        for connector, _, _ in cached:
+            self._close_connector(connector)
+
+    def _close_connector(self, connector):
+        """
+        Close a connector, for connector types that hold connections.
+
+        Args:
+            connector: Connector instance
+        """
+        close = getattr(connector, 'close', None)
+        if close is None:
+            return
+        try:
+            close()
+        except Exception as e:
+            logger.warning(f"Error closing connector: {e}")
+
+    def _create_connector(
         self,
         resource_type_name: str,
         connection_info: Optional[Dict[str, Any]],
         credentials: Optional[Dict[str, Any]]
     ):
         """
-        Get the appropriate connector for a resource type.
+        Create the appropriate connector for a resource type.
 
         Args:
             resource_type_name: Name of the resource type (e.g., 'db-postgresql')
@@ -364,13 +643,7 @@ class UserSyncWorker:
         Returns:
             Initialized connector instance or None if no connector available
 
-        Supported resource types:
-        - db-postgresql: PostgreSQL databases
-        - db-mariadb: MariaDB databases
-        - db-redis: Redis cache/data stores
-        - db-valkey: Valkey (Redis-compatible) stores
-        - storage-ceph: Ceph storage
-        - storage-san: SAN storage
+        Supported resource types are the keys of _CONNECTORS.
         """
         if not connection_info or not credentials:
             logger.error(
@@ -378,28 +651,15 @@ class UserSyncWorker:
             )
             return None
 
-        try:
-            if resource_type_name == 'db-postgresql':
-                return PostgreSQLConnector(connection_info, credentials)
-
-            elif resource_type_name == 'db-mariadb':
-                return MariaDBConnector(connection_info, credentials)
-
-            elif resource_type_name in ('db-redis', 'db-valkey'):
-                return RedisConnector(connection_info, credentials)
-
-            elif resource_type_name == 'storage-ceph':
-                return CephConnector(connection_info, credentials)
-
-            elif resource_type_name == 'storage-san':
-                return SANConnector(connection_info, credentials)
-
-            else:
-                logger.error(
-                    f"Unknown resource type: {resource_type_name}"
-                )
-                return None
+        connector_class = _CONNECTORS.get(resource_type_name)
+        if connector_class is None:
+            logger.error(
+                f"Unknown resource type: {resource_type_name}"
+            )
+            return None
 
+        try:
+            return connector_class(connection_info, credentials)
         except Exception as e:
             logger.error(
                 f"Error initializing connector for {resource_type_name}: {e}",
@@ -409,34 +669,90 @@ class UserSyncWorker:
 
     def _handle_sync_error(
         self,
-        resource_user_id: int,
+        resource_user,
         error_message: str,
         user_message: str
-    ):
+    ) -> str:
         """
-        Handle synchronization errors and update database.
+        Log a synchronization error.
 
         Args:
-            resource_user_id: ID of the resource_user record
+            resource_user: resource_users row that failed to sync
             error_message: Detailed error message for logging
             user_message: User-friendly message for sync_error field
+
+        Returns:
+            user_message, to be recorded in sync_error
+        """
+        logger.error(
+            f"Sync error for user {resource_user.username}: "
+            f"{error_message}"
+        )
+        return user_message
+
+    def _utc_now(self, offset_seconds: int = 0) -> Expression:
         """
+        Get the database clock's current UTC time as a SQL expression.
+
+        Args:
+            offset_seconds: Seconds added to the current time
+
+        Returns:
+            PyDAL Expression for the dialect of the connected database
+        """
+        if self.db._adapter.dbengine == 'postgres':
+            sql = "NOW() AT TIME ZONE 'UTC'"
+            if offset_seconds:
+                sql += f" + INTERVAL '{int(offset_seconds)} seconds'"
+        elif offset_seconds:
+            # SQLite, the only other backend the manager runs on
+            sql = f"DATETIME('now', '{int(offset_seconds):+d} seconds')"
+        else:
+            sql = "CURRENT_TIMESTAMP"
+        return Expression(self.db, sql)
+
+    def _record_sync_results(
+        self,
+        synced_ids: List[int],
+        skipped_ids: List[int],
+        errors: Dict[int, str]
+    ):
+        """
+        Record the sync_status of a synced batch with one update per outcome.
+
+        Args:
+            synced_ids: IDs of users synced successfully
+            skipped_ids: IDs of users skipped at shutdown, returned to pending
+            errors: sync_error message by ID of users that failed
+        """
+        resource_users = self.db.resource_users
         try:
-            resource_user = self.db.resource_users[resource_user_id]
-            if resource_user:
-                resource_user.update_record(
-                    sync_status='error',
-                    sync_error=user_message
+            if synced_ids:
+                self.db(resource_users.id.belongs(synced_ids)).update(
+                    sync_status='synced',
+                    last_synced_at=self._utc_now(),
+                    sync_error=None
+                )
+            if skipped_ids:
+                self.db(resource_users.id.belongs(skipped_ids)).update(
+                    sync_status='pending'
                 )
-                self.db.commit()
 
-                logger.error(
-                    f"Sync error for user {resource_user.username}: "
-                    f"{error_message}"
+            # Users failing with the same message share one update
+            by_message = {}
+            for resource_user_id, message in errors.items():
+                by_message.setdefault(message, []).append(resource_user_id)
+            for message, ids in by_message.items():
+                self.db(resource_users.id.belongs(ids)).update(
+                    sync_status='error',
+                    sync_error=message
                 )
+
+            self.db.commit()
         except Exception as e:
+            self.db.rollback()
             logger.error(
-                f"Error updating sync_error for user {resource_user_id}: {e}",
+                f"Error recording sync results: {e}",
                 exc_info=True
             )
 
@@ -448,11 +764,13 @@ def main():
     Reads configuration from environment variables:
     - SYNC_INTERVAL: Sleep interval between sync cycles (default: 30 seconds)
     - BATCH_SIZE: Maximum users to sync per cycle (default: 10)
+    - MAX_WORKERS: Maximum users synced concurrently (default: 4)
     - LOG_LEVEL: Logging level (default: INFO)
     """
     # Get configuration from environment variables
     sync_interval = int(os.getenv('SYNC_INTERVAL', '30'))
     batch_size = int(os.getenv('BATCH_SIZE', '10'))
+    max_workers = int(os.getenv('MAX_WORKERS', '4'))
     log_level = os.getenv('LOG_LEVEL', 'INFO')
 
     # Configure logging level
@@ -464,6 +782,7 @@ def main():
     logger.info(f"Configuration:")
     logger.info(f"  Sync Interval: {sync_interval}s")
     logger.info(f"  Batch Size: {batch_size}")
+    logger.info(f"  Max Workers: {max_workers}")
     logger.info(f"  Log Level: {log_level}")
     logger.info("=" * 70)
 
@@ -471,7 +790,8 @@ def main():
     try:
         worker = UserSyncWorker(
             sleep_interval=sync_interval,
-            batch_size=batch_size
+            batch_size=batch_size,
+            max_workers=max_workers
         )
         worker.run()
     except Exception as e:
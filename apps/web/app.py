@@ -4,7 +4,10 @@ py4web application with license integration
 
 import os
 import sys
+import time
 import logging
+import threading
+from datetime import datetime, timezone
 from py4web import action, request, response, DAL, Field, redirect, URL
 from py4web.utils.cors import CORS
 from py4web.utils.auth import Auth
@@ -12,6 +15,11 @@ from py4web.utils.mailer import Mailer
 from py4web.utils.form import Form, FormStyleBulma
 from pydal.validators import IS_NOT_EMPTY, IS_EMAIL, IS_IN_SET
 
+try:
+    import redis
+except ImportError:
+    redis = None
+
 # Add shared modules to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
@@ -27,10 +35,23 @@ logger = logging.getLogger(__name__)
 # Database configuration
 DB_URI = os.getenv("DATABASE_URL", "sqlite://storage.db")
 
+# Pooled connections per process; every request thread checks one out, so
+# the default leaves headroom over the server's worker threads
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", str(max(20, 2 * (os.cpu_count() or 1)))))
+
+# TCP keepalives stop idle pooled PostgreSQL connections from being dropped
+# by firewalls and load balancers between requests
+DB_DRIVER_ARGS = (
+    {'keepalives': 1, 'keepalives_idle': 60, 'keepalives_interval': 10, 'keepalives_count': 5}
+    if DB_URI.startswith('postgres')
+    else {}
+)
+
 # Initialize database
 db = DAL(
     DB_URI,
-    pool_size=10,
+    pool_size=DB_POOL_SIZE,
+    driver_args=DB_DRIVER_ARGS,
     migrate=True,
     fake_migrate=False,
     check_reserved=['all']
@@ -56,6 +77,14 @@ db.define_table(
     Field('last_used', 'datetime', default=request.now),
 )
 
+# Feature usage counters are kept in Redis when REDIS_URL is set and flushed
+# to license_usage every USAGE_FLUSH_INTERVAL seconds
+REDIS_URL = os.getenv("REDIS_URL")
+USAGE_FLUSH_INTERVAL = int(os.getenv("USAGE_FLUSH_INTERVAL", "60"))
+# Seconds one process may hold the flush lock
+USAGE_FLUSH_LOCK_TIMEOUT = 300
+usage_redis = redis.Redis.from_url(REDIS_URL) if redis and REDIS_URL else None
+
 # Initialize authentication
 auth = Auth(db, session=session)
 
@@ -79,32 +108,134 @@ except LicenseValidationError as e:
 
 # Helper functions
 def track_feature_usage(feature_name: str):
-    """Track feature usage for analytics."""
+    """Track feature usage for analytics.
+
+    Counts go to Redis when configured and are flushed to license_usage in
+    the background; otherwise they are written directly.
+    """
     if not auth.user:
         return
 
     user_id = auth.user['id']
 
-    # Check if record exists
-    existing = db((db.license_usage.feature_name == feature_name) &
-                  (db.license_usage.user_id == user_id)).select().first()
+    if usage_redis is not None:
+        try:
+            usage_redis.pipeline(transaction=False) \
+                .hincrby(f'usage:{user_id}', feature_name, 1) \
+                .hset(f'usage_last:{user_id}', feature_name, int(time.time())) \
+                .execute()
+            return
+        except redis.RedisError as e:
+            logger.warning(f"Redis unavailable for usage tracking: {e}")
+
+    _add_feature_usage(user_id, feature_name, 1, request.now)
+    db.commit()
 
-    if existing:
-        # Update existing record
-        existing.update_record(
-            usage_count=existing.usage_count + 1,
-            last_used=request.now
-        )
-    else:
-        # Create new record
+
+def _add_feature_usage(user_id, feature_name, count, last_used):
+    """Add to a user's license_usage count for a feature, creating the row."""
+    updated = db((db.license_usage.feature_name == feature_name) &
+                 (db.license_usage.user_id == user_id)).update(
+        usage_count=db.license_usage.usage_count + count,
+        last_used=last_used
+    )
+    if not updated:
         db.license_usage.insert(
             feature_name=feature_name,
             user_id=user_id,
-            usage_count=1,
-            last_used=request.now
+            usage_count=count,
+            last_used=last_used
         )
 
-    db.commit()
+
+def flush_feature_usage():
+    """Move feature usage counts from Redis into license_usage.
+
+    Each user's counters are renamed to a usage_flushing: key before they
+    are read, so hits arriving during the flush start a fresh counter. The
+    flushing keys are deleted only after the commit; a failed flush leaves
+    them to be written by the next one. One process flushes at a time.
+
+    Returns:
+        Number of (user, feature) counts flushed
+    """
+    lock = usage_redis.lock('usage_flush_lock', timeout=USAGE_FLUSH_LOCK_TIMEOUT)
+    if not lock.acquire(blocking=False):
+        return 0
+
+    try:
+        for key in usage_redis.scan_iter(match='usage:*'):
+            user_id = key.decode().split(':', 1)[1]
+            # A flushing key left by a failed flush is written first; these
+            # counts wait for the next flush
+            try:
+                usage_redis.renamenx(key, f'usage_flushing:{user_id}')
+            except redis.ResponseError:
+                # The key was removed after the scan returned it
+                continue
+
+        flushed = 0
+        written = []
+        for key in usage_redis.scan_iter(match='usage_flushing:*'):
+            user_id = int(key.decode().split(':', 1)[1])
+            counts, last_used = usage_redis.pipeline(transaction=False) \
+                .hgetall(key) \
+                .hgetall(f'usage_last:{user_id}') \
+                .execute()
+            for feature, count in counts.items():
+                stamp = last_used.get(feature)
+                # Naive UTC, as PyDAL stores datetime columns
+                used_at = datetime.fromtimestamp(
+                    int(stamp) if stamp else time.time(), timezone.utc
+                ).replace(tzinfo=None)
+                _add_feature_usage(user_id, feature.decode(), int(count), used_at)
+                flushed += 1
+            written.append(key)
+
+        db.commit()
+        if written:
+            usage_redis.delete(*written)
+        return flushed
+    finally:
+        try:
+            lock.release()
+        except redis.exceptions.LockError:
+            logger.warning("Feature usage flush outlived its lock")
+
+
+def _usage_flush_loop():
+    """Flush feature usage counts every USAGE_FLUSH_INTERVAL seconds."""
+    while True:
+        time.sleep(USAGE_FLUSH_INTERVAL)
+        try:
+            flush_feature_usage()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to flush feature usage: {e}")
+
+
+# Seconds license information and features are cached between backend calls
+LICENSE_CACHE_TTL = int(os.getenv("LICENSE_CACHE_TTL", "60"))
+_license_cache = {}
+_license_cache_lock = threading.Lock()
+
+
+def _cached_license_call(name, fetch):
+    """Return a cached licensing result, calling fetch() once it expires.
+
+    Results of None are not cached so a failed lookup is retried.
+    """
+    now = time.monotonic()
+    with _license_cache_lock:
+        cached = _license_cache.get(name)
+    if cached is not None and now < cached[1]:
+        return cached[0]
+
+    value = fetch()
+    if value is not None:
+        with _license_cache_lock:
+            _license_cache[name] = (value, now + LICENSE_CACHE_TTL)
+    return value
 
 
 def get_license_info():
@@ -113,10 +244,47 @@ def get_license_info():
     if not client:
         return None
 
+    def validate():
+        try:
+            return client.validate()
+        except LicenseValidationError:
+            return None
+
+    return _cached_license_call('info', validate)
+
+
+def get_license_features():
+    """Get the feature entitlement map of the current license."""
+    client = get_client()
+    if not client:
+        return {}
+
+    return _cached_license_call('features', client.get_all_features) or {}
+
+
+# Users listed per page on the admin and enterprise pages
+USERS_PAGE_SIZE = 50
+
+
+def _users_page():
+    """Select the page of users named by the ``page`` query parameter.
+
+    Returns:
+        Tuple of (users, page, has_more), newest users first
+    """
     try:
-        return client.validate()
-    except LicenseValidationError:
-        return None
+        page = max(0, int(request.query.get('page', 0)))
+    except (TypeError, ValueError):
+        page = 0
+
+    # One extra row tells whether a next page exists without a count
+    offset = page * USERS_PAGE_SIZE
+    users = db(db.users).select(
+        limitby=(offset, offset + USERS_PAGE_SIZE + 1),
+        orderby=~db.users.id,
+    )
+    has_more = len(users) > USERS_PAGE_SIZE
+    return users[:USERS_PAGE_SIZE], page, has_more
 
 
 # Routes
@@ -129,9 +297,7 @@ def index():
 
     if license_info:
         # Get available features
-        client = get_client()
-        if client:
-            features = client.get_all_features()
+        features = get_license_features()
 
     return dict(
         user=auth.user,
@@ -180,7 +346,7 @@ def api_features():
         response.status = 500
         return dict(error="License client not available")
 
-    features = client.get_all_features()
+    features = get_license_features()
     return dict(features=features)
 
 
@@ -194,21 +360,21 @@ def analytics():
     # Get usage statistics
     usage_stats = db(db.license_usage.user_id == auth.user['id']).select()
 
+    # Usage by feature, summed over the rows the page already shows
+    usage_by_feature = {}
+    for stat in usage_stats:
+        usage_by_feature[stat.feature_name] = (
+            usage_by_feature.get(stat.feature_name, 0) + stat.usage_count
+        )
+
     # Generate some mock analytics data
     analytics_data = {
         'total_users': db(db.users).count(),
-        'active_features': len([f for f in get_client().get_all_features().values() if f]),
-        'usage_by_feature': {},
+        'active_features': sum(1 for enabled in get_license_features().values() if enabled),
+        'usage_by_feature': usage_by_feature,
         'user_usage': usage_stats
     }
 
-    # Calculate usage by feature
-    for stat in usage_stats:
-        feature = stat.feature_name
-        if feature not in analytics_data['usage_by_feature']:
-            analytics_data['usage_by_feature'][feature] = 0
-        analytics_data['usage_by_feature'][feature] += stat.usage_count
-
     return dict(
         analytics=analytics_data,
         user=auth.user
@@ -222,8 +388,8 @@ def enterprise():
     """Enterprise features page."""
     track_feature_usage('enterprise_features')
 
-    # Get all users (enterprise feature)
-    users = db(db.users).select()
+    # Get a page of users (enterprise feature)
+    users, page, has_more = _users_page()
 
     # Get system-wide usage statistics
     usage_stats = db().select(
@@ -234,6 +400,8 @@ def enterprise():
 
     return dict(
         users=users,
+        page=page,
+        has_more=has_more,
         usage_stats=usage_stats,
         user=auth.user
     )
@@ -246,20 +414,29 @@ def admin():
     if not auth.user or auth.user.get('role') != 'admin':
         redirect(URL('index'))
 
-    # Get all users and system stats
-    users = db(db.users).select()
+    # Get a page of users and system stats
+    users, page, has_more = _users_page()
     license_info = get_license_info()
 
+    # Total and active users in one grouped count
+    count = db.users.id.count()
+    users_by_active = {
+        row.users.is_active: row[count]
+        for row in db().select(db.users.is_active, count, groupby=db.users.is_active)
+    }
+
     # System statistics
     stats = {
-        'total_users': db(db.users).count(),
-        'active_users': db(db.users.is_active == True).count(),
+        'total_users': sum(users_by_active.values()),
+        'active_users': users_by_active.get(True, 0),
         'total_feature_usage': db(db.license_usage).count(),
         'license_tier': license_info.get('tier') if license_info else 'Unknown'
     }
 
     return dict(
         users=users,
+        page=page,
+        has_more=has_more,
         stats=stats,
         license_info=license_info,
         user=auth.user
@@ -326,4 +503,7 @@ def _startup():
 
 
 # Run startup tasks
-_startup()
\ No newline at end of file
+_startup()
+
+if usage_redis is not None:
+    threading.Thread(target=_usage_flush_loop, name='usage-flush', daemon=True).start()
\ No newline at end of file